@@ -2,10 +2,10 @@ from app.app_context import services
 from app.helper import database
 from rocket import (
     BuildContext,
+    PersistentSignal,
     RButton,
     REntry,
     Row,
-    Signal,
     StatefulComponent,
     WidgetSpec,
 )
@@ -14,7 +14,8 @@ from rocket import (
 class _TaskEntry(StatefulComponent):
     def __init__(self, props=None):
         super().__init__(props=props)
-        self.text_signal = Signal("")
+        # The unsent draft survives a restart.
+        self.text_signal = PersistentSignal("task_entry.draft", "")
 
     def build(self, context: BuildContext) -> WidgetSpec:
         return Row(
@@ -33,7 +34,7 @@ class _TaskEntry(StatefulComponent):
                     width=80,
                     height=32,
                     corner_radius=6,
-                    font=("Helvetica", 11),
+                    font="button",
                     side="right",
                 ),
             ],
@@ -15,7 +15,7 @@ class _Header(StatefulComponent):
             children=[
                 RLabel(
                     text="To-do List",
-                    font=("Helvetica", 16, "bold"),
+                    font="title",
                     side="left",
                 ),
                 RSwitch(
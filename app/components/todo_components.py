@@ -5,10 +5,10 @@ from rocket import (
     RButton,
     RCheckbox,
     RLabel,
+    Resource,
     Row,
     ScrollableColumn,
     Signal,
-    StatefulComponent,
     StatelessComponent,
     WidgetSpec,
 )
@@ -42,6 +42,8 @@ class _TaskItem(StatelessComponent):
 
     def _update_status(self, is_done: bool):
         database.update_task_status(self.props["task"], is_done)
+        # The list caches rows per store version.
+        services.notify_task_change()
 
     def _delete_task(self):
         database.delete_task(self.props["task"])
@@ -54,29 +56,32 @@ def TaskItem(task: str, status: bool, **kwargs) -> WidgetSpec:
     )
 
 
-class _TodoList(StatefulComponent):
-    def __init__(self, props=None):
-        super().__init__(props=props)
-        # Subscribe to todo store changes
-        self.register_signal(services.todo_store)
-
+class _TodoList(StatelessComponent):
     def build(self, context: BuildContext) -> WidgetSpec:
-        tasks = database.get_all_tasks()
+        # Rebuilt on its own whenever the provided todo store changes.
+        # The query runs off the Tk thread; the previous rows stay up
+        # until it returns, and other rebuilds reuse them.
+        version = context.use("todos")
+        tasks = Resource(database.get_all_tasks, (version,))
+        rows = self.memo(
+            lambda: [TaskItem(task=t[0], status=t[1]) for t in tasks.value or ()],
+            (tasks.value,),
+        )
 
         childers = []
 
-        if not tasks:
+        if not rows and tasks.ready:
             childers = [
                 RLabel(
                     text="No tasks here, why not add one?",
-                    font=("Helvetica", 12, "italic"),
+                    font="caption",
                     text_color=context.theme.get_color("text_dim"),
                     # Center the label in the expanded column
                     expand=self.props.get("expand", False),
                 )
             ]
         else:
-            childers = [TaskItem(task=t[0], status=t[1]) for t in tasks]
+            childers = rows
 
         return ScrollableColumn(
             spacing=5,
@@ -1,9 +1,9 @@
 from app.homepages import Homepage
-from rocket.runtime.window_manager import WindowManager
+from rocket.runtime.window_manager import window_manager
 
 
 def main():
-    window = WindowManager().get_runtime()
+    window = window_manager.get_runtime()
     page = Homepage(window)
     page.render()
     window.mainloop()
@@ -1,57 +1,110 @@
-# Core
-from rocket.core.component import (
-    Component,
-    StatefulComponent,
-    StatelessComponent,
-)
-from rocket.core.context import BuildContext
-from rocket.core.state import Signal
-from rocket.core.widget import WidgetSpec
-
-# Elements
-from rocket.elements.components import (
-    RButton,
-    RCheckbox,
-    REntry,
-    RLabel,
-    RSwitch,
-)
-from rocket.elements.containers import RDiv
-from rocket.layout.layout import Column, Row, ScrollableColumn, ScrollableRow
-
-# Pages
-from rocket.pages.page import BasePage
-
-# Rendering
-from rocket.render.renderer import Renderer
-
-# Theme
-from rocket.theme.manager import ThemeManager
-
-__all__ = [
+"""
+Rocket UI framework.
+
+The public API is resolved lazily (PEP 562): `import rocket` is cheap, and
+the element, layout and rendering modules - and with them customtkinter -
+are only imported when one of their names is first accessed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Core
+    from rocket.core.component import (
+        Component,
+        StatefulComponent,
+        StatelessComponent,
+    )
+    from rocket.core.context import BuildContext
+    from rocket.core.persistence import PersistentSignal
+    from rocket.core.resource import Resource
+    from rocket.core.state import Signal
+    from rocket.core.widget import WidgetSpec
+
+    # Elements
+    from rocket.elements.components import (
+        RButton,
+        RCheckbox,
+        REntry,
+        RImage,
+        RLabel,
+        RSwitch,
+    )
+    from rocket.elements.containers import Provider, RDiv
+    from rocket.elements.lists import RCanvasList
+    from rocket.elements.table import Table
+    from rocket.layout.layout import Column, Row, ScrollableColumn, ScrollableRow
+
+    # Pages
+    from rocket.pages.page import BasePage
+
+    # Rendering
+    from rocket.render.renderer import Renderer
+
+    # Runtime
+    from rocket.runtime.animation import spring, tween
+
+    # Theme
+    from rocket.theme.manager import ThemeManager
+
+    # Data
+    from rocket.utils.columnar import TableData
+
+# Public name -> defining module
+_LAZY_ATTRS: dict[str, str] = {
     # Core
-    "BuildContext",
-    "Component",
-    "StatefulComponent",
-    "StatelessComponent",
-    "WidgetSpec",
-    "Signal",
+    "BuildContext": "rocket.core.context",
+    "Component": "rocket.core.component",
+    "StatefulComponent": "rocket.core.component",
+    "StatelessComponent": "rocket.core.component",
+    "WidgetSpec": "rocket.core.widget",
+    "Signal": "rocket.core.state",
+    "PersistentSignal": "rocket.core.persistence",
+    "Resource": "rocket.core.resource",
     # Rendering
-    "Renderer",
+    "Renderer": "rocket.render.renderer",
+    # Runtime
+    "tween": "rocket.runtime.animation",
+    "spring": "rocket.runtime.animation",
     # Pages
-    "BasePage",
+    "BasePage": "rocket.pages.page",
     # Elements
-    "RButton",
-    "RCheckbox",
-    "RDiv",
-    "REntry",
-    "RLabel",
-    "RSwitch",
+    "RButton": "rocket.elements.components",
+    "RCanvasList": "rocket.elements.lists",
+    "RCheckbox": "rocket.elements.components",
+    "RDiv": "rocket.elements.containers",
+    "Provider": "rocket.elements.containers",
+    "REntry": "rocket.elements.components",
+    "RImage": "rocket.elements.components",
+    "RLabel": "rocket.elements.components",
+    "RSwitch": "rocket.elements.components",
+    "Table": "rocket.elements.table",
+    "TableData": "rocket.utils.columnar",
     # Theme
-    "ThemeManager",
+    "ThemeManager": "rocket.theme.manager",
     # layout
-    "Row",
-    "Column",
-    "ScrollableColumn",
-    "ScrollableRow",
-]
+    "Row": "rocket.layout.layout",
+    "Column": "rocket.layout.layout",
+    "ScrollableColumn": "rocket.layout.layout",
+    "ScrollableRow": "rocket.layout.layout",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'rocket' has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__ entirely.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,280 @@
+"""
+Content-hash fingerprints for incremental `rocket build`.
+
+A build is described by four digests:
+
+* ``app``         - `main.py` and every project module it imports
+* ``resources``   - the bundled resource directory
+* ``environment`` - interpreter, installed distributions and build options
+* ``backend``     - the packager that produced the artifact
+
+`plan_build` compares them against the manifest written by the previous
+build and decides whether the artifact can be reused as-is, rebuilt on
+top of the existing work directory, or rebuilt from scratch.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+MANIFEST_NAME = "build-manifest.json"
+
+
+class BuildAction(Enum):
+    REUSE = "reuse"
+    INCREMENTAL = "incremental"
+    CLEAN = "clean"
+
+
+@dataclass
+class Fingerprint:
+    app: str
+    resources: str
+    environment: str
+    backend: str
+    files: dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "app": self.app,
+            "resources": self.resources,
+            "environment": self.environment,
+            "backend": self.backend,
+            "files": self.files,
+        }
+
+
+@dataclass
+class BuildPlan:
+    action: BuildAction
+    reason: str
+    fingerprint: Fingerprint
+
+
+# ============================================================
+# Hashing
+# ============================================================
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _combine(items: Iterable[tuple[str, str]]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in sorted(items):
+        digest.update(key.encode())
+        digest.update(b"\0")
+        digest.update(value.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _resolve_module(name: str, root: Path) -> Optional[Path]:
+    base = root.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _package_of(path: Path, root: Path) -> list[str]:
+    # Both `pkg/__init__.py` and `pkg/mod.py` anchor relative imports at `pkg`.
+    return list(path.relative_to(root).parts[:-1])
+
+
+def app_modules(script: Path, root: Path) -> list[Path]:
+    """
+    Return `script` plus every module under `root` it imports, transitively.
+
+    Imports are found statically with `ast`; only names that resolve to a
+    file inside the project are followed, so third-party packages (and the
+    framework itself when installed) are covered by the environment digest.
+    """
+    root = root.resolve()
+    seen: dict[Path, None] = {}
+    queue = [script.resolve()]
+
+    while queue:
+        path = queue.pop()
+        if path in seen:
+            continue
+        seen[path] = None
+
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (OSError, SyntaxError):
+            continue
+
+        try:
+            package = _package_of(path, root)
+        except ValueError:
+            package = []
+
+        for node in ast.walk(tree):
+            names: list[str] = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    anchor = package[: len(package) - node.level + 1]
+                    base = ".".join(anchor + ([node.module] if node.module else []))
+                else:
+                    base = node.module or ""
+                names = [base] + [f"{base}.{alias.name}" for alias in node.names]
+
+            for name in names:
+                parts = name.strip(".").split(".")
+                # `import a.b.c` also executes `a` and `a.b`.
+                for i in range(1, len(parts) + 1):
+                    found = _resolve_module(".".join(parts[:i]), root)
+                    if found is not None and found not in seen:
+                        queue.append(found)
+
+    return sorted(seen)
+
+
+def _environment_digest(options: dict[str, Any]) -> str:
+    dists = []
+    for dist in metadata.distributions():
+        name = dist.metadata.get("Name")
+        if name:
+            dists.append((name.lower(), dist.version))
+
+    items = [
+        ("python", sys.version),
+        ("executable", sys.executable),
+        ("platform", platform.platform()),
+        ("options", json.dumps(options, sort_keys=True)),
+    ]
+    items.extend((f"dist:{name}", version) for name, version in dists)
+    return _combine(items)
+
+
+def fingerprint(
+    *,
+    script_path: Path,
+    resource_dir: Path,
+    backend: str,
+    options: dict[str, Any],
+    root: Optional[Path] = None,
+) -> Fingerprint:
+    root = (root or Path.cwd()).resolve()
+
+    files = {}
+    for path in app_modules(script_path, root):
+        try:
+            key = path.relative_to(root).as_posix()
+        except ValueError:
+            key = str(path)
+        files[key] = _hash_file(path)
+
+    resources = [
+        (path.relative_to(resource_dir).as_posix(), _hash_file(path))
+        for path in resource_dir.rglob("*")
+        if path.is_file()
+    ]
+
+    return Fingerprint(
+        app=_combine(files.items()),
+        resources=_combine(resources),
+        environment=_environment_digest(options),
+        backend=backend,
+        files=files,
+    )
+
+
+# ============================================================
+# Manifest
+# ============================================================
+
+
+def load_manifest(output_dir: Path) -> Optional[dict[str, Any]]:
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(
+    output_dir: Path,
+    plan: BuildPlan,
+    *,
+    artifact: Path,
+    seconds: float,
+) -> None:
+    manifest = {
+        "fingerprint": plan.fingerprint.to_json(),
+        "artifact": str(artifact),
+        "action": plan.action.value,
+        "reason": plan.reason,
+        "seconds": round(seconds, 3),
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    path = output_dir / MANIFEST_NAME
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _changed_files(old: dict[str, str], new: dict[str, str]) -> list[str]:
+    changed = [name for name, digest in new.items() if old.get(name) != digest]
+    changed.extend(name for name in old if name not in new)
+    return sorted(changed)
+
+
+def plan_build(
+    output_dir: Path,
+    current: Fingerprint,
+    *,
+    artifact: Path,
+    force: bool = False,
+) -> BuildPlan:
+    """Decide how much of the previous build in `output_dir` can be reused."""
+    if force:
+        return BuildPlan(BuildAction.CLEAN, "forced rebuild", current)
+
+    manifest = load_manifest(output_dir)
+    if manifest is None:
+        return BuildPlan(BuildAction.CLEAN, "no previous build manifest", current)
+
+    previous = manifest.get("fingerprint", {})
+
+    if previous.get("backend") != current.backend:
+        return BuildPlan(BuildAction.CLEAN, "build backend changed", current)
+    if previous.get("environment") != current.environment:
+        return BuildPlan(
+            BuildAction.CLEAN,
+            "interpreter, dependencies or build options changed",
+            current,
+        )
+
+    reasons = []
+    if previous.get("app") != current.app:
+        changed = _changed_files(previous.get("files", {}), current.files)
+        shown = ", ".join(changed[:5]) + (" ..." if len(changed) > 5 else "")
+        reasons.append(f"app code changed ({shown})")
+    if previous.get("resources") != current.resources:
+        reasons.append("resources changed")
+
+    if reasons:
+        return BuildPlan(BuildAction.INCREMENTAL, "; ".join(reasons), current)
+
+    if not artifact.exists():
+        return BuildPlan(BuildAction.INCREMENTAL, "previous artifact missing", current)
+
+    return BuildPlan(BuildAction.REUSE, "fingerprint unchanged", current)
@@ -9,16 +9,80 @@ from rocket.cli.core import create_executable, detect_os
 
 @click.command()
 @click.option("-o", "--onefile", is_flag=True, help="Build single-file executable")
-def build(onefile: bool) -> None:
+@click.option(
+    "-f", "--force", is_flag=True, help="Ignore the build cache and rebuild cleanly"
+)
+@click.option(
+    "-m",
+    "--matrix",
+    is_flag=True,
+    help="Build several variants concurrently and compare them",
+)
+@click.option(
+    "--variant",
+    "variants",
+    multiple=True,
+    help="Matrix variant such as pyinstaller-onefile or nuitka-onedir (repeatable)",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of variants built at once",
+)
+@click.option(
+    "--no-cold-start", is_flag=True, help="Skip launching artifacts to time startup"
+)
+def build(
+    onefile: bool,
+    force: bool,
+    matrix: bool,
+    variants: tuple[str, ...],
+    jobs: int | None,
+    no_cold_start: bool,
+) -> None:
     """Build application executable."""
     os_name = detect_os().value
 
-    create_executable(
+    if matrix or variants:
+        from rocket.cli.matrix import (
+            DEFAULT_MATRIX,
+            BuildVariant,
+            format_table,
+            run_matrix,
+        )
+
+        try:
+            selected = [BuildVariant.parse(v) for v in variants] or DEFAULT_MATRIX
+        except ValueError as exc:
+            raise click.BadParameter(str(exc), param_hint="--variant")
+
+        results = run_matrix(
+            selected,
+            script_path=Path("main.py"),
+            resource_dir=Path("resources/images"),
+            output_root=Path("build"),
+            jobs=jobs,
+            force=force,
+            cold_start=not no_cold_start,
+        )
+        click.echo(format_table(results))
+        return
+
+    result = create_executable(
         script_path=Path("main.py"),
         resource_dir=Path("resources/images"),
         output_root=Path("build"),
         onefile=onefile,
         windowed=True,
+        force=force,
     )
 
-    click.echo(f"Build completed successfully for {os_name}")
+    if result.action == "reuse":
+        click.echo(f"Build is up to date for {os_name}: {result.artifact}")
+    else:
+        click.echo(
+            f"Build completed successfully for {os_name} "
+            f"({result.action}: {result.reason}) in {result.seconds:.1f} s"
+        )
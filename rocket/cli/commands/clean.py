@@ -2,14 +2,27 @@ from __future__ import annotations
 
 import click
 
-from rocket.cli.core import cleanup
+from rocket.cli.core import DEFAULT_CLEAN_EXCLUDE, cleanup
 
 
 @click.command()
-def clean() -> None:
+@click.option(
+    "-n", "--dry-run", is_flag=True, help="Show what would be removed, remove nothing"
+)
+@click.option(
+    "-e",
+    "--exclude",
+    multiple=True,
+    help="Extra directory name to skip while walking (repeatable)",
+)
+def clean(dry_run: bool, exclude: tuple[str, ...]) -> None:
     """Clean build artifacts."""
-    cleanup(
+    summary = cleanup(
         files_to_remove=("main.spec",),
         dirs_to_remove=("__pycache__", "build", "dist"),
         file_extensions=(".pyc", ".spec"),
+        exclude_dirs=DEFAULT_CLEAN_EXCLUDE + exclude,
+        dry_run=dry_run,
     )
+
+    click.echo(summary)
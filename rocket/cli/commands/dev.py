@@ -6,6 +6,25 @@ from rocket.cli.core import hot_reload_app
 
 
 @click.command()
-def dev() -> None:
+@click.option(
+    "-i",
+    "--ignore",
+    multiple=True,
+    help="Extra glob to ignore when watching (repeatable)",
+)
+@click.option(
+    "--debounce",
+    default=300,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Milliseconds to batch file events before reloading",
+)
+@click.option(
+    "-f",
+    "--forkserver",
+    is_flag=True,
+    help="Fork the app from a warm, preloaded interpreter (Linux)",
+)
+def dev(ignore: tuple[str, ...], debounce: int, forkserver: bool) -> None:
     """Run with hot reload."""
-    hot_reload_app()
+    hot_reload_app(ignore=ignore, debounce=debounce / 1000, forkserver=forkserver)
@@ -8,15 +8,41 @@ from rocket.cli.core import cleanup, hot_reload_app, run_app
 @click.command()
 @click.option("-c", "--clean", is_flag=True, help="Clean before run")
 @click.option("-r", "--hotreload", is_flag=True, help="Enable hot reload")
-def run(clean: bool, hotreload: bool) -> None:
+@click.option(
+    "-i",
+    "--ignore",
+    multiple=True,
+    help="Extra glob to ignore when hot reloading (repeatable)",
+)
+@click.option(
+    "--debounce",
+    default=300,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Milliseconds to batch file events before reloading",
+)
+@click.option(
+    "-f",
+    "--forkserver",
+    is_flag=True,
+    help="Fork the app from a warm, preloaded interpreter (Linux)",
+)
+def run(
+    clean: bool,
+    hotreload: bool,
+    ignore: tuple[str, ...],
+    debounce: int,
+    forkserver: bool,
+) -> None:
     """Run the application."""
     if clean:
-        cleanup(
+        summary = cleanup(
             dirs_to_remove=("__pycache__", "build"),
             file_extensions=(".pyc",),
         )
+        click.echo(summary)
 
     if hotreload:
-        hot_reload_app()
+        hot_reload_app(ignore=ignore, debounce=debounce / 1000, forkserver=forkserver)
     else:
-        run_app()
+        run_app(forkserver=forkserver)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+PHASES = (
+    "interpreter",
+    "framework import",
+    "config load",
+    "app import",
+    "window creation",
+    "first render",
+    "first frame",
+)
+
+
+def _slowest_imports(importtime: str, limit: int) -> list[tuple[str, int]]:
+    """Top-level modules from `-X importtime` output, by cumulative time."""
+    entries = []
+    for line in importtime.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, _, rest = line.partition(":")
+        fields = rest.split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        if name.startswith("  "):
+            continue
+        entries.append((name.strip(), int(fields[1])))
+
+    entries.sort(key=lambda item: item[1], reverse=True)
+    return entries[:limit]
+
+
+@click.command(name="startup-report")
+@click.option(
+    "-s",
+    "--script",
+    default="main.py",
+    show_default=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="App entry point to measure",
+)
+@click.option(
+    "-n",
+    "--imports",
+    "import_count",
+    default=8,
+    show_default=True,
+    help="Number of slowest top-level imports to list",
+)
+def startup_report(script: str, import_count: int) -> None:
+    """Break down cold-start time of the application."""
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "startup.json"
+        spawned = time.time()
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-X",
+                "importtime",
+                "-m",
+                "rocket.cli.startup_probe",
+                script,
+                str(out_path),
+                repr(spawned),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        total = time.time() - spawned
+
+        try:
+            report = json.loads(out_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            click.echo(proc.stderr, err=True)
+            raise click.ClickException("startup probe did not produce a report")
+
+    phases = report["phases"]
+    width = max(len(name) for name in PHASES)
+
+    click.echo(f"Cold start of {script}")
+    for name in PHASES:
+        if name in phases:
+            click.echo(f"  {name.ljust(width)}  {phases[name] * 1000:8.1f} ms")
+        else:
+            click.echo(f"  {name.ljust(width)}  {'-':>8}")
+    click.echo(f"  {'total'.ljust(width)}  {total * 1000:8.1f} ms")
+
+    slowest = _slowest_imports(proc.stderr, import_count)
+    if slowest:
+        click.echo("\nSlowest top-level imports (cumulative)")
+        for name, micros in slowest:
+            click.echo(f"  {micros / 1000:8.1f} ms  {name}")
+
+    if report.get("error"):
+        click.echo(f"\nStartup stopped early: {report['error']}", err=True)
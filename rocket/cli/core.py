@@ -1,15 +1,26 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
 import os
 import platform
-import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Union
+
+if TYPE_CHECKING:
+    from watchdog.events import FileSystemEvent
+
+    from rocket.cli.forkserver import ForkedProcess
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+# Either a plain subprocess or a child forked by the fork server.
+AppProcess = Union["subprocess.Popen[bytes]", "ForkedProcess"]
 
 # ============================================================
 # Target OS detection
@@ -40,33 +51,296 @@ def detect_os() -> TargetOS:
 # ============================================================
 
 
-class ReloadHandler(FileSystemEventHandler):
-    def __init__(self, process: subprocess.Popen[str]) -> None:
-        self._process = process
+# Directory and file names never worth watching, on top of `.gitignore`.
+DEFAULT_WATCH_IGNORE: tuple[str, ...] = (
+    ".git",
+    ".venv",
+    "venv",
+    "__pycache__",
+    "build",
+    "dist",
+    "node_modules",
+    "*.egg-info",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+)
 
-    def on_modified(self, event: FileSystemEvent) -> None:
-        if event.is_directory or not event.src_path.endswith(".py"):
-            return
 
-        if self._process.poll() is None:
-            self._process.terminate()
+class IgnoreRules:
+    """
+    Minimal `.gitignore`-style matcher.
 
-        self._process = subprocess.Popen(
-            [sys.executable, "main.py"],
-            stdout=sys.stdout,
-            stderr=sys.stderr,
-        )
+    Patterns without a slash match any path component, patterns with a
+    slash are matched against the path relative to the root, and a
+    trailing slash restricts a pattern to directories. Negations are
+    not supported and are skipped.
+    """
+
+    def __init__(self, root: Path, patterns: Iterable[str] = ()) -> None:
+        self.root = root.resolve()
+        self._names: list[tuple[str, bool]] = []
+        self._paths: list[tuple[str, bool]] = []
+
+        for raw in patterns:
+            pattern = raw.strip()
+            if not pattern or pattern.startswith(("#", "!")):
+                continue
+
+            dir_only = pattern.endswith("/")
+            pattern = pattern.rstrip("/")
+
+            if "/" in pattern:
+                self._paths.append((pattern.lstrip("/"), dir_only))
+            else:
+                self._names.append((pattern, dir_only))
+
+    @classmethod
+    def from_project(cls, root: Path, extra: Iterable[str] = ()) -> "IgnoreRules":
+        patterns = list(DEFAULT_WATCH_IGNORE)
+
+        gitignore = root / ".gitignore"
+        if gitignore.is_file():
+            try:
+                patterns.extend(gitignore.read_text(encoding="utf-8").splitlines())
+            except OSError as exc:
+                print(f"Could not read {gitignore} ({exc})", file=sys.stderr)
+
+        patterns.extend(extra)
+        return cls(root, patterns)
+
+    def match(self, path: Path, is_dir: bool = False) -> bool:
+        try:
+            relative = path.resolve().relative_to(self.root)
+        except ValueError:
+            return True
+
+        parts = relative.parts
+        last = len(parts) - 1
+
+        for index, part in enumerate(parts):
+            part_is_dir = is_dir or index < last
+            prefix = "/".join(parts[: index + 1])
 
+            for pattern, dir_only in self._names:
+                if (part_is_dir or not dir_only) and fnmatch.fnmatch(part, pattern):
+                    return True
 
-def hot_reload_app(path: str = ".") -> None:
-    process = subprocess.Popen(
+            for pattern, dir_only in self._paths:
+                if (part_is_dir or not dir_only) and fnmatch.fnmatch(prefix, pattern):
+                    return True
+
+        return False
+
+
+def _file_digest(path: Path) -> Optional[bytes]:
+    try:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+    except OSError:
+        return None
+
+
+def _launch_app() -> subprocess.Popen[bytes]:
+    from rocket.cli.forkserver import LAUNCH_TIME_ENV
+
+    return subprocess.Popen(
         [sys.executable, "main.py"],
         stdout=sys.stdout,
         stderr=sys.stderr,
+        env={**os.environ, LAUNCH_TIME_ENV: repr(time.time())},
     )
 
+
+def _make_launcher(forkserver: bool) -> Callable[[], AppProcess]:
+    """Return the launch function for the requested mode."""
+    if not forkserver:
+        return _launch_app
+
+    from rocket.cli.forkserver import ForkServer, ForkServerError, is_supported
+
+    if not is_supported():
+        print(
+            "[rocket] Fork server is only available on Linux; using a new interpreter.",
+            file=sys.stderr,
+        )
+        return _launch_app
+
+    server = ForkServer()
+
+    def launch() -> AppProcess:
+        try:
+            process = server.launch()
+        except ForkServerError as exc:
+            print(f"[rocket] {exc}; using a new interpreter.", file=sys.stderr)
+            return _launch_app()
+
+        print(
+            f"[rocket] Forked app from warm interpreter in {process.latency * 1000:.1f} ms",
+            file=sys.stderr,
+        )
+        return process
+
+    return launch
+
+
+class ReloadHandler:
+    """
+    Restarts the app once per burst of source changes.
+
+    Events are collected for `debounce` seconds after the last one, files
+    whose content hash did not change are dropped, and paths matched by
+    the ignore rules are never considered.
+
+    Implements watchdog's handler interface (`dispatch`) without
+    subclassing it, so importing this module does not import watchdog.
+    """
+
+    def __init__(
+        self,
+        process: AppProcess,
+        *,
+        ignore: IgnoreRules,
+        debounce: float = 0.3,
+        launch: Callable[[], AppProcess] = _launch_app,
+    ) -> None:
+        self.process = process
+        self._ignore = ignore
+        self._debounce = debounce
+        self._launch = launch
+
+        self._lock = threading.Lock()
+        # Held for a whole flush: a timer started during a restart waits
+        # for it instead of terminating/launching concurrently.
+        self._restart_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._pending: set[Path] = set()
+        self._first_seen: Optional[float] = None
+        self._digests: dict[Path, Optional[bytes]] = {}
+
+    def prime(self, paths: Iterable[Path]) -> None:
+        """Record current content hashes so no-op saves are skipped."""
+        for path in paths:
+            self._digests[path] = _file_digest(path)
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        if event.is_directory or event.event_type not in (
+            "modified",
+            "created",
+            "moved",
+            "deleted",
+        ):
+            return
+
+        candidates = [event.src_path]
+        dest = getattr(event, "dest_path", "")
+        if dest:
+            candidates.append(dest)
+
+        for raw in candidates:
+            path = Path(os.fsdecode(raw)).resolve()
+            if path.suffix != ".py" or self._ignore.match(path):
+                continue
+            self._queue(path)
+
+    def _queue(self, path: Path) -> None:
+        with self._lock:
+            if self._first_seen is None:
+                self._first_seen = time.perf_counter()
+            self._pending.add(path)
+
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._debounce, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._restart_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            first_seen, self._first_seen = self._first_seen, None
+            self._timer = None
+
+        changed = []
+        for path in pending:
+            digest = _file_digest(path)
+            if path in self._digests and self._digests[path] == digest:
+                continue
+            self._digests[path] = digest
+            changed.append(path)
+
+        if not changed:
+            return
+
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+        self.process = self._launch()
+
+        elapsed = (time.perf_counter() - (first_seen or time.perf_counter())) * 1000
+        names = ", ".join(sorted(p.name for p in changed))
+        print(
+            f"[rocket] Reloaded in {elapsed:.0f} ms ({len(changed)} changed: {names})",
+            file=sys.stderr,
+        )
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+def _iter_watch_roots(root: Path, ignore: IgnoreRules) -> Iterable[Path]:
+    """Yield top-level directories to watch recursively, skipping ignored ones."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and not ignore.match(
+                Path(entry.path), is_dir=True
+            ):
+                yield Path(entry.path)
+
+
+def _iter_sources(root: Path, ignore: IgnoreRules) -> Iterable[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        base = Path(dirpath)
+        dirnames[:] = [d for d in dirnames if not ignore.match(base / d, is_dir=True)]
+        for name in filenames:
+            path = base / name
+            if name.endswith(".py") and not ignore.match(path):
+                yield path.resolve()
+
+
+def hot_reload_app(
+    path: str = ".",
+    *,
+    ignore: Iterable[str] = (),
+    debounce: float = 0.3,
+    forkserver: bool = False,
+) -> None:
+    from watchdog.observers import Observer
+
+    root = Path(path).resolve()
+    rules = IgnoreRules.from_project(root, ignore)
+
+    launch = _make_launcher(forkserver)
+    process = launch()
+    handler = ReloadHandler(process, ignore=rules, debounce=debounce, launch=launch)
+    handler.prime(_iter_sources(root, rules))
+
+    # Watch the root shallowly and each non-ignored subtree recursively so
+    # ignored trees such as `.venv` or `build/` are never traversed.
     observer = Observer()
-    observer.schedule(ReloadHandler(process), path=path, recursive=True)
+    observer.schedule(handler, path=str(root), recursive=False)
+    for subdir in _iter_watch_roots(root, rules):
+        observer.schedule(handler, path=str(subdir), recursive=True)
     observer.start()
 
     try:
@@ -74,21 +348,18 @@ def hot_reload_app(path: str = ".") -> None:
             time.sleep(1)
     except KeyboardInterrupt:
         observer.stop()
-        if process.poll() is None:
-            process.terminate()
+        handler.cancel()
+        if handler.process.poll() is None:
+            handler.process.terminate()
 
     observer.join()
 
 
-def run_app() -> subprocess.Popen[bytes]:
+def run_app(*, forkserver: bool = False) -> AppProcess:
     """
     Launch the application normally (no hot reload).
     """
-    return subprocess.Popen(
-        [sys.executable, "main.py"],
-        stdout=sys.stdout,
-        stderr=sys.stderr,
-    )
+    return _make_launcher(forkserver)()
 
 
 # ============================================================
@@ -96,28 +367,174 @@ def run_app() -> subprocess.Popen[bytes]:
 # ============================================================
 
 
+# Trees that never contain build artifacts worth cleaning.
+DEFAULT_CLEAN_EXCLUDE: tuple[str, ...] = (
+    ".git",
+    ".hg",
+    ".venv",
+    "venv",
+    "node_modules",
+    ".tox",
+    ".nox",
+)
+
+# Loose files are deleted in chunks to keep executor overhead low.
+_CLEAN_CHUNK = 256
+
+
+@dataclass
+class CleanupSummary:
+    """What a cleanup removed (or would remove, for a dry run)."""
+
+    files: int = 0
+    dirs: int = 0
+    bytes: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    dry_run: bool = False
+
+    def __str__(self) -> str:
+        verb = "Would remove" if self.dry_run else "Removed"
+        text = (
+            f"{verb} {self.files} files and {self.dirs} directories "
+            f"({format_size(self.bytes)}) in {self.seconds:.2f} s"
+        )
+        if self.errors:
+            text += f", {self.errors} errors"
+        return text
+
+
+def format_size(num: float) -> str:
+    if num < 1024:
+        return f"{num:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        num /= 1024
+        if num < 1024 or unit == "GB":
+            break
+    return f"{num:.1f} {unit}"
+
+
+def _report_cleanup_error(path: str, exc: OSError) -> None:
+    print(f"Cleanup error: {path} ({exc})", file=sys.stderr)
+
+
+def _remove_files(paths: list[tuple[str, int]], dry_run: bool) -> tuple[int, int, int]:
+    files = size = errors = 0
+    for path, length in paths:
+        try:
+            if not dry_run:
+                os.unlink(path)
+            files += 1
+            size += length
+        except OSError as exc:
+            _report_cleanup_error(path, exc)
+            errors += 1
+    return files, size, errors
+
+
+def _remove_tree(path: str, dry_run: bool) -> tuple[int, int, int]:
+    """Delete a directory bottom-up, counting files and bytes on the way."""
+    files = size = errors = 0
+
+    try:
+        with os.scandir(path) as entries:
+            children = list(entries)
+    except OSError as exc:
+        _report_cleanup_error(path, exc)
+        return 0, 0, 1
+
+    for entry in children:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                sub_files, sub_size, sub_errors = _remove_tree(entry.path, dry_run)
+                files += sub_files
+                size += sub_size
+                errors += sub_errors
+                continue
+
+            length = entry.stat(follow_symlinks=False).st_size
+            if not dry_run:
+                os.unlink(entry.path)
+            files += 1
+            size += length
+        except OSError as exc:
+            _report_cleanup_error(entry.path, exc)
+            errors += 1
+
+    if not dry_run:
+        try:
+            os.rmdir(path)
+        except OSError as exc:
+            _report_cleanup_error(path, exc)
+            errors += 1
+
+    return files, size, errors
+
+
 def cleanup(
     *,
     files_to_remove: Iterable[str] = (),
     dirs_to_remove: Iterable[str] = (),
     file_extensions: Iterable[str] = (),
+    exclude_dirs: Iterable[str] = DEFAULT_CLEAN_EXCLUDE,
     root: Optional[Path] = None,
-) -> None:
-    base = root or Path.cwd()
+    dry_run: bool = False,
+    workers: Optional[int] = None,
+) -> CleanupSummary:
+    """
+    Remove matching files and directories below `root`.
 
-    for path in base.rglob("*"):
-        try:
-            if path.is_file():
-                if path.name in files_to_remove or any(
-                    path.name.endswith(ext) for ext in file_extensions
-                ):
-                    path.unlink()
+    The tree is walked with `os.scandir`; excluded directories and the
+    directories being removed are never descended into by the walk.
+    Deletion runs on a thread pool.
+    """
+    started = time.perf_counter()
+    base = os.fspath(root or Path.cwd())
+
+    file_names = frozenset(files_to_remove)
+    dir_names = frozenset(dirs_to_remove)
+    excluded = frozenset(exclude_dirs) - dir_names
+    suffixes = tuple(file_extensions)
 
-            elif path.is_dir() and path.name in dirs_to_remove:
-                shutil.rmtree(path)
+    summary = CleanupSummary(dry_run=dry_run)
+    doomed_dirs: list[str] = []
+    doomed_files: list[tuple[str, int]] = []
 
+    stack = [base]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name in dir_names:
+                            doomed_dirs.append(entry.path)
+                        elif name not in excluded:
+                            stack.append(entry.path)
+                    elif name in file_names or (suffixes and name.endswith(suffixes)):
+                        length = entry.stat(follow_symlinks=False).st_size
+                        doomed_files.append((entry.path, length))
         except OSError as exc:
-            print(f"Cleanup error: {path} ({exc})", file=sys.stderr)
+            _report_cleanup_error(current, exc)
+            summary.errors += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_remove_tree, path, dry_run) for path in doomed_dirs]
+        futures.extend(
+            pool.submit(_remove_files, doomed_files[i : i + _CLEAN_CHUNK], dry_run)
+            for i in range(0, len(doomed_files), _CLEAN_CHUNK)
+        )
+
+        for future in futures:
+            files, size, errors = future.result()
+            summary.files += files
+            summary.bytes += size
+            summary.errors += errors
+
+    summary.dirs = len(doomed_dirs)
+    summary.seconds = time.perf_counter() - started
+    return summary
 
 
 # ============================================================
@@ -125,6 +542,65 @@ def cleanup(
 # ============================================================
 
 
+@dataclass
+class BuildResult:
+    artifact: Path
+    action: str
+    reason: str
+    seconds: float
+
+
+def _run_tool(
+    command: list[str],
+    *,
+    env: Optional[Mapping[str, str]],
+    log_path: Optional[Path],
+) -> None:
+    merged = {**os.environ, **env} if env else None
+
+    if log_path is None:
+        subprocess.run(command, check=True, env=merged)
+        return
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("w", encoding="utf-8") as log_file:
+        subprocess.run(
+            command,
+            check=True,
+            env=merged,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+
+
+def build_asset_archive(resource_dir: Path, output_dir: Path) -> Optional[Path]:
+    """
+    Asset stage: pack pre-scaled images into `<output_dir>/assets/images.rka`.
+
+    Returns None (and the app falls back to loose files) when Pillow is
+    not available in the build environment.
+    """
+    from rocket.utils.assets import ARCHIVE_NAME, pack_assets
+
+    archive = output_dir / "assets" / ARCHIVE_NAME
+    try:
+        pack_assets(resource_dir, archive)
+    except ImportError:
+        print(
+            "[rocket] Pillow is not installed; skipping the asset archive.",
+            file=sys.stderr,
+        )
+        return None
+    return archive
+
+
+def _pyinstaller_artifact(dist_dir: Path, script_path: Path, onefile: bool) -> Path:
+    name = script_path.stem
+    if onefile and detect_os() is TargetOS.WINDOWS:
+        name += ".exe"
+    return dist_dir / name
+
+
 def create_executable(
     *,
     script_path: Path,
@@ -132,22 +608,50 @@ def create_executable(
     output_root: Path,
     onefile: bool = True,
     windowed: bool = True,
-) -> None:
+    force: bool = False,
+    env: Optional[Mapping[str, str]] = None,
+    log_path: Optional[Path] = None,
+) -> BuildResult:
+    """
+    Build with PyInstaller, reusing as much of the previous build as possible.
+
+    Unchanged inputs reuse the existing artifact; app or resource changes
+    keep the PyInstaller work directory; interpreter, dependency or option
+    changes rebuild with `--clean`. The decision is recorded in
+    `build-manifest.json` next to `dist/`.
+    """
+    from rocket.cli import build_cache
+
     if not script_path.is_file():
         raise FileNotFoundError(script_path)
     if not resource_dir.is_dir():
         raise FileNotFoundError(resource_dir)
 
+    started = time.perf_counter()
     target = detect_os()
 
     output_dir = output_root / target.value
     dist_dir = output_dir / "dist"
     work_dir = output_dir / "work"
+    artifact = _pyinstaller_artifact(dist_dir, script_path, onefile)
+
+    current = build_cache.fingerprint(
+        script_path=script_path,
+        resource_dir=resource_dir,
+        backend="pyinstaller",
+        options={"onefile": onefile, "windowed": windowed},
+    )
+    plan = build_cache.plan_build(output_dir, current, artifact=artifact, force=force)
+
+    if plan.action is build_cache.BuildAction.REUSE:
+        return BuildResult(
+            artifact, plan.action.value, plan.reason, time.perf_counter() - started
+        )
 
     dist_dir.mkdir(parents=True, exist_ok=True)
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    command: list[str] = ["pyinstaller"]
+    command: list[str] = ["pyinstaller", "--noconfirm"]
 
     if onefile:
         command.append("--onefile")
@@ -158,14 +662,29 @@ def create_executable(
     command.extend(
         [
             str(script_path),
-            f"--add-data={resource_dir}{os.pathsep}resources/images",
+            # Absolute: with --specpath, relative data paths resolve
+            # against the spec directory.
+            f"--add-data={resource_dir.resolve()}{os.pathsep}resources/images",
             f"--distpath={dist_dir}",
             f"--workpath={work_dir}",
-            "--clean",
+            # Keep the generated .spec out of the shared cwd so matrix
+            # variants building concurrently do not overwrite each other's.
+            f"--specpath={work_dir}",
         ]
     )
 
-    subprocess.run(command, check=True)
+    archive = build_asset_archive(resource_dir, output_dir)
+    if archive is not None:
+        command.append(f"--add-data={archive.resolve()}{os.pathsep}resources")
+
+    if plan.action is build_cache.BuildAction.CLEAN:
+        command.append("--clean")
+
+    _run_tool(command, env=env, log_path=log_path)
+
+    seconds = time.perf_counter() - started
+    build_cache.write_manifest(output_dir, plan, artifact=artifact, seconds=seconds)
+    return BuildResult(artifact, plan.action.value, plan.reason, seconds)
 
 
 # ============================================================
@@ -173,21 +692,49 @@ def create_executable(
 # ============================================================
 
 
+def _nuitka_artifact(output_dir: Path, script_path: Path, onefile: bool) -> Path:
+    suffix = ".exe" if detect_os() is TargetOS.WINDOWS else ".bin"
+    if onefile:
+        return output_dir / f"{script_path.stem}{suffix}"
+    return output_dir / f"{script_path.stem}.dist"
+
+
 def create_executable_nuitka(
     *,
     script_path: Path,
     resource_dir: Path,
     output_root: Path,
     onefile: bool = True,
-) -> None:
+    force: bool = False,
+    env: Optional[Mapping[str, str]] = None,
+    log_path: Optional[Path] = None,
+) -> BuildResult:
+    from rocket.cli import build_cache
+
     if not script_path.is_file():
         raise FileNotFoundError(script_path)
     if not resource_dir.is_dir():
         raise FileNotFoundError(resource_dir)
 
+    started = time.perf_counter()
     target = detect_os()
     output_dir = output_root / target.value
     output_dir.mkdir(parents=True, exist_ok=True)
+    artifact = _nuitka_artifact(output_dir, script_path, onefile)
+
+    current = build_cache.fingerprint(
+        script_path=script_path,
+        resource_dir=resource_dir,
+        backend="nuitka",
+        options={"onefile": onefile},
+    )
+    plan = build_cache.plan_build(output_dir, current, artifact=artifact, force=force)
+
+    # Nuitka keeps its own compilation cache, so only full reuse is handled here.
+    if plan.action is build_cache.BuildAction.REUSE:
+        return BuildResult(
+            artifact, plan.action.value, plan.reason, time.perf_counter() - started
+        )
 
     command = [
         "nuitka",
@@ -202,7 +749,15 @@ def create_executable_nuitka(
 
     command = [arg for arg in command if arg]
 
-    subprocess.run(command, check=True)
+    archive = build_asset_archive(resource_dir, output_dir)
+    if archive is not None:
+        command.extend(["--include-data-files", f"{archive}=resources/{archive.name}"])
+
+    _run_tool(command, env=env, log_path=log_path)
+
+    seconds = time.perf_counter() - started
+    build_cache.write_manifest(output_dir, plan, artifact=artifact, seconds=seconds)
+    return BuildResult(artifact, plan.action.value, plan.reason, seconds)
 
 
 # ============================================================
@@ -0,0 +1,399 @@
+"""
+Warm interpreter fork server for `rocket run` / `rocket dev` (Linux only).
+
+A long-lived zygote process imports Tk, CustomTkinter and the Rocket
+framework once, then forks a fresh child for every launch request. The
+child receives the caller's stdio over the socket and executes `main.py`,
+so only application modules are imported at launch time.
+
+The zygote is shared between CLI invocations of the same project, exits
+after an idle timeout, and steps down as soon as any module it preloaded
+changes on disk (including `project_config.py`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+PRELOAD_MODULES: tuple[str, ...] = (
+    "tkinter",
+    "tkinter.font",
+    "customtkinter",
+    "rocket",
+    "rocket.elements",
+    "rocket.layout",
+    "rocket.pages.page",
+    "rocket.pages.router",
+    "rocket.render",
+    "rocket.runtime.window_manager",
+    "rocket.theme.manager",
+)
+
+IDLE_TIMEOUT = 15 * 60
+LAUNCH_TIME_ENV = "ROCKET_LAUNCH_TIME"
+
+_MAX_REQUEST = 1 << 20
+_MISSING = -1
+
+
+class ForkServerError(RuntimeError):
+    """Raised when the fork server cannot be started or reached."""
+
+    pass
+
+
+def is_supported() -> bool:
+    return sys.platform.startswith("linux") and hasattr(socket, "send_fds")
+
+
+def socket_path(root: Path) -> Path:
+    digest = hashlib.sha1(str(root.resolve()).encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"rocket-{os.getuid()}-{digest}.sock"
+
+
+# ============================================================
+# Client
+# ============================================================
+
+
+class ForkedProcess:
+    """
+    Handle to an app process forked by the zygote.
+
+    Mirrors the parts of `subprocess.Popen` the CLI relies on. The exit
+    status is delivered over the request connection by the zygote.
+    """
+
+    def __init__(
+        self, pid: int, conn: socket.socket, latency: float, buffer: bytes = b""
+    ) -> None:
+        self.pid = pid
+        self.latency = latency
+        self.returncode: Optional[int] = None
+        self._conn = conn
+        # Bytes received after the pid line (the exit status of a child
+        # that exited immediately).
+        self._buffer = buffer
+
+    def _read_status(self, timeout: Optional[float]) -> bool:
+        self._conn.settimeout(timeout)
+        try:
+            while b"\n" not in self._buffer:
+                chunk = self._conn.recv(64)
+                if not chunk:
+                    # Zygote went away; treat the child as gone too.
+                    self.returncode = -signal.SIGKILL
+                    return True
+                self._buffer += chunk
+        except (socket.timeout, BlockingIOError):
+            return False
+
+        line = self._buffer.split(b"\n", 1)[0].decode()
+        self.returncode = int(line.split()[1])
+        self._conn.close()
+        return True
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            self._read_status(0)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None and not self._read_status(timeout):
+            raise subprocess.TimeoutExpired(f"pid {self.pid}", timeout or 0)
+        return self.returncode
+
+    def send_signal(self, sig: int) -> None:
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+
+class ForkServer:
+    """Client side: finds or spawns the project's zygote and requests launches."""
+
+    def __init__(self, root: Path = Path(".")) -> None:
+        self.root = root.resolve()
+        self.path = socket_path(self.root)
+
+    def _alive(self) -> bool:
+        """True if a zygote answers on the socket (an empty request is ignored)."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.path))
+        except OSError:
+            return False
+        finally:
+            probe.close()
+        return True
+
+    def _spawn(self) -> None:
+        import fcntl
+
+        from rocket.utils.paths import cache_dir
+
+        # Serialize spawns of concurrent CLIs: without the lock, a second
+        # spawn unlinks the first zygote's socket and orphans it.
+        with self.path.with_suffix(".lock").open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            if self._alive():
+                return
+            self.path.unlink(missing_ok=True)
+
+            log_path = cache_dir() / "forkserver.log"
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with log_path.open("ab") as stderr:
+                zygote = subprocess.Popen(
+                    [sys.executable, "-m", "rocket.cli.forkserver", str(self.path)],
+                    cwd=self.root,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    start_new_session=True,
+                )
+            ready = zygote.stdout.readline().strip()
+            zygote.stdout.close()
+
+        if ready != b"ready":
+            raise ForkServerError(f"fork server failed to start (see {log_path})")
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(str(self.path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            self._spawn()
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(str(self.path))
+        return sock
+
+    def launch(self, script: str = "main.py") -> ForkedProcess:
+        started = time.perf_counter()
+        env = dict(os.environ)
+        env[LAUNCH_TIME_ENV] = repr(time.time())
+
+        request = json.dumps(
+            {
+                "cwd": str(self.root),
+                "argv": [script],
+                "env": env,
+            }
+        ).encode()
+
+        for _ in range(2):
+            try:
+                conn = self._connect()
+                socket.send_fds(conn, [request], [0, 1, 2])
+                reply = b""
+                while b"\n" not in reply:
+                    chunk = conn.recv(64)
+                    if not chunk:
+                        break
+                    reply += chunk
+            except OSError as exc:
+                raise ForkServerError(f"fork server unreachable ({exc})") from exc
+
+            # A child that exits at once can put "exit N" in the same recv.
+            line, _, rest = reply.partition(b"\n")
+            kind, _, value = line.decode().strip().partition(" ")
+            if kind == "pid":
+                return ForkedProcess(
+                    int(value), conn, time.perf_counter() - started, rest
+                )
+
+            # "stale": the zygote has stepped down, spawn a fresh one.
+            conn.close()
+
+        raise ForkServerError("fork server kept reporting stale modules")
+
+
+# ============================================================
+# Zygote
+# ============================================================
+
+
+def _preload() -> dict[str, int]:
+    import importlib
+
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as exc:
+            print(
+                f"[rocket] fork server: cannot preload {name} ({exc})", file=sys.stderr
+            )
+
+    mtimes: dict[str, int] = {}
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if filename:
+            try:
+                mtimes[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                pass
+
+    # Config may not exist yet; creating it later must invalidate the zygote.
+    config = os.path.abspath("project_config.py")
+    if config not in mtimes:
+        try:
+            mtimes[config] = os.stat(config).st_mtime_ns
+        except OSError:
+            mtimes[config] = _MISSING
+    return mtimes
+
+
+def _is_stale(mtimes: dict[str, int]) -> bool:
+    for filename, mtime in mtimes.items():
+        try:
+            current = os.stat(filename).st_mtime_ns
+        except OSError:
+            current = _MISSING
+        if current != mtime:
+            return True
+    return False
+
+
+def _run_child(request: dict, fds: list[int]) -> None:
+    """Executed in the forked child; never returns."""
+    code = 0
+    try:
+        for target, fd in enumerate(fds[:3]):
+            os.dup2(fd, target)
+        for fd in fds:
+            os.close(fd)
+
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        sys.stdin = open(0, closefd=False)
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+
+        script = os.path.abspath(request["argv"][0])
+        sys.argv = list(request["argv"])
+        sys.path[0] = os.path.dirname(script)
+
+        import runpy
+
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except BaseException:
+        import traceback
+
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def serve(path: str) -> None:
+    mtimes = _preload()
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Signal readiness, then let go of the client's pipe.
+    sys.stdout.write("ready\n")
+    sys.stdout.flush()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+
+    children: dict[int, socket.socket] = {}
+    last_activity = time.monotonic()
+    listening = True
+
+    while listening or children:
+        readable = [listener] if listening else []
+        ready, _, _ = select.select(readable, [], [], 0.2)
+
+        if ready:
+            conn, _ = listener.accept()
+            last_activity = time.monotonic()
+            try:
+                data, fds, _, _ = socket.recv_fds(conn, _MAX_REQUEST, 3)
+                request = json.loads(data)
+            except (OSError, ValueError):
+                conn.close()
+                continue
+
+            if _is_stale(mtimes):
+                for fd in fds:
+                    os.close(fd)
+                os.unlink(path)
+                listener.close()
+                listening = False
+                conn.sendall(b"stale\n")
+                conn.close()
+                continue
+
+            pid = os.fork()
+            if pid == 0:
+                listener.close()
+                for other in children.values():
+                    other.close()
+                conn.close()
+                _run_child(request, fds)
+
+            for fd in fds:
+                os.close(fd)
+            children[pid] = conn
+            conn.sendall(f"pid {pid}\n".encode())
+
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            conn = children.pop(pid, None)
+            if conn is not None:
+                try:
+                    conn.sendall(f"exit {os.waitstatus_to_exitcode(status)}\n".encode())
+                except OSError:
+                    pass
+                conn.close()
+            last_activity = time.monotonic()
+
+        if (
+            listening
+            and not children
+            and time.monotonic() - last_activity > IDLE_TIMEOUT
+        ):
+            os.unlink(path)
+            listener.close()
+            listening = False
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1])
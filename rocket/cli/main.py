@@ -1,15 +1,63 @@
 from __future__ import annotations
 
+import importlib
+
 import click
 
-from rocket.cli.commands.run import run
-from rocket.cli.commands.build import build
-from rocket.cli.commands.clean import clean
-from rocket.cli.commands.dev import dev
-from rocket.cli.commands.version import version
+# Subcommands are imported only when invoked, so `rocket --help` and
+# `rocket version` never pay for watchdog, the build tooling or the GUI.
+# name -> (import path, short help shown in `rocket --help`)
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "run": ("rocket.cli.commands.run:run", "Run the application."),
+    "build": ("rocket.cli.commands.build:build", "Build application executable."),
+    "clean": ("rocket.cli.commands.clean:clean", "Clean build artifacts."),
+    "dev": ("rocket.cli.commands.dev:dev", "Run with hot reload."),
+    "startup-report": (
+        "rocket.cli.commands.startup_report:startup_report",
+        "Break down cold-start time of the application.",
+    ),
+    "version": ("rocket.cli.commands.version:version", "Show Rocket version."),
+}
+
+
+class LazyGroup(click.Group):
+    """A click group that resolves subcommands from import strings on demand."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, tuple[str, str]] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
 
+        module_name, _, attr = self.lazy_commands[cmd_name][0].partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        # Cache so repeated lookups in one process skip the import machinery.
+        self.add_command(command, cmd_name)
+        return command
 
-class CustomGroup(click.Group):
+    def format_commands(self, ctx, formatter):
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str()))
+            else:
+                rows.append((name, self.lazy_commands[name][1]))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+class CustomGroup(LazyGroup):
     def format_help(self, ctx, formatter):
         click.echo(
             """
@@ -26,19 +74,12 @@ Rocket CLI
         super().format_help(ctx, formatter)
 
 
-@click.group(cls=CustomGroup)
+@click.group(cls=CustomGroup, lazy_commands=LAZY_COMMANDS)
 def rocket():
     """Rocket command-line interface."""
     pass
 
 
-rocket.add_command(run)
-rocket.add_command(build)
-rocket.add_command(clean)
-rocket.add_command(dev)
-rocket.add_command(version)
-
-
 def main() -> None:
     rocket()
 
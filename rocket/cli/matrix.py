@@ -0,0 +1,227 @@
+"""
+Concurrent multi-variant builds for `rocket build --matrix`.
+
+Each variant (backend x onefile/onedir) builds in its own process with a
+private output and work directory under `build/matrix/<variant>/`, while
+the backends' dependency caches are shared through `build/.cache`.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from rocket.cli.core import (
+    TargetOS,
+    create_executable,
+    create_executable_nuitka,
+    detect_os,
+    format_size,
+)
+
+BACKENDS = ("pyinstaller", "nuitka")
+
+COLD_START_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class BuildVariant:
+    backend: str
+    onefile: bool
+
+    @property
+    def name(self) -> str:
+        return f"{self.backend}-{'onefile' if self.onefile else 'onedir'}"
+
+    @classmethod
+    def parse(cls, name: str) -> "BuildVariant":
+        backend, _, layout = name.partition("-")
+        if backend not in BACKENDS or layout not in ("onefile", "onedir"):
+            raise ValueError(f"Unknown build variant: {name}")
+        return cls(backend, layout == "onefile")
+
+
+DEFAULT_MATRIX: tuple[BuildVariant, ...] = tuple(
+    BuildVariant(backend, onefile) for backend in BACKENDS for onefile in (True, False)
+)
+
+
+@dataclass
+class VariantResult:
+    variant: BuildVariant
+    seconds: float
+    action: str = ""
+    artifact: Optional[Path] = None
+    size: Optional[int] = None
+    cold_start: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _artifact_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _executable(artifact: Path, script_path: Path) -> Path:
+    """Resolve the launchable binary inside a onedir artifact."""
+    if artifact.is_file():
+        return artifact
+
+    suffixes = (".exe",) if detect_os() is TargetOS.WINDOWS else ("", ".bin")
+    for suffix in suffixes:
+        candidate = artifact / f"{script_path.stem}{suffix}"
+        if candidate.is_file():
+            return candidate
+    return artifact
+
+
+def measure_cold_start(executable: Path) -> Optional[float]:
+    """
+    Launch the built app and time it until the window's first frame.
+
+    The app is asked to close itself after the first frame, so the
+    measurement is wall-clock launch-to-exit. Returns None on failure.
+    """
+    env = {**os.environ, "ROCKET_EXIT_AFTER_FIRST_FRAME": "1"}
+    started = time.perf_counter()
+    try:
+        subprocess.run(
+            [str(executable)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=COLD_START_TIMEOUT,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return time.perf_counter() - started
+
+
+def _build_variant(
+    variant: BuildVariant,
+    script_path: Path,
+    resource_dir: Path,
+    output_root: Path,
+    force: bool,
+    cold_start: bool,
+) -> VariantResult:
+    """Process-pool entry point: build one variant in isolation."""
+    started = time.perf_counter()
+    variant_root = output_root / "matrix" / variant.name
+    cache_root = (output_root / ".cache").resolve()
+
+    # Variants build in parallel and `--clean` wipes PyInstaller's cache,
+    # so each one gets its own.
+    env = {
+        "PYINSTALLER_CONFIG_DIR": str(cache_root / "pyinstaller" / variant.name),
+        "NUITKA_CACHE_DIR": str(cache_root / "nuitka"),
+    }
+    common = dict(
+        script_path=script_path,
+        resource_dir=resource_dir,
+        output_root=variant_root,
+        onefile=variant.onefile,
+        force=force,
+        env=env,
+        log_path=variant_root / "build.log",
+    )
+
+    try:
+        if variant.backend == "nuitka":
+            build = create_executable_nuitka(**common)
+        else:
+            build = create_executable(windowed=True, **common)
+    except (OSError, subprocess.CalledProcessError) as exc:
+        return VariantResult(variant, time.perf_counter() - started, error=str(exc))
+
+    result = VariantResult(
+        variant,
+        build.seconds,
+        action=build.action,
+        artifact=build.artifact,
+    )
+    if build.artifact.exists():
+        result.size = _artifact_size(build.artifact)
+        if cold_start:
+            result.cold_start = measure_cold_start(
+                _executable(build.artifact, script_path)
+            )
+    return result
+
+
+def run_matrix(
+    variants: Iterable[BuildVariant],
+    *,
+    script_path: Path,
+    resource_dir: Path,
+    output_root: Path,
+    jobs: Optional[int] = None,
+    force: bool = False,
+    cold_start: bool = True,
+) -> list[VariantResult]:
+    variants = list(variants)
+    (output_root / ".cache").mkdir(parents=True, exist_ok=True)
+
+    results: dict[BuildVariant, VariantResult] = {}
+    with ProcessPoolExecutor(max_workers=jobs or len(variants) or 1) as pool:
+        futures = {
+            pool.submit(
+                _build_variant,
+                variant,
+                script_path,
+                resource_dir,
+                output_root,
+                force,
+                cold_start,
+            ): variant
+            for variant in variants
+        }
+        for future in as_completed(futures):
+            variant = futures[future]
+            try:
+                results[variant] = future.result()
+            except Exception as exc:
+                results[variant] = VariantResult(variant, 0.0, error=str(exc))
+
+    return [results[variant] for variant in variants]
+
+
+def format_table(results: Iterable[VariantResult]) -> str:
+    results = list(results)
+    header = ("Variant", "Result", "Build", "Size", "Cold start")
+    rows = [header]
+
+    for result in results:
+        rows.append(
+            (
+                result.variant.name,
+                "failed" if result.error else result.action,
+                f"{result.seconds:.1f} s",
+                format_size(result.size) if result.size is not None else "-",
+                (
+                    f"{result.cold_start * 1000:.0f} ms"
+                    if result.cold_start is not None
+                    else "-"
+                ),
+            )
+        )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        "  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip()
+        for row in rows
+    ]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+
+    for result in results:
+        if result.error:
+            lines.append(f"{result.variant.name}: {result.error}")
+
+    return "\n".join(lines)
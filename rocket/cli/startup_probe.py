@@ -0,0 +1,83 @@
+"""
+Cold-start probe used by `rocket startup-report`.
+
+Runs `main.py` in a fresh interpreter with a few framework entry points
+wrapped, records when each startup phase ends, and writes the timeline
+as JSON. Instead of entering the Tk main loop the probe draws one frame
+and closes the window.
+
+Usage: python -X importtime -m rocket.cli.startup_probe <script> <out.json> <spawned>
+"""
+
+from __future__ import annotations
+
+import json
+import runpy
+import sys
+import time
+import traceback
+from pathlib import Path
+
+
+class _FirstFrame(Exception):
+    """Unwinds `main()` once the first frame has been drawn."""
+
+
+def probe(script: str, out_path: str, spawned: float) -> None:
+    marks: dict[str, float] = {"interpreter": time.time() - spawned}
+    error = None
+    clock = time.perf_counter
+    last = clock()
+
+    def mark(phase: str) -> None:
+        nonlocal last
+        now = clock()
+        marks[phase] = marks.get(phase, 0.0) + (now - last)
+        last = now
+
+    try:
+        import customtkinter  # noqa: F401
+
+        import rocket.pages.page  # noqa: F401
+        from rocket.runtime.base_window import BaseWindow
+
+        mark("framework import")
+
+        from rocket import config
+
+        config._load_project_config()
+        mark("config load")
+
+        original_init = BaseWindow.__init__
+
+        def timed_init(self, *args, **kwargs):
+            mark("app import")
+            original_init(self, *args, **kwargs)
+            mark("window creation")
+
+        def first_frame(self, *args, **kwargs):
+            mark("first render")
+            self.update()
+            mark("first frame")
+            self.destroy()
+            raise _FirstFrame
+
+        BaseWindow.__init__ = timed_init
+        BaseWindow.mainloop = first_frame
+
+        sys.argv = [script]
+        sys.path.insert(0, str(Path(script).resolve().parent))
+        runpy.run_path(script, run_name="__main__")
+    except _FirstFrame:
+        pass
+    except BaseException as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        traceback.print_exc()
+
+    Path(out_path).write_text(
+        json.dumps({"phases": marks, "error": error}), encoding="utf-8"
+    )
+
+
+if __name__ == "__main__":
+    probe(sys.argv[1], sys.argv[2], float(sys.argv[3]))
@@ -6,9 +6,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-PROJECT_NAME: str = "rocket_app"
-VERSION: str = "0.0.0"
-RELEASE: bool = False
+# Project settings are loaded from `project_config.py` on first access
+# (see `__getattr__` below), so importing this module executes nothing.
+PROJECT_NAME: str
+VERSION: str
+RELEASE: bool
 
 
 @dataclass(slots=True)
@@ -24,8 +26,10 @@ class WindowConfig:
 # Public alias expected by runtime
 MainWindowConfig = WindowConfig
 
-# Default instance
-MAIN_WINDOW = MainWindowConfig()
+MAIN_WINDOW: WindowConfig
+
+_SETTINGS = ("PROJECT_NAME", "VERSION", "RELEASE", "MAIN_WINDOW")
+_loaded = False
 
 
 def _load_project_config() -> None:
@@ -35,7 +39,17 @@ def _load_project_config() -> None:
     This file is treated as trusted project code.
     Only known configuration values are read.
     """
-    global PROJECT_NAME, VERSION, RELEASE, MAIN_WINDOW
+    global PROJECT_NAME, VERSION, RELEASE, MAIN_WINDOW, _loaded
+
+    if _loaded:
+        return
+    _loaded = True
+
+    # Defaults
+    PROJECT_NAME = "rocket_app"
+    VERSION = "0.0.0"
+    RELEASE = False
+    MAIN_WINDOW = MainWindowConfig()
 
     config_path = Path.cwd() / "project_config.py"
     if not config_path.is_file():
@@ -78,4 +92,8 @@ def _load_project_config() -> None:
             )
 
 
-_load_project_config()
+def __getattr__(name: str):
+    if name in _SETTINGS:
+        _load_project_config()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
 
 from rocket.core.context import BuildContext
 from rocket.core.state import Signal
 from rocket.core.widget import WidgetSpec
 
+T = TypeVar("T")
+
+# Component class name -> [hits, misses] of `memo` / `callback` hooks.
+hook_stats: Dict[str, List[int]] = {}
+
 
 class ComponentLifecycleError(Exception):
     """Raised when component lifecycle rules are violated."""
@@ -12,12 +17,44 @@ class ComponentLifecycleError(Exception):
     pass
 
 
+class Ref:
+    """Mutable box returned by `Component.ref`; kept across builds."""
+
+    __slots__ = ("current",)
+
+    def __init__(self, current: Any = None):
+        self.current = current
+
+
+class _Memo:
+    __slots__ = ("deps", "value")
+
+    def __init__(self, deps: tuple, value: Any):
+        self.deps = deps
+        self.value = value
+
+
 class Component(ABC):
     """
     Base class for all RocketUI components.
     Enforces strict lifecycle: init -> mount -> build -> unmount.
     """
 
+    __slots__ = (
+        "props",
+        "context",
+        "_mounted",
+        "_node",
+        "_request_update_callback",
+        "_rendered_child",
+        "_hooks",
+        "_hook_cursor",
+        "__weakref__",
+    )
+
+    # Read by WidgetSpec to precompute `is_component`.
+    _is_rocket_component = True
+
     def __init__(self, props: Optional[dict[str, Any]] = None):
         self.props = props or {}
         self.context: Optional[BuildContext] = None
@@ -25,6 +62,8 @@ class Component(ABC):
         self._node: Optional[WidgetSpec] = (
             None  # The VNode that produced this component
         )
+        self._hooks: Optional[list] = None
+        self._hook_cursor = 0
 
     def mount(self, context: BuildContext):
         """Called by the renderer when the component is added to the tree."""
@@ -54,6 +93,66 @@ class Component(ABC):
         """Lifecycle hook: Called when props change."""
         pass
 
+    # ---- hooks ----
+    # Valid inside build(); each call is identified by its position, so
+    # hooks must be called in the same order on every build.
+
+    def _next_hook(self, kind: type):
+        if self._hooks is None:
+            self._hooks = []
+        index = self._hook_cursor
+        self._hook_cursor = index + 1
+        if index < len(self._hooks):
+            hook = self._hooks[index]
+            if type(hook) is not kind:
+                raise ComponentLifecycleError(
+                    f"{type(self).__name__}: hooks must run in the same order on every build"
+                )
+            return hook
+        return None
+
+    def memo(self, fn: Callable[[], T], deps: Sequence[Any]) -> T:
+        """Return `fn()`, recomputed only when `deps` differ from the last build."""
+        deps = tuple(deps)
+        hook = self._next_hook(_Memo)
+        stats = hook_stats.get(type(self).__name__)
+        if stats is None:
+            stats = hook_stats[type(self).__name__] = [0, 0]
+
+        if hook is not None and hook.deps == deps:
+            stats[0] += 1
+            return hook.value
+
+        stats[1] += 1
+        value = fn()
+        if hook is None:
+            self._hooks.append(_Memo(deps, value))
+        else:
+            hook.deps = deps
+            hook.value = value
+        return value
+
+    def callback(self, fn: Callable, deps: Sequence[Any]) -> Callable:
+        """
+        Return the same function object until `deps` change.
+
+        Keeps props such as `command=` equal across builds, so the
+        renderer can skip unchanged subtrees.
+        """
+        return self.memo(lambda: fn, deps)
+
+    def ref(self, initial: Any = None) -> Ref:
+        """A `Ref` that persists for the lifetime of this component."""
+        hook = self._next_hook(Ref)
+        if hook is None:
+            hook = Ref(initial)
+            self._hooks.append(hook)
+        return hook
+
+    def _child_context(self, context: BuildContext) -> BuildContext:
+        """Context handed to the subtree this component builds."""
+        return context
+
     @abstractmethod
     def build(self, context: BuildContext) -> Union[WidgetSpec, None]:
         """
@@ -66,7 +165,7 @@ class Component(ABC):
 class StatelessComponent(Component):
     """A component that is a pure function of its props."""
 
-    pass
+    __slots__ = ()
 
 
 class StatefulComponent(Component):
@@ -75,6 +174,8 @@ class StatefulComponent(Component):
     State mutations must happen via set_state.
     """
 
+    __slots__ = ("_signals",)
+
     def __init__(self, props: Dict[str, Any] = None):
         super().__init__(props)
         self._signals: list[Signal] = []
@@ -1,16 +1,114 @@
-from rocket.theme.manager import ThemeManager
+import weakref
+from typing import TYPE_CHECKING, Any, Optional
+
+from rocket.core.state import Signal
+
+if TYPE_CHECKING:
+    from rocket.core.component import Component
+    from rocket.theme.manager import ThemeManager
+
+# Component whose build() is running; set by `build_component`.
+_consumer: Optional["Component"] = None
+
+
+def build_component(component: "Component", context: "BuildContext"):
+    """Run `component.build`: restart its hooks and attribute `context.use` calls to it."""
+    global _consumer
+    previous, _consumer = _consumer, component
+    component._hook_cursor = 0
+    try:
+        return component.build(context)
+    finally:
+        _consumer = previous
+
+
+class ProvidedValue:
+    """
+    A value made available to a subtree by a `Provider`.
+
+    Remembers which components read it through `context.use` and, when
+    the underlying signal changes, schedules only those components.
+    """
+
+    __slots__ = ("source", "consumers", "__weakref__")
+
+    def __init__(self, source: Any):
+        self.source = source
+        self.consumers: "weakref.WeakSet[Component]" = weakref.WeakSet()
+        if isinstance(source, Signal):
+            source.subscribe(self._on_change)
+
+    def get(self) -> Any:
+        source = self.source
+        return source.get() if isinstance(source, Signal) else source
+
+    def replace(self, source: Any) -> None:
+        """Switch to a new source and refresh its consumers."""
+        if source is self.source:
+            return
+        self.close()
+        self.source = source
+        if isinstance(source, Signal):
+            source.subscribe(self._on_change)
+        self._on_change(None)
+
+    def close(self) -> None:
+        if isinstance(self.source, Signal):
+            self.source.unsubscribe(self._on_change)
+
+    def _on_change(self, _value: Any) -> None:
+        for component in list(self.consumers):
+            if not component._mounted:
+                self.consumers.discard(component)
+                continue
+            request = getattr(component, "_request_update_callback", None)
+            if request is not None:
+                request(component)
 
 
 class BuildContext:
     """
     Dependency bucket passed down the widget tree.
     Holds reference to theme, window, and global data.
+
+    `Provider` elements hand their subtree a scoped child context that
+    adds one value, read with `use`.
     """
 
-    def __init__(self, window, theme: ThemeManager, **kwargs):
+    def __init__(self, window, theme: "ThemeManager", **kwargs):
         self.window = window
-        self.theme: ThemeManager = theme
+        self.theme: "ThemeManager" = theme
         self._data = kwargs
+        self._parent: Optional["BuildContext"] = None
+        self._key: Optional[str] = None
+        self._provided: Optional[ProvidedValue] = None
 
     def get(self, key):
         return self._data.get(key)
+
+    def scoped(self, key: str, provided: ProvidedValue) -> "BuildContext":
+        """A child context that also provides `key`."""
+        child = BuildContext(self.window, self.theme)
+        child._data = self._data
+        child._parent = self
+        child._key = key
+        child._provided = provided
+        return child
+
+    def use(self, key: str) -> Any:
+        """
+        The value for `key` from the nearest enclosing Provider.
+
+        Inside `build()` the calling component is recorded as a consumer
+        and rebuilt on its own when the value changes. Falls back to the
+        page data (`get`) when no Provider supplies `key`.
+        """
+        context = self
+        while context is not None:
+            if context._key == key:
+                provided = context._provided
+                if _consumer is not None:
+                    provided.consumers.add(_consumer)
+                return provided.get()
+            context = context._parent
+        return self.get(key)
@@ -0,0 +1,279 @@
+"""
+Persisted signals backed by a write-behind journal.
+
+`PersistentSignal` behaves like `Signal` but survives restarts. Writes
+only update memory and enqueue a journal line; a background thread
+appends queued lines in groups with one fsync per group (group commit),
+coalescing repeated writes to the same key. The journal is compacted to
+one line per key once it has grown well past the live data, and it is
+read lazily on the first `get()`.
+
+Journal format: one JSON object per line, ``{"k": key, "v": value}`` or
+``{"k": key, "d": 1}`` for deletions. A torn last line (crash during a
+write) is discarded on load, and a missing final newline is restored.
+"""
+
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, TypeVar
+
+from rocket.core.state import Signal
+from rocket.log import log
+
+T = TypeVar("T")
+
+JOURNAL_NAME = "state.journal"
+
+_STOP = object()
+
+
+def state_dir() -> Path:
+    """Per-user data directory for this project (override: ROCKET_STATE_DIR)."""
+    override = os.environ.get("ROCKET_STATE_DIR")
+    if override:
+        return Path(override)
+
+    from rocket import config
+
+    if sys.platform.startswith("win"):
+        base = Path(os.environ.get("APPDATA", Path.home() / "AppData" / "Roaming"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+    return base / config.PROJECT_NAME
+
+
+class JournalStore:
+    """Key/value store persisted through an append-only journal."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        commit_interval: float = 0.05,
+        compact_after: int = 1000,
+    ):
+        self.path = Path(path)
+        self.commit_interval = commit_interval
+        self.compact_after = compact_after
+
+        self._data: Dict[str, Any] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._lines = 0
+
+        self.commits = 0
+        self.compactions = 0
+
+    # ---- reading ----
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+
+            good = 0
+            raw = b""
+            try:
+                with self.path.open("rb") as fh:
+                    for raw in fh:
+                        try:
+                            entry = json.loads(raw)
+                        except ValueError:
+                            break
+                        if entry.get("d"):
+                            self._data.pop(entry["k"], None)
+                        else:
+                            self._data[entry["k"]] = entry["v"]
+                        good += len(raw)
+                        self._lines += 1
+                    torn = fh.tell() != good
+            except FileNotFoundError:
+                torn = False
+            except OSError as exc:
+                log(f"state journal unreadable: {exc}")
+                torn = False
+
+            if torn:
+                # Drop the partial line so later appends stay parseable.
+                with self.path.open("r+b") as fh:
+                    fh.truncate(good)
+            elif raw and not raw.endswith(b"\n"):
+                # Complete record, but the crash hit before its newline;
+                # the next append would otherwise be glued onto it.
+                with self.path.open("ab") as fh:
+                    fh.write(b"\n")
+
+            self._loaded = True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if not self._loaded:
+            self._load()
+        return self._data.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        if not self._loaded:
+            self._load()
+        return key in self._data
+
+    # ---- writing ----
+
+    def put(self, key: str, value: Any) -> None:
+        """Update `key`; the journal write happens on the writer thread."""
+        # Encoded now so later mutation of `value` cannot leak into the file.
+        line = json.dumps({"k": key, "v": value}, separators=(",", ":"))
+        if not self._loaded:
+            self._load()
+        with self._lock:
+            self._data[key] = value
+        self._enqueue(key, line)
+
+    def delete(self, key: str) -> None:
+        if not self._loaded:
+            self._load()
+        with self._lock:
+            self._data.pop(key, None)
+        self._enqueue(key, json.dumps({"k": key, "d": 1}, separators=(",", ":")))
+
+    def _enqueue(self, key: str, line: str) -> None:
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run, name="rocket-journal", daemon=True
+            )
+            self._writer.start()
+        self._queue.put((key, line))
+
+    def flush(self) -> None:
+        """Block until every queued write is on disk."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._writer = None
+
+    # ---- writer thread ----
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # Group commit: collect whatever arrives within the window.
+            try:
+                while True:
+                    batch.append(self._queue.get(timeout=self.commit_interval))
+                    if batch[-1] is _STOP:
+                        break
+            except queue.Empty:
+                pass
+
+            stop = batch[-1] is _STOP
+            lines: Dict[str, str] = {}
+            for item in batch:
+                if item is not _STOP:
+                    lines[item[0]] = item[1]
+
+            try:
+                if lines:
+                    self._commit(lines)
+            except OSError as exc:
+                log(f"state journal write failed: {exc}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _commit(self, lines: Dict[str, str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write("\n".join(lines.values()) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._lines += len(lines)
+        self.commits += 1
+
+        if self._lines > self.compact_after and self._lines > 2 * len(self._data):
+            self._compact()
+
+    def _compact(self) -> None:
+        with self._lock:
+            snapshot = dict(self._data)
+
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for key, value in snapshot.items():
+                fh.write(json.dumps({"k": key, "v": value}, separators=(",", ":")))
+                fh.write("\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        tmp.replace(self.path)
+
+        self._lines = len(snapshot)
+        self.compactions += 1
+
+
+_default_store: Optional[JournalStore] = None
+_default_lock = threading.Lock()
+
+
+def default_store() -> JournalStore:
+    """The app-wide store in `state_dir()`, created on first use."""
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                _default_store = JournalStore(state_dir() / JOURNAL_NAME)
+                atexit.register(_default_store.close)
+    return _default_store
+
+
+class PersistentSignal(Signal[T]):
+    """
+    A Signal whose value is restored on the next launch.
+
+    Values must be JSON-serializable. The stored value is read on the
+    first `get()`; until then nothing touches the disk.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        default: T = None,
+        store: Optional[JournalStore] = None,
+        name: Optional[str] = None,
+    ):
+        super().__init__(default, name=name or key)
+        self._key = key
+        self._store = store
+        self._restored = False
+
+    def _restore(self) -> None:
+        self._restored = True
+        if self._store is None:
+            self._store = default_store()
+        self._value = self._store.get(self._key, self._value)
+
+    def get(self) -> T:
+        if not self._restored:
+            self._restore()
+        return self._value
+
+    def set(self, value: T) -> None:
+        if not self._restored:
+            self._restore()
+        if self._value != value:
+            # put() serializes first, so a value that cannot be stored
+            # raises before any subscriber has seen it.
+            self._store.put(self._key, value)
+            super().set(value)
@@ -0,0 +1,260 @@
+"""
+Asynchronous data for components.
+
+`Resource(loader, deps)` is read inside `build()`. The first read for a
+(loader, deps) pair starts `loader()` on a worker thread and returns a
+pending handle; when the result arrives on the Tk thread, only the
+components that asked for those deps are scheduled for an update.
+
+- Identical reads made while a load is in flight share it.
+- A component that moved on to other deps is not updated by the old
+  result; a superseded load nobody waits for is cancelled if it has not
+  started yet.
+- Results are cached (LRU). `invalidate` marks entries stale: readers
+  keep getting the old value, flagged `stale`, while it reloads. While
+  new deps load for the first time, a component is handed the data it
+  showed last, also flagged `stale`, instead of nothing.
+
+`loader` and `deps` form the cache key: deps must be hashable, and
+`loader` should be a module-level function or a bound method rather
+than a lambda created in `build()`.
+"""
+
+import queue
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+
+from rocket.core import context as _context
+from rocket.core.state import _default_root
+from rocket.log import log
+
+T = TypeVar("T")
+
+# (loader, deps)
+ResourceKey = tuple[Callable[[], Any], tuple]
+
+_POLL_MS = 16
+_MAX_ENTRIES = 256
+
+
+class _Entry:
+    __slots__ = ("value", "error", "loaded", "stale", "future")
+
+    def __init__(self):
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.loaded = False
+        self.stale = False
+        self.future: Optional[Future] = None
+
+
+class ResourceCache:
+    """Loads, caches and delivers `Resource` data; see the module docstring."""
+
+    def __init__(self, workers: int = 4, max_entries: int = _MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[ResourceKey, _Entry]" = OrderedDict()
+        # Component -> key it read in its latest build / key of the data shown.
+        self._wants: "weakref.WeakKeyDictionary[Any, ResourceKey]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._shown: "weakref.WeakKeyDictionary[Any, ResourceKey]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._results: "queue.Queue[tuple[ResourceKey, _Entry, Future]]" = (
+            queue.Queue()
+        )
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="rocket-resource"
+        )
+        self._root = None
+        self._polling = False
+
+        self.hits = 0
+        self.loads = 0
+        self.discarded = 0
+
+    # ---- reading ----
+
+    def read(self, handle: "Resource", loader: Callable[[], Any], deps: tuple) -> None:
+        key: ResourceKey = (loader, deps)
+        consumer = _context._consumer
+
+        if consumer is not None:
+            previous = self._wants.get(consumer)
+            self._wants[consumer] = key
+            if previous is not None and previous != key:
+                self._release(previous)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry()
+            self._evict()
+            self._load(key, entry)
+        else:
+            self._entries.move_to_end(key)
+            if entry.stale and entry.future is None:
+                self._load(key, entry)
+            elif entry.loaded:
+                self.hits += 1
+
+        handle.pending = entry.future is not None
+        if entry.loaded:
+            handle.value = entry.value
+            handle.error = entry.error
+            handle.stale = entry.stale
+            if consumer is not None:
+                self._shown[consumer] = key
+            return
+
+        # First load for these deps: keep showing what this component had.
+        shown = self._shown.get(consumer) if consumer is not None else None
+        previous_entry = self._entries.get(shown) if shown is not None else None
+        if previous_entry is not None and previous_entry.loaded:
+            handle.value = previous_entry.value
+            handle.stale = True
+
+    def invalidate(self, loader: Optional[Callable[[], Any]] = None) -> None:
+        """Mark cached data of `loader` (all data if None) stale and reload it."""
+        keys = [key for key in self._entries if loader is None or key[0] == loader]
+        for key in keys:
+            self._entries[key].stale = True
+        self._notify(set(keys))
+
+    # ---- loading ----
+
+    def _load(self, key: ResourceKey, entry: _Entry) -> None:
+        self.loads += 1
+        root = self._root if self._root is not None else _default_root()
+        if root is None:
+            # No event loop to deliver to; load in place.
+            future: Future = Future()
+            try:
+                future.set_result(key[0]())
+            except Exception as exc:
+                future.set_exception(exc)
+            # The reader picks the result up directly; nothing to schedule.
+            self._complete(key, entry, future)
+            return
+
+        future = self._pool.submit(key[0])
+        entry.future = future
+        future.add_done_callback(
+            lambda f, key=key, entry=entry: self._results.put((key, entry, f))
+        )
+
+        self._root = root
+        if not self._polling:
+            self._polling = True
+            root.after(_POLL_MS, self._drain)
+
+    def _release(self, key: ResourceKey) -> None:
+        """Cancel the load for `key` if no component still waits for it."""
+        entry = self._entries.get(key)
+        if entry is None or entry.loaded or entry.future is None:
+            return
+        if key in self._wants.values():
+            return
+        if entry.future.cancel():
+            del self._entries[key]
+            self.discarded += 1
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.future is not None:
+                # Keep in-flight entries; they are evicted once loaded.
+                self._entries.move_to_end(key)
+                if all(e.future is not None for e in self._entries.values()):
+                    return
+                continue
+            del self._entries[key]
+
+    # ---- delivery (Tk thread) ----
+
+    def _drain(self) -> None:
+        delivered = set()
+        while True:
+            try:
+                key, entry, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if self._complete(key, entry, future):
+                delivered.add(key)
+
+        if delivered:
+            self._notify(delivered)
+
+        if any(e.future is not None for e in self._entries.values()):
+            self._root.after(_POLL_MS, self._drain)
+        else:
+            self._polling = False
+
+    def _complete(self, key: ResourceKey, entry: _Entry, future: Future) -> bool:
+        """Store a finished load; False if its result is no longer wanted."""
+        if entry.future is future:
+            entry.future = None
+        if future.cancelled() or self._entries.get(key) is not entry:
+            self.discarded += 1
+            return False
+
+        try:
+            entry.value = future.result()
+            entry.error = None
+        except Exception as exc:
+            log(f"Resource {getattr(key[0], '__qualname__', key[0])} failed: {exc}")
+            entry.error = exc
+        entry.loaded = True
+        entry.stale = False
+        return True
+
+    def _notify(self, keys: set) -> None:
+        # Only components whose latest build asked for these deps.
+        for component, key in list(self._wants.items()):
+            if key not in keys:
+                continue
+            if not component._mounted:
+                del self._wants[component]
+                continue
+            request = getattr(component, "_request_update_callback", None)
+            if request is not None:
+                request(component)
+
+
+# Shared instance used by `Resource`.
+resource_cache = ResourceCache()
+
+
+class Resource(Generic[T]):
+    """
+    Data from `loader()`, loaded off the Tk thread and keyed by `deps`.
+
+    Read it in `build()`: `value` is None until the first result (or
+    holds older data if `stale`), `pending` is True while loading and
+    `error` holds the loader's exception, if any.
+    """
+
+    __slots__ = ("value", "error", "pending", "stale")
+
+    def __init__(self, loader: Callable[[], T], deps: Sequence[Any] = ()):
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.pending = False
+        self.stale = False
+        resource_cache.read(self, loader, tuple(deps))
+
+    @property
+    def ready(self) -> bool:
+        """True when `value` holds data, possibly stale."""
+        return self.value is not None or (not self.pending and self.error is None)
+
+    def render(self, builder: Callable[[T], Any], fallback: Any = None) -> Any:
+        """`builder(value)` once data is available, `fallback` until then."""
+        return builder(self.value) if self.ready else fallback
+
+
+def invalidate(loader: Optional[Callable[[], Any]] = None) -> None:
+    """Reload `loader`'s data (all data if None), serving it stale meanwhile."""
+    resource_cache.invalidate(loader)
@@ -1,10 +1,31 @@
+import sys
+import time
 import weakref
-from typing import Callable, Generic, List, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Literal,
+    Optional,
+    TypeVar,
+)
 
 from rocket.log import log
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 T = TypeVar("T")
 
+PaceMode = Literal["debounce", "throttle", "sample"]
+
+# Callback qualname -> number of subscriptions refused (see `subscribe`).
+# Read by the memory diagnostics report.
+dropped_subscriptions: Dict[str, int] = {}
+
 
 class Signal(Generic[T]):
     """
@@ -31,7 +52,7 @@ class Signal(Generic[T]):
             old = self._value
             self._value = value
             if self._debug_mode:
-                log(f"Signal[{self._name}] changed: {old} -> {value}")
+                log("Signal[%s] changed: %s -> %s", self._name, old, value)
             self.notify()
 
     def notify(self) -> None:
@@ -44,7 +65,7 @@ class Signal(Generic[T]):
             if subscriber is not None:
                 try:
                     if self._debug_mode:
-                        log(f"Signal[{self._name}] notifying {subscriber}")
+                        log("Signal[%s] notifying %s", self._name, subscriber)
                     subscriber(self._value)
                     notified_count += 1
                 except Exception as e:
@@ -72,9 +93,11 @@ class Signal(Generic[T]):
 
             self._subscribers.append(ref)
             if self._debug_mode:
-                log(f"Signal[{self._name}] subscribed: {callback}")
+                log("Signal[%s] subscribed: %s", self._name, callback)
 
         except TypeError:
+            name = getattr(callback, "__qualname__", repr(callback))
+            dropped_subscriptions[name] = dropped_subscriptions.get(name, 0) + 1
             log(
                 f"Signal[{self._name}]: Could not create weak reference for {callback}. Subscription ignored to prevent leaks."
             )
@@ -89,5 +112,139 @@ class Signal(Generic[T]):
         for ref in to_remove:
             self._subscribers.remove(ref)
 
+    def debounced(self, ms: int, root: Optional["tk.Misc"] = None) -> "Signal[T]":
+        """Derived signal that updates once `ms` after the last change."""
+        return _PacedSignal(self, ms, "debounce", root)
+
+    def throttled(self, ms: int, root: Optional["tk.Misc"] = None) -> "Signal[T]":
+        """Derived signal that updates at most once every `ms` (first and last change)."""
+        return _PacedSignal(self, ms, "throttle", root)
+
+    def sample(self, ms: int, root: Optional["tk.Misc"] = None) -> "Signal[T]":
+        """Derived signal that picks up the latest value every `ms` while changing."""
+        return _PacedSignal(self, ms, "sample", root)
+
     def __repr__(self):
         return f"Signal<{self._name}>({self._value})"
+
+
+def _default_root() -> Optional["tk.Misc"]:
+    # Without tkinter imported there is no root; don't import it to find out.
+    tk = sys.modules.get("tkinter")
+    return tk._default_root if tk is not None else None
+
+
+class Pacer:
+    """
+    Rate-limits calls to `callback` with Tk `after` timers.
+
+    Offer values by calling the pacer; `callback` receives the latest
+    offered value according to `mode`:
+
+    - "debounce": once the offers pause for `ms`.
+    - "throttle": immediately, then at most once per `ms` (trailing value kept).
+    - "sample": every `ms` while offers keep arriving.
+
+    Timers run on the Tk thread of `root` (the default root if omitted).
+    Without a Tk root the callback is invoked directly.
+    """
+
+    __slots__ = ("ms", "mode", "_callback", "_root", "_timer", "_value", "_last")
+
+    def __init__(
+        self,
+        ms: int,
+        mode: PaceMode,
+        callback: Callable[[Any], None],
+        root: Optional["tk.Misc"] = None,
+    ):
+        self.ms = ms
+        self.mode = mode
+        self._callback = callback
+        self._root = root
+        self._timer: Optional[str] = None
+        self._value: Any = None
+        self._last = 0.0
+
+    @property
+    def pending(self) -> bool:
+        return self._timer is not None
+
+    def __call__(self, value: Any) -> None:
+        self._value = value
+        root = self._root or _default_root()
+
+        if root is None or self.ms <= 0:
+            self._emit()
+            return
+
+        if self.mode == "debounce":
+            self._cancel_timer(root)
+            self._schedule(root, self.ms)
+        elif self._timer is None:
+            delay = self.ms
+            if self.mode == "throttle":
+                elapsed = (time.perf_counter() - self._last) * 1000
+                if elapsed >= self.ms:
+                    self._emit()
+                    return
+                delay = int(self.ms - elapsed)
+            self._schedule(root, delay)
+
+    def flush(self) -> None:
+        """Deliver a pending value now."""
+        if self._timer is not None:
+            self._cancel_timer(self._root or _default_root())
+            self._emit()
+
+    def cancel(self) -> None:
+        """Drop a pending value."""
+        if self._timer is not None:
+            self._cancel_timer(self._root or _default_root())
+
+    def _schedule(self, root: "tk.Misc", delay: int) -> None:
+        import tkinter as tk
+
+        try:
+            self._timer = root.after(max(1, delay), self._fire)
+        except tk.TclError:
+            # Root already destroyed; nothing left to pace for.
+            self._timer = None
+            self._emit()
+
+    def _cancel_timer(self, root: Optional["tk.Misc"]) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None and root is not None:
+            import tkinter as tk
+
+            try:
+                root.after_cancel(timer)
+            except tk.TclError:
+                pass
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._emit()
+
+    def _emit(self) -> None:
+        self._last = time.perf_counter()
+        self._callback(self._value)
+
+
+class _PacedSignal(Signal[T]):
+    """Signal following `source` through a `Pacer`."""
+
+    def __init__(self, source: Signal[T], ms: int, mode: PaceMode, root=None):
+        super().__init__(source.get(), name=f"{source._name}.{mode}({ms})")
+        # Keeps the source reachable while this signal is in use; the
+        # source only holds a weak reference back.
+        self._source = source
+        self._pacer = Pacer(ms, mode, self.set, root)
+        source.subscribe(self._on_source)
+
+    def _on_source(self, value: T) -> None:
+        self._pacer(value)
+
+    def flush(self) -> None:
+        """Apply a pending source value immediately."""
+        self._pacer.flush()
@@ -1,22 +1,113 @@
-from collections.abc import Sequence
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Type
+from collections.abc import Mapping, Sequence
+from typing import Any, Optional, Type
+
+# Shared by every spec created without props; never mutated.
+_EMPTY_PROPS: Mapping[str, Any] = {}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a prop value, used by `structural_hash`."""
+    if isinstance(value, WidgetSpec):
+        return value.structural_hash()
+
+    kind = type(value)
+    if kind is tuple or kind is list:
+        return (kind, tuple(_freeze(item) for item in value))
+
+    try:
+        hash(value)
+    except TypeError:
+        # Unhashable values (dicts, sets...) only match themselves.
+        return ("id", id(value))
+    return value
 
 
-@dataclass
 class WidgetSpec:
     """
     Intermediate representation of a UI component (VNode).
-    This class is purely data and should be immutable-ish.
+
+    Specs are immutable once created: `props` and `children` are stored as
+    given (shared, not copied) and must not be mutated afterwards. Only
+    the renderer-owned `_instance` slot may change.
     """
 
+    __slots__ = (
+        "widget_class",
+        "props",
+        "children",
+        "key",
+        "is_component",
+        "_instance",
+        "_hash",
+    )
+
     widget_class: Type
-    props: Dict[str, Any] = field(default_factory=dict)
-    children: Sequence["WidgetSpec"] = ()
-    key: Optional[str] = None
+    props: Mapping[str, Any]
+    children: Sequence["WidgetSpec"]
+    key: Optional[str]
+    # Precomputed so the renderer never calls issubclass() per node.
+    is_component: bool
+
+    def __init__(
+        self,
+        widget_class: Type,
+        props: Optional[Mapping[str, Any]] = None,
+        children: Sequence["WidgetSpec"] = (),
+        key: Optional[str] = None,
+    ):
+        init = object.__setattr__
+        init(self, "widget_class", widget_class)
+        init(self, "props", _EMPTY_PROPS if props is None else props)
+        init(self, "children", children if type(children) is tuple else tuple(children))
+        init(self, "key", key)
+        init(self, "is_component", getattr(widget_class, "_is_rocket_component", False))
+        # Internal usage by the Renderer - do not touch in user code
+        init(self, "_instance", None)
+        init(self, "_hash", None)
 
-    # Internal usage by the Renderer - do not touch in user code
-    _instance: Any = None
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != "_instance":
+            raise AttributeError(f"WidgetSpec is immutable (cannot set {name!r})")
+        object.__setattr__(self, name, value)
+
+    def structural_hash(self) -> int:
+        """
+        Hash of class, key, props and children, computed once per spec.
+
+        Two specs with equal hashes describe the same UI, which lets the
+        renderer skip diffing identical subtrees.
+        """
+        cached = self._hash
+        if cached is None:
+            cached = hash(
+                (
+                    self.widget_class,
+                    self.key,
+                    tuple((k, _freeze(v)) for k, v in self.props.items()),
+                    tuple(child.structural_hash() for child in self.children),
+                )
+            )
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def same_as(self, other: "WidgetSpec") -> bool:
+        """Cheap structural equality: identical object or matching hash and props."""
+        if self is other:
+            return True
+        return (
+            self.widget_class is other.widget_class
+            and self.structural_hash() == other.structural_hash()
+            and self.props == other.props
+        )
+
+    def with_props(self, extra: Mapping[str, Any]) -> "WidgetSpec":
+        """Return a copy of this spec with `extra` merged into its props."""
+        return WidgetSpec(
+            self.widget_class,
+            {**self.props, **extra},
+            self.children,
+            self.key,
+        )
 
     def __repr__(self):
         return (
@@ -1,4 +1,24 @@
-from rocket.elements.components import RButton, RCheckbox, REntry, RLabel, RSwitch
-from rocket.elements.containers import RDiv
+from rocket.elements.components import (
+    RButton,
+    RCheckbox,
+    REntry,
+    RImage,
+    RLabel,
+    RSwitch,
+)
+from rocket.elements.containers import Provider, RDiv
+from rocket.elements.lists import RCanvasList
+from rocket.elements.table import Table
 
-__all__ = ["RButton", "RCheckbox", "REntry", "RLabel", "RSwitch", "RDiv"]
+__all__ = [
+    "Provider",
+    "RButton",
+    "RCanvasList",
+    "RCheckbox",
+    "REntry",
+    "RImage",
+    "RLabel",
+    "RSwitch",
+    "RDiv",
+    "Table",
+]
@@ -5,11 +5,13 @@ import customtkinter as ctk
 
 from rocket.core.component import StatefulComponent, StatelessComponent
 from rocket.core.context import BuildContext
-from rocket.core.state import Signal
+from rocket.core.state import Pacer, Signal
 from rocket.core.widget import WidgetSpec
 
 
 class _RLabel(StatefulComponent):
+    __slots__ = ()
+
     def __init__(self, props=None):
         super().__init__(props=props)
         text = self.props.get("text")
@@ -27,7 +29,7 @@ class _RLabel(StatefulComponent):
             widget_class=ctk.CTkLabel,
             props={
                 "text": text_val,
-                "font": self.props.get("font") or ("Helvetica", 14),
+                "font": context.theme.get_font(self.props.get("font") or "body"),
                 "text_color": text_color,
                 **{k: v for k, v in self.props.items() if k not in ["text", "font"]},
             },
@@ -41,6 +43,8 @@ def RLabel(text: Union[str, Signal[str]], font=None, **kwargs) -> WidgetSpec:
 
 
 class _RButton(StatefulComponent):
+    __slots__ = ()
+
     def __init__(self, props=None):
         super().__init__(props=props)
         text = self.props.get("text")
@@ -52,17 +56,18 @@ class _RButton(StatefulComponent):
         if isinstance(text_val, Signal):
             text_val = text_val.get()
 
-        return WidgetSpec(
-            widget_class=ctk.CTkButton,
-            props={
-                "text": text_val,
-                "command": self.props.get("command"),
-                "fg_color": context.theme.get_color("accent"),
-                "hover_color": context.theme.get_color("hover"),
-                "text_color": context.theme.get_color("text"),
-                **{k: v for k, v in self.props.items() if k not in ["text", "command"]},
-            },
-        )
+        props = {
+            "text": text_val,
+            "command": self.props.get("command"),
+            "fg_color": context.theme.get_color("accent"),
+            "hover_color": context.theme.get_color("hover"),
+            "text_color": context.theme.get_color("text"),
+            **{k: v for k, v in self.props.items() if k not in ["text", "command"]},
+        }
+        if props.get("font") is not None:
+            props["font"] = context.theme.get_font(props["font"])
+
+        return WidgetSpec(widget_class=ctk.CTkButton, props=props)
 
 
 def RButton(
@@ -74,11 +79,15 @@ def RButton(
 
 
 class _REntry(StatefulComponent):
+    __slots__ = ("_tk_var", "_pacer")
+
     _tk_var: Optional[tk.StringVar]
+    _pacer: Optional[Pacer]
 
     def __init__(self, props=None):
         super().__init__(props=props)
         self._tk_var = None
+        self._pacer = None
 
     def on_mount(self) -> None:
         super().on_mount()
@@ -89,40 +98,89 @@ class _REntry(StatefulComponent):
         self._tk_var = tk.StringVar(value=signal.get())
         tk_var = self._tk_var
 
+        for mode in ("debounce", "throttle", "sample"):
+            ms = self.props.get(f"{mode}_ms")
+            if ms:
+                self._pacer = Pacer(ms, mode, signal.set, self.context.window)
+                break
+        write = self._pacer or signal.set
+
         def on_tk_change(*args) -> None:
             val = tk_var.get()
-            if signal.get() != val:
-                signal.set(val)
+            if signal.get() != val or self._pacer is not None:
+                write(val)
 
         tk_var.trace_add("write", on_tk_change)
-
-        def on_sig_change(val: str) -> None:
-            if tk_var.get() != val:
-                tk_var.set(val)
-
-        signal.subscribe(on_sig_change)
         self.register_signal(signal)
+        signal.subscribe(self._on_signal_value)
+
+    def _on_signal_value(self, val: str) -> None:
+        if self._tk_var is not None and self._tk_var.get() != val:
+            # A programmatic change wins over keystrokes still being paced.
+            if self._pacer is not None:
+                self._pacer.cancel()
+            self._tk_var.set(val)
+
+    def on_unmount(self) -> None:
+        if self._pacer is not None:
+            self._pacer.flush()
+        signal = self.props.get("text_variable")
+        if signal:
+            signal.unsubscribe(self._on_signal_value)
+        super().on_unmount()
 
     def build(self, context: BuildContext) -> WidgetSpec:
         props = {
             "text_color": context.theme.get_color("text"),
             "fg_color": context.theme.get_color("bg"),
-            **{k: v for k, v in self.props.items() if k not in ["text_variable"]},
+            **{k: v for k, v in self.props.items() if k not in _ENTRY_OWN_PROPS},
         }
 
         if self._tk_var:
             props["textvariable"] = self._tk_var
 
+        if props.get("font") is not None:
+            props["font"] = context.theme.get_font(props["font"])
+
         return WidgetSpec(widget_class=ctk.CTkEntry, props=props)
 
 
-def REntry(text_variable: Signal[str] | None = None, **kwargs) -> WidgetSpec:
+_ENTRY_OWN_PROPS = frozenset(
+    ("text_variable", "debounce_ms", "throttle_ms", "sample_ms")
+)
+
+
+def REntry(
+    text_variable: Signal[str] | None = None,
+    *,
+    debounce_ms: int | None = None,
+    throttle_ms: int | None = None,
+    sample_ms: int | None = None,
+    **kwargs,
+) -> WidgetSpec:
+    """
+    Text entry bound to `text_variable`.
+
+    With `debounce_ms` the signal is written once typing pauses for that
+    long; with `throttle_ms` at most once per interval; with `sample_ms`
+    every interval while typing continues. In each case the signal lags
+    the visible text until the timer fires (or the entry is unmounted).
+    """
     return WidgetSpec(
-        widget_class=_REntry, props={"text_variable": text_variable, **kwargs}
+        widget_class=_REntry,
+        props={
+            "text_variable": text_variable,
+            "debounce_ms": debounce_ms,
+            "throttle_ms": throttle_ms,
+            "sample_ms": sample_ms,
+            **kwargs,
+        },
     )
 
 
 class _RCheckbox(StatefulComponent):
+    __slots__ = ()
+
     def __init__(self, props=None):
         super().__init__(props=props)
         variable = self.props.get("variable")
@@ -130,19 +188,20 @@ class _RCheckbox(StatefulComponent):
             self.register_signal(variable)
 
     def build(self, context: BuildContext) -> WidgetSpec:
-        return WidgetSpec(
-            widget_class=ctk.CTkCheckBox,
-            props={
-                "text": self.props["text"],
-                "command": self.props.get("command"),
-                "text_color": context.theme.get_color("text"),
-                **{
-                    k: v
-                    for k, v in self.props.items()
-                    if k not in ["text", "variable", "command"]
-                },
+        props = {
+            "text": self.props["text"],
+            "command": self.props.get("command"),
+            "text_color": context.theme.get_color("text"),
+            **{
+                k: v
+                for k, v in self.props.items()
+                if k not in ["text", "variable", "command"]
             },
-        )
+        }
+        if props.get("font") is not None:
+            props["font"] = context.theme.get_font(props["font"])
+
+        return WidgetSpec(widget_class=ctk.CTkCheckBox, props=props)
 
 
 def RCheckbox(
@@ -155,6 +214,8 @@ def RCheckbox(
 
 
 class _RSwitch(StatelessComponent):
+    __slots__ = ()
+
     def build(self, context: BuildContext) -> WidgetSpec:
         from rocket.render.native import NativeSwitch
 
@@ -165,3 +226,82 @@ def RSwitch(checked: bool = False, command=None, **kwargs) -> WidgetSpec:
     return WidgetSpec(
         widget_class=_RSwitch, props={"checked": checked, "command": command, **kwargs}
     )
+
+
+class _RImage(StatefulComponent):
+    __slots__ = ("_loaded",)
+
+    def __init__(self, props=None):
+        super().__init__(props=props)
+        # Bumped when a decode finishes so the component rebuilds with the image.
+        self._loaded = Signal(0, name="RImage")
+        self.register_signal(self._loaded)
+
+    def _on_loaded(self, image) -> None:
+        # A failed decode keeps the placeholder; the service does not retry it.
+        if image is not None:
+            self._loaded.set(self._loaded.get() + 1)
+
+    def build(self, context: BuildContext) -> WidgetSpec:
+        from customtkinter import ScalingTracker
+
+        from rocket.utils.images import image_service
+
+        width, height = self.props["size"]
+        is_dark = context.theme.isdark()
+        src = (self.props.get("dark_src") if is_dark else None) or self.props["src"]
+
+        image = image_service.request(
+            context.window,
+            src,
+            (width, height),
+            scale=ScalingTracker.get_widget_scaling(context.window),
+            theme="dark" if is_dark else "light",
+            callback=self._on_loaded,
+        )
+
+        props = {
+            "text": "",
+            "width": width,
+            "height": height,
+            **{
+                k: v
+                for k, v in self.props.items()
+                if k not in ["src", "dark_src", "size", "placeholder_color"]
+            },
+        }
+
+        if image is None:
+            props["fg_color"] = self.props.get(
+                "placeholder_color"
+            ) or context.theme.get_color("secondary")
+        else:
+            props["image"] = image
+            props["fg_color"] = "transparent"
+
+        return WidgetSpec(widget_class=ctk.CTkLabel, props=props)
+
+
+def RImage(
+    src: str,
+    size: tuple[int, int],
+    dark_src: str | None = None,
+    placeholder_color: str | None = None,
+    **kwargs,
+) -> WidgetSpec:
+    """
+    Image from `resources/images`, decoded off the Tk thread and cached.
+
+    A `placeholder_color` box of the same size is shown until decoding
+    finishes. `dark_src` is used instead of `src` in dark mode.
+    """
+    return WidgetSpec(
+        widget_class=_RImage,
+        props={
+            "src": src,
+            "size": size,
+            "dark_src": dark_src,
+            "placeholder_color": placeholder_color,
+            **kwargs,
+        },
+    )
@@ -1,10 +1,14 @@
+from typing import Any, Optional
+
 from rocket.core.component import Component
-from rocket.core.context import BuildContext
+from rocket.core.context import BuildContext, ProvidedValue
 from rocket.core.widget import WidgetSpec
 from rocket.render.native import NativeColumn
 
 
 class _RDiv(Component):
+    __slots__ = ()
+
     def build(self, context: BuildContext):
         return WidgetSpec(
             widget_class=NativeColumn, props=self.props, children=self.props["children"]
@@ -12,4 +16,55 @@ class _RDiv(Component):
 
 
 def RDiv(children=None, **kwargs) -> WidgetSpec:
-    return WidgetSpec(widget_class=_RDiv, props={"children": children or [], **kwargs})
+    return WidgetSpec(widget_class=_RDiv, props={"children": tuple(children or ()), **kwargs})
+
+
+class _Provider(Component):
+    __slots__ = ("_provided", "_scope", "_scope_parent")
+
+    def __init__(self, props=None):
+        super().__init__(props)
+        self._provided = ProvidedValue(self.props["value"])
+        self._scope: Optional[BuildContext] = None
+        self._scope_parent: Optional[BuildContext] = None
+
+    def on_unmount(self):
+        self._provided.close()
+        self._scope = self._scope_parent = None
+
+    def _child_context(self, context: BuildContext) -> BuildContext:
+        # Called on every build, after the renderer has set the new props.
+        self._provided.replace(self.props["value"])
+        if context is not self._scope_parent:
+            self._scope = context.scoped(self.props["context_key"], self._provided)
+            self._scope_parent = context
+        return self._scope
+
+    def build(self, context: BuildContext):
+        children = self.props["children"]
+        if len(children) == 1:
+            return children[0]
+        props = {
+            k: v
+            for k, v in self.props.items()
+            if k not in ("context_key", "value", "children")
+        }
+        return WidgetSpec(widget_class=NativeColumn, props=props, children=children)
+
+
+def Provider(key: str, value: Any, children=None, **kwargs) -> WidgetSpec:
+    """
+    Make `value` (usually a Signal) available to `children` via `context.use(key)`.
+
+    When the signal changes, only the components that read it are rebuilt.
+    Several children are wrapped in a column, like `RDiv`.
+    """
+    return WidgetSpec(
+        widget_class=_Provider,
+        props={
+            "context_key": key,
+            "value": value,
+            "children": tuple(children or ()),
+            **kwargs,
+        },
+    )
@@ -0,0 +1,57 @@
+from typing import Any, Callable, Optional, Sequence
+
+from rocket.core.component import StatelessComponent
+from rocket.core.context import BuildContext
+from rocket.core.widget import WidgetSpec
+
+_LIST_OWN_PROPS = frozenset(("font",))
+
+
+class _RCanvasList(StatelessComponent):
+    __slots__ = ()
+
+    def build(self, context: BuildContext) -> WidgetSpec:
+        from rocket.render.canvas_list import NativeCanvasList
+
+        theme = context.theme
+        props = {
+            "fg_color": theme.get_color("bg"),
+            "text_color": theme.get_color("text"),
+            "check_color": theme.get_color("subtext"),
+            "button_color": theme.get_color("accent"),
+            "button_text_color": theme.get_color("text"),
+            **{k: v for k, v in self.props.items() if k not in _LIST_OWN_PROPS},
+        }
+        props["font"] = theme.get_font(self.props.get("font") or "body")
+
+        return WidgetSpec(widget_class=NativeCanvasList, props=props)
+
+
+def RCanvasList(
+    items: Sequence[Any],
+    on_toggle: Optional[Callable[[int, bool], None]] = None,
+    on_action: Optional[Callable[[int], None]] = None,
+    action_text: Optional[str] = None,
+    row_height: int = 32,
+    **kwargs,
+) -> WidgetSpec:
+    """
+    Dense list drawn on one canvas, for large read-mostly data.
+
+    `items` holds strings or `(text, checked)` tuples (`checked=None`
+    hides the checkbox). `on_toggle(index, checked)` fires when a row is
+    clicked, `on_action(index)` when its `action_text` button is. The
+    list does not change items itself; pass updated `items` to reflect
+    a toggle.
+    """
+    return WidgetSpec(
+        widget_class=_RCanvasList,
+        props={
+            "items": items,
+            "on_toggle": on_toggle,
+            "on_action": on_action,
+            "action_text": action_text,
+            "row_height": row_height,
+            **kwargs,
+        },
+    )
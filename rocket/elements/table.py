@@ -0,0 +1,58 @@
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from rocket.core.component import StatelessComponent
+from rocket.core.context import BuildContext
+from rocket.core.widget import WidgetSpec
+from rocket.utils.columnar import TableData
+
+_TABLE_OWN_PROPS = frozenset(("font", "header_font"))
+
+
+class _RTable(StatelessComponent):
+    __slots__ = ()
+
+    def build(self, context: BuildContext) -> WidgetSpec:
+        from rocket.render.table import NativeTable
+
+        theme = context.theme
+        props = {
+            "fg_color": theme.get_color("bg"),
+            "text_color": theme.get_color("text"),
+            "header_color": theme.get_color("secondary"),
+            "stripe_color": theme.get_color("secondary"),
+            "grid_color": theme.get_color("accent"),
+            **{k: v for k, v in self.props.items() if k not in _TABLE_OWN_PROPS},
+        }
+        props["font"] = theme.get_font(self.props.get("font") or "body")
+        props["header_font"] = theme.get_font(self.props.get("header_font") or "title")
+
+        return WidgetSpec(widget_class=NativeTable, props=props)
+
+
+def Table(
+    data: TableData,
+    column_widths: Union[Sequence[int], Dict[str, int], None] = None,
+    row_height: int = 28,
+    on_select: Optional[Callable[[int], None]] = None,
+    on_sort: Optional[Callable[[Optional[str], bool], None]] = None,
+    **kwargs,
+) -> WidgetSpec:
+    """
+    Virtualized table over columnar `TableData`.
+
+    Clicking a header sorts by that column (again to reverse);
+    `on_select` receives the clicked row's index in the source data.
+    Sort or filter `data` directly to reorder the table without a
+    rebuild.
+    """
+    return WidgetSpec(
+        widget_class=_RTable,
+        props={
+            "data": data,
+            "column_widths": column_widths,
+            "row_height": row_height,
+            "on_select": on_select,
+            "on_sort": on_sort,
+            **kwargs,
+        },
+    )
@@ -14,11 +14,6 @@ from rocket.render.native import (
 _EMPTY_CHILDREN: tuple[WidgetSpec, ...] = ()
 
 
-def _native_props(props: dict) -> dict:
-    """Return props excluding structural keys."""
-    return {k: v for k, v in props.items() if k != "children"}
-
-
 class _Column(StatelessComponent):
     __slots__ = ()
 
@@ -26,7 +21,7 @@ class _Column(StatelessComponent):
         children: Sequence[WidgetSpec] = self.props["children"]
         return WidgetSpec(
             widget_class=NativeColumn,
-            props=_native_props(self.props),
+            props=self.props,
             children=children,
         )
 
@@ -54,7 +49,7 @@ class _Row(StatelessComponent):
         children: Sequence[WidgetSpec] = self.props["children"]
         return WidgetSpec(
             widget_class=NativeRow,
-            props=_native_props(self.props),
+            props=self.props,
             children=children,
         )
 
@@ -82,7 +77,7 @@ class _ScrollableColumn(StatelessComponent):
         children: Sequence[WidgetSpec] = self.props["children"]
         return WidgetSpec(
             widget_class=NativeScrollableColumn,
-            props=_native_props(self.props),
+            props=self.props,
             children=children,
         )
 
@@ -108,7 +103,7 @@ class _ScrollableRow(StatelessComponent):
         children: Sequence[WidgetSpec] = self.props["children"]
         return WidgetSpec(
             widget_class=NativeScrollableRow,
-            props=_native_props(self.props),
+            props=self.props,
             children=children,
         )
 
@@ -1,19 +1,206 @@
+"""
+Framework logging.
+
+Records are handed to a `QueueHandler` and written to stderr by a
+`QueueListener` thread, so the Tk thread never blocks on I/O. INFO and
+above, including every `event()`, is also kept in a bounded ring buffer
+in all builds, which `dump_recent` writes out when the app crashes.
+Release builds only print warnings and errors.
+
+Hot paths should either pass %-style arguments (`log("x=%s", x)`),
+which are only formatted when DEBUG is enabled, or check `enabled()`
+before building an expensive message.
+"""
+
+import atexit
+import collections
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, TextIO
 
-from rocket.config import RELEASE
+RING_SIZE = 512
+RING_LEVEL = logging.INFO
 
 _logger = logging.getLogger("app")
+_configured = False
+_debug = False
+_listener: Optional[logging.handlers.QueueListener] = None
+_hooks_installed = False
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records; `events()` converts them to dicts."""
+
+    def __init__(self, capacity: int = RING_SIZE, level: int = RING_LEVEL):
+        super().__init__(level)
+        # Records are converted only when dumped.
+        self.records: Deque[logging.LogRecord] = collections.deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        # deque.append is atomic; skip the handler lock.
+        if record.levelno >= self.level:
+            self.records.append(record)
+        return True
+
+    def events(self) -> List[Dict[str, Any]]:
+        events = []
+        for record in list(self.records):
+            item = {
+                "t": record.created,
+                "level": record.levelname,
+                "thread": record.threadName,
+                "msg": record.getMessage(),
+            }
+            item.update(getattr(record, "fields", None) or {})
+            events.append(item)
+        return events
+
+
+ring = RingBufferHandler()
+
+
+def _configure() -> None:
+    # Deferred so importing `rocket.log` does not load `project_config.py`.
+    global _configured, _debug, _listener
+    _configured = True
+
+    if _logger.handlers:
+        _debug = _logger.isEnabledFor(logging.DEBUG)
+        return
+
+    from rocket.config import RELEASE
 
-if not _logger.handlers:
     _logger.setLevel(logging.INFO if RELEASE else logging.DEBUG)
+    _logger.propagate = False
+    _debug = _logger.isEnabledFor(logging.DEBUG)
 
-    handler = logging.StreamHandler()
+    # The console level is separate so release dumps keep INFO records.
+    stream = logging.StreamHandler()
+    stream.setLevel(logging.WARNING if RELEASE else logging.DEBUG)
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(threadName)s: %(message)s"
     )
-    handler.setFormatter(formatter)
-    _logger.addHandler(handler)
+    stream.setFormatter(formatter)
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        records, stream, respect_handler_level=True
+    )
+    _listener.start()
+    # Drains whatever is still queued at interpreter exit.
+    atexit.register(_listener.stop)
+
+    _logger.addHandler(logging.handlers.QueueHandler(records))
+    _logger.addHandler(ring)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    A child of the framework logger, sharing its queue and ring buffer.
+
+    Handlers are attached on the first `log()`/`enabled()` call or when
+    the window installs crash dumps, whichever comes first.
+    """
+    return _logger.getChild(name)
+
+
+def enabled() -> bool:
+    """True when debug messages are recorded; use to guard costly messages."""
+    if not _configured:
+        _configure()
+    return _debug
+
+
+def log(message: str, *args: Any) -> None:
+    if not _configured:
+        _configure()
+    if _debug:
+        _logger.debug(message, *args)
+
+
+def event(name: str, **fields: Any) -> None:
+    """Record a structured event; `fields` are kept in the ring buffer."""
+    if not _configured:
+        _configure()
+    _logger.info(name, extra={"fields": fields})
+
+
+# ============================================================
+# Crash dumps
+# ============================================================
+
+
+def dump_recent(file: Optional[TextIO] = None) -> None:
+    """Write the buffered events as JSON lines (stderr by default)."""
+    out = file or sys.stderr
+    for item in ring.events():
+        out.write(json.dumps(item, default=repr) + "\n")
+    out.flush()
+
+
+def _write_crash_dump(exc_type, exc, tb) -> None:
+    import traceback
+
+    # The process is already failing; a dump problem must not mask it.
+    try:
+        from rocket.utils.paths import cache_dir
+
+        path = cache_dir() / f"crash-{time.strftime('%Y%m%d-%H%M%S')}.log"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as fh:
+            traceback.print_exception(exc_type, exc, tb, file=fh)
+            fh.write("\n# recent events\n")
+            dump_recent(fh)
+    except Exception:
+        return
+    print(f"[rocket] Crash log written to {path}", file=sys.stderr)
+
+
+def install_crash_dump(window=None) -> None:
+    """
+    Dump the ring buffer on uncaught exceptions.
+
+    Covers the main thread, other threads and, if `window` is given,
+    exceptions raised in Tk callbacks.
+    """
+    global _hooks_installed
+    if not _configured:
+        _configure()
+    if not _hooks_installed:
+        _hooks_installed = True
+        _install_process_hooks()
+
+    if window is not None:
+        report = window.report_callback_exception
+
+        def report_callback_exception(exc_type, exc, tb):
+            _write_crash_dump(exc_type, exc, tb)
+            report(exc_type, exc, tb)
+
+        window.report_callback_exception = report_callback_exception
+
+
+def _install_process_hooks() -> None:
+    previous = sys.excepthook
+
+    def excepthook(exc_type, exc, tb):
+        _write_crash_dump(exc_type, exc, tb)
+        previous(exc_type, exc, tb)
+
+    sys.excepthook = excepthook
+
+    previous_thread = threading.excepthook
 
+    def thread_excepthook(args):
+        _write_crash_dump(args.exc_type, args.exc_value, args.exc_traceback)
+        previous_thread(args)
 
-def log(message: str) -> None:
-    _logger.debug(message)
+    threading.excepthook = thread_excepthook
@@ -8,12 +8,19 @@ class BasePage:
     Manages the top-level Renderer and Theme context.
     """
 
+    # Restore the last rendered UI from disk on launch (see rocket.render.snapshot).
+    snapshot = False
+
     def __init__(self, window, theme, data_provider=None):
         self.window = window
         self.theme = theme
         self.data_provider = data_provider or {}
         
         self.renderer = Renderer(self.window)
+        self._rendered = False
+
+        if self.snapshot:
+            self.window.bind("<Destroy>", self._on_destroy, add="+")
 
         # Subscribe to theme changes
         if hasattr(self.theme, "subscribe"):
@@ -22,10 +29,34 @@ class BasePage:
     def _on_theme_change(self, _):
         self.render()
 
+    def _snapshot_path(self):
+        from rocket.render.snapshot import snapshot_path
+
+        return snapshot_path(type(self).__qualname__)
+
+    def _on_destroy(self, event):
+        # <Destroy> also fires for every child of the window.
+        if event.widget is self.window and self._rendered:
+            from rocket.render.snapshot import save
+
+            save(self._snapshot_path(), self.renderer._tree)
+
     def render(self):
         """Rerender the entire page."""
         # Create context
         context = BuildContext(window=self.window, theme=self.theme, **self.data_provider)
+
+        if self.snapshot and not self._rendered and self.renderer._snapshot is None:
+            from rocket.render.snapshot import load
+
+            snapshot = load(self._snapshot_path(), self.theme)
+            if snapshot is not None:
+                # Show the last session's UI now; build for real once it is drawn.
+                self.renderer.mount_snapshot(snapshot, context)
+                self.window.after_idle(lambda: self.window.after(0, self.render))
+                return
+
+        self._rendered = True
         
         # Build root spec
         root_spec = self.build(context)
@@ -1,13 +1,31 @@
-from typing import Dict, Type
+import importlib
+from typing import Dict, List, Optional, Type, Union
 
 from rocket.core.context import BuildContext
+from rocket.core.widget import WidgetSpec
+from rocket.log import log
 from rocket.render.renderer import Renderer
 
+# A page class, or an import string "package.module:PageClass".
+PageTarget = Union[Type, str]
+
+
+def _import_page(target: str) -> Type:
+    module_name, _, attr = target.partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
 
 class Router:
     """
     Simple SPA router.
     Controls which page is currently rendered.
+
+    Routes may be registered as import strings; their modules are only
+    imported on first navigation, or earlier by `prefetch` while the
+    window is idle.
     """
 
     def __init__(self, window, theme):
@@ -15,38 +33,114 @@ class Router:
         self.theme = theme
         self.renderer = Renderer(window)
 
-        self._routes: Dict[str, Type] = {}
+        self._routes: Dict[str, PageTarget] = {}
         self._current_page = None
+        self.current: Optional[str] = None
+
+        # Routes to warm after the first navigation, and idle work queue.
+        self._likely: List[str] = []
+        self._pending: List[tuple[str, bool]] = []
+        self._prefetching = False
+        self._prebuilt: Dict[str, WidgetSpec] = {}
 
         # re-render on theme change
         if hasattr(theme, "subscribe"):
-            theme.subscribe(lambda _: self.render())
+            theme.subscribe(self._on_theme_change)
+
+    def _on_theme_change(self, _) -> None:
+        # Pre-built specs captured the old theme's colors.
+        self._prebuilt.clear()
+        self.render()
 
-    def register(self, name: str, page_cls: Type) -> None:
-        """Register a page under a route name."""
-        self._routes[name] = page_cls
+    def register(self, name: str, page: PageTarget, *, prefetch: bool = False) -> None:
+        """
+        Register a page under a route name.
+
+        `page` is a page class or an import string such as
+        "app.settings:SettingsPage". With `prefetch=True` the route is
+        imported in idle time once the first page has been shown.
+        """
+        self._routes[name] = page
+        if prefetch:
+            self._likely.append(name)
+
+    def _resolve(self, name: str) -> Type:
+        target = self._routes[name]
+        if isinstance(target, str):
+            target = _import_page(target)
+            # Cache so later navigations skip the import machinery.
+            self._routes[name] = target
+        return target
 
     def go(self, name: str) -> None:
         """Navigate to a page."""
         if name not in self._routes:
             raise ValueError(f"Route '{name}' not registered")
 
-        self._current_page = self._routes[name]
+        first = self.current is None
+        self._current_page = self._resolve(name)
+        self.current = name
         self.render()
 
-    def render(self) -> None:
-        """Render the active page."""
-        if not self._current_page:
-            return
-
-        page = self._current_page(self.window)
+        if first and self._likely:
+            self.prefetch(*self._likely)
 
-        context = BuildContext(
+    def _context(self) -> BuildContext:
+        return BuildContext(
             window=self.window,
             theme=self.theme,
             router=self,
         )
 
-        root = page.build(context)
+    def render(self) -> None:
+        """Render the active page."""
+        if not self._current_page:
+            return
+
+        root = self._prebuilt.pop(self.current, None)
+        context = self._context()
+        if root is None:
+            page = self._current_page(self.window)
+            root = page.build(context)
         if root:
             self.renderer.render(root, context)
+
+    # ============================================================
+    # Prefetching
+    # ============================================================
+
+    def prefetch(self, *names: str, build: bool = False) -> None:
+        """
+        Warm routes the user is likely to visit next, one per idle slot.
+
+        Each route's module is imported; with `build=True` its spec is
+        also built off-screen and used by the next `go` to that route.
+        """
+        for name in names:
+            if name not in self._routes:
+                raise ValueError(f"Route '{name}' not registered")
+            self._pending.append((name, build))
+
+        if self._pending and not self._prefetching:
+            self._prefetching = True
+            self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        # after(0) between steps lets pending input run before the next one.
+        self.window.after_idle(lambda: self.window.after(0, self._prefetch_step))
+
+    def _prefetch_step(self) -> None:
+        if not self._pending:
+            self._prefetching = False
+            return
+
+        name, build = self._pending.pop(0)
+        try:
+            page_cls = self._resolve(name)
+            if build and name != self.current and name not in self._prebuilt:
+                self._prebuilt[name] = page_cls(self.window).build(self._context())
+        except Exception as exc:
+            # The route still loads (and reports the error) on navigation.
+            log(f"Router: prefetch of '{name}' failed: {exc}")
+
+        self._schedule_prefetch()
@@ -0,0 +1,332 @@
+import math
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from customtkinter import CTkFrame, CTkScrollbar, ScalingTracker
+
+# (text, checked); `checked` is None for rows without a checkbox.
+ListRow = Tuple[str, Optional[bool]]
+
+_OWN_OPTIONS = (
+    "items",
+    "row_height",
+    "font",
+    "text_color",
+    "check_color",
+    "button_color",
+    "button_text_color",
+    "action_text",
+    "on_toggle",
+    "on_action",
+)
+
+# Unscaled sizes; multiplied by the widget scaling when drawn.
+_PAD = 8
+_BOX = 18
+_BUTTON_WIDTH = 64
+
+
+def _row(item: Any) -> ListRow:
+    if isinstance(item, str):
+        return item, None
+    text, checked = item[0], item[1] if len(item) > 1 else None
+    return str(text), None if checked is None else bool(checked)
+
+
+def _round_rect(x1: float, y1: float, x2: float, y2: float, r: float) -> List[float]:
+    """Points for a smoothed polygon approximating a rounded rectangle."""
+    return [
+        x1 + r, y1, x2 - r, y1, x2, y1, x2, y1 + r,
+        x2, y2 - r, x2, y2, x2 - r, y2, x1 + r, y2,
+        x1, y2, x1, y2 - r, x1, y1 + r, x1, y1,
+    ]  # fmt: skip
+
+
+class _Slot:
+    """Canvas items for one visible row, reused as the list scrolls."""
+
+    __slots__ = ("box", "tick", "text", "button", "label", "drawn")
+
+    def __init__(self, canvas: tk.Canvas):
+        hidden = {"state": "hidden"}
+        self.box = canvas.create_rectangle(0, 0, 0, 0, width=2, **hidden)
+        self.tick = canvas.create_line(
+            0, 0, 0, 0, 0, 0, width=2, capstyle="round", **hidden
+        )
+        self.text = canvas.create_text(0, 0, anchor="w", **hidden)
+        self.button = canvas.create_polygon(0, 0, 0, 0, 0, 0, smooth=True, **hidden)
+        self.label = canvas.create_text(0, 0, **hidden)
+        # (index, row, y, width, style version) last drawn; None = hidden.
+        self.drawn: Optional[tuple] = None
+
+
+class NativeCanvasList(CTkFrame):
+    """
+    Read-mostly list drawn on a single canvas.
+
+    Only the visible rows exist as canvas items (a checkbox glyph, the
+    text and an action button per row); scrolling rebinds those slots to
+    other rows and redraws only slots whose content or position changed.
+    Clicks are mapped back to a row and region by geometry, so the
+    whole list is one Tk widget however many items it shows.
+    """
+
+    def __init__(self, master, **kwargs):
+        own = {key: kwargs.pop(key) for key in _OWN_OPTIONS if key in kwargs}
+        kwargs.pop("children", None)
+        super().__init__(master, **kwargs)
+
+        self._items: Sequence[Any] = ()
+        self._row_height = 32
+        self._font: Any = None
+        self._colors: Dict[str, str] = {
+            "text_color": "#000000",
+            "check_color": "#3F3F46",
+            "button_color": "#D0D0D0",
+            "button_text_color": "#000000",
+        }
+        self._action_text: Optional[str] = None
+        self._on_toggle: Optional[Callable[[int, bool], None]] = None
+        self._on_action: Optional[Callable[[int], None]] = None
+        self._style = 0
+
+        self._offset = 0
+        self._slots: List[_Slot] = []
+
+        self._canvas = tk.Canvas(
+            self, highlightthickness=0, borderwidth=0, bg=self._canvas_bg()
+        )
+        self._scrollbar = CTkScrollbar(self, command=self._yview)
+        self._scrollbar.pack(side="right", fill="y")
+        self._canvas.pack(side="left", fill="both", expand=True)
+
+        self._canvas.bind("<Configure>", lambda _e: self._redraw())
+        self._canvas.bind("<Button-1>", self._on_click)
+        self._canvas.bind("<MouseWheel>", self._on_wheel)
+        self._canvas.bind("<Button-4>", lambda _e: self._scroll_by(-3 * self._row_px))
+        self._canvas.bind("<Button-5>", lambda _e: self._scroll_by(3 * self._row_px))
+
+        self._apply(own)
+
+    # ---- options ----
+
+    def configure(self, require_redraw=False, **kwargs):
+        own = {key: kwargs.pop(key) for key in _OWN_OPTIONS if key in kwargs}
+        if kwargs:
+            super().configure(require_redraw=require_redraw, **kwargs)
+            if "fg_color" in kwargs:
+                self._canvas.configure(bg=self._canvas_bg())
+        if own:
+            self._apply(own)
+
+    def _apply(self, options: Dict[str, Any]) -> None:
+        restyle = False
+        for key, value in options.items():
+            if key == "items":
+                self._items = value or ()
+            elif key == "row_height":
+                self._row_height = value
+                restyle = True
+            elif key == "font":
+                self._font = value
+                restyle = True
+            elif key == "action_text":
+                self._action_text = value
+                restyle = True
+            elif key == "on_toggle":
+                self._on_toggle = value
+            elif key == "on_action":
+                self._on_action = value
+            else:
+                self._colors[key] = value
+                restyle = True
+
+        if restyle:
+            # Invalidates every slot's cached drawing.
+            self._style += 1
+        self._clamp_offset()
+        self._redraw()
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._canvas.configure(bg=self._canvas_bg())
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+        # Glyph sizes depend on the scaling; redraw every slot.
+        self._style += 1
+        self._clamp_offset()
+        self._redraw()
+
+    def _canvas_bg(self) -> str:
+        return self._apply_appearance_mode(
+            self._fg_color if self._fg_color != "transparent" else self._bg_color
+        )
+
+    @property
+    def _row_px(self) -> int:
+        return max(1, round(self._row_height * ScalingTracker.get_widget_scaling(self)))
+
+    # ---- scrolling ----
+
+    def _content_height(self) -> int:
+        return len(self._items) * self._row_px
+
+    def _clamp_offset(self) -> None:
+        view = max(1, self._canvas.winfo_height())
+        self._offset = max(0, min(self._offset, self._content_height() - view))
+
+    def _scroll_by(self, pixels: int) -> None:
+        self._offset += pixels
+        self._clamp_offset()
+        self._redraw()
+
+    def _on_wheel(self, event) -> None:
+        # Windows reports multiples of 120, macOS small deltas.
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll_by(-step * 3 * self._row_px)
+
+    def _yview(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        view = max(1, self._canvas.winfo_height())
+        if action == "moveto":
+            self._offset = round(float(value) * self._content_height())
+        elif unit == "pages":
+            self._offset += int(value) * view
+        else:
+            self._offset += int(value) * self._row_px
+        self._clamp_offset()
+        self._redraw()
+
+    # ---- drawing ----
+
+    def _redraw(self) -> None:
+        canvas = self._canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        row_px = self._row_px
+        count = len(self._items)
+
+        needed = math.ceil(height / row_px) + 1
+        while len(self._slots) < needed:
+            self._slots.append(_Slot(canvas))
+
+        first = self._offset // row_px
+        shift = -(self._offset % row_px)
+
+        for i, slot in enumerate(self._slots):
+            index = first + i
+            if i >= needed or index >= count:
+                if slot.drawn is not None:
+                    for item in (slot.box, slot.tick, slot.text, slot.button, slot.label):
+                        canvas.itemconfigure(item, state="hidden")
+                    slot.drawn = None
+                continue
+
+            row = _row(self._items[index])
+            top = shift + i * row_px
+            state = (index, row, top, width, self._style)
+            if slot.drawn != state:
+                self._draw_slot(slot, row, top, width, row_px, slot.drawn)
+                slot.drawn = state
+
+        content = self._content_height()
+        if content <= 0:
+            self._scrollbar.set(0.0, 1.0)
+        else:
+            self._scrollbar.set(
+                self._offset / content, min(1.0, (self._offset + height) / content)
+            )
+
+    def _draw_slot(
+        self,
+        slot: _Slot,
+        row: ListRow,
+        top: int,
+        width: int,
+        row_px: int,
+        previous: Optional[tuple],
+    ) -> None:
+        canvas = self._canvas
+        text, checked = row
+        mid = top + row_px / 2
+        colors = self._colors
+        restyled = previous is None or previous[4] != self._style
+        scaled = self._apply_widget_scaling
+        pad, box = scaled(_PAD), scaled(_BOX)
+
+        # Checkbox glyph
+        if checked is None:
+            canvas.itemconfigure(slot.box, state="hidden")
+            canvas.itemconfigure(slot.tick, state="hidden")
+            text_x = pad
+        else:
+            x1, y1 = pad, mid - box / 2
+            canvas.coords(slot.box, x1, y1, x1 + box, y1 + box)
+            canvas.itemconfigure(
+                slot.box,
+                state="normal",
+                outline=colors["check_color"],
+                fill=colors["check_color"] if checked else "",
+            )
+            canvas.coords(
+                slot.tick,
+                x1 + scaled(4), mid, x1 + scaled(8), mid + scaled(4),
+                x1 + box - scaled(4), mid - scaled(5),
+            )  # fmt: skip
+            canvas.itemconfigure(
+                slot.tick,
+                state="normal" if checked else "hidden",
+                fill=colors["button_text_color"],
+            )
+            text_x = pad * 2 + box
+
+        # Text
+        canvas.coords(slot.text, text_x, mid)
+        if previous is None or previous[1][0] != text or restyled:
+            canvas.itemconfigure(
+                slot.text, text=text, fill=colors["text_color"], font=self._font
+            )
+        canvas.itemconfigure(slot.text, state="normal")
+
+        # Action button
+        if self._action_text:
+            inset = scaled(4)
+            x2 = width - pad
+            x1 = x2 - scaled(_BUTTON_WIDTH)
+            canvas.coords(
+                slot.button,
+                *_round_rect(x1, top + inset, x2, top + row_px - inset, scaled(6)),
+            )
+            canvas.coords(slot.label, (x1 + x2) / 2, mid)
+            if restyled:
+                canvas.itemconfigure(slot.button, fill=colors["button_color"])
+                canvas.itemconfigure(
+                    slot.label,
+                    text=self._action_text,
+                    fill=colors["button_text_color"],
+                    font=self._font,
+                )
+            canvas.itemconfigure(slot.button, state="normal")
+            canvas.itemconfigure(slot.label, state="normal")
+        else:
+            canvas.itemconfigure(slot.button, state="hidden")
+            canvas.itemconfigure(slot.label, state="hidden")
+
+    # ---- hit testing ----
+
+    def _on_click(self, event) -> None:
+        index = (self._offset + event.y) // self._row_px
+        if not 0 <= index < len(self._items):
+            return
+
+        _, checked = _row(self._items[index])
+        width = self._canvas.winfo_width()
+
+        button_left = width - self._apply_widget_scaling(_PAD + _BUTTON_WIDTH)
+        if self._action_text and event.x >= button_left:
+            if self._on_action:
+                self._on_action(index)
+        elif checked is not None:
+            # Like CTkCheckBox, the row text toggles too.
+            if self._on_toggle:
+                self._on_toggle(index, not checked)
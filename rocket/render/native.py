@@ -20,7 +20,34 @@ class NativeRow(CTkFrame):
         super().__init__(*args, **kwargs)
 
 
-class NativeScrollableColumn(CTkScrollableFrame):
+class _ScrollRegionBatch:
+    """
+    Lets the renderer hold scroll-region updates during a mount.
+
+    CTkScrollableFrame re-measures its canvas on every <Configure> of the
+    inner frame, i.e. once per packed child; while a batch is open that
+    binding is removed and the region is refreshed once at the end.
+    """
+
+    _batch_depth = 0
+
+    def begin_batch(self) -> None:
+        if self._batch_depth == 0:
+            self.unbind("<Configure>")
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.bind("<Configure>", self._update_scroll_region)
+            self.after_idle(self._update_scroll_region)
+
+    def _update_scroll_region(self, _event=None) -> None:
+        canvas = self._parent_canvas
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+
+class NativeScrollableColumn(_ScrollRegionBatch, CTkScrollableFrame):
     layout_strategy = "column"
 
     def __init__(self, *args, **kwargs):
@@ -29,7 +56,7 @@ class NativeScrollableColumn(CTkScrollableFrame):
         super().__init__(*args, **kwargs)
 
 
-class NativeScrollableRow(CTkScrollableFrame):
+class NativeScrollableRow(_ScrollRegionBatch, CTkScrollableFrame):
     layout_strategy = "row"
 
     def __init__(self, *args, **kwargs):
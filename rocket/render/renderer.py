@@ -1,45 +1,201 @@
-import logging
 import tkinter as tk
 from typing import Iterable, Optional
 
-from rocket.core.component import Component
-from rocket.core.context import BuildContext
+from rocket.core.context import BuildContext, build_component
 from rocket.core.widget import WidgetSpec
+from rocket.log import get_logger
+from rocket.render.scheduler import UpdateScheduler, update_scheduler
 
-logger = logging.getLogger("rocket.renderer")
+logger = get_logger("renderer")
 
 _LAYOUT_PROPS = ("side", "expand", "fill", "padx", "pady")
 
+# Props consumed by the renderer itself, never forwarded to the widget.
+_RENDERER_PROPS = frozenset(("expand", "side", "children"))
+
+
+def _native_spec(spec: Optional[WidgetSpec]) -> Optional[WidgetSpec]:
+    """Follow components down to the native spec they rendered."""
+    while spec is not None and spec.is_component:
+        spec = getattr(spec._instance, "_rendered_child", None)
+    return spec
+
+
+def _pack(widget: tk.Widget, pack_kwargs: dict) -> None:
+    try:
+        widget.pack(**pack_kwargs)
+    except Exception as exc:
+        logger.warning("Could not pack widget %s: %s", widget, exc)
+
+
+class _MountTransaction:
+    """
+    Defers geometry work while a subtree is mounted.
+
+    Widgets are created unpacked. On commit the inner widgets are packed
+    first (in creation order, so sibling order is kept), while their
+    containers still have propagation disabled; the subtree roots are
+    packed last, so Tk lays out the finished subtree once. Scrollable
+    containers refresh their scroll region once per commit.
+    """
+
+    __slots__ = ("_created", "_inner", "_roots", "_held", "_batched")
+
+    def __init__(self):
+        self._created: set[int] = set()
+        self._inner: list[tuple[tk.Widget, dict]] = []
+        self._roots: list[tuple[tk.Widget, dict]] = []
+        self._held: list[tk.Widget] = []
+        self._batched: dict[int, tk.Widget] = {}
+
+    def add(self, widget: tk.Widget, parent: tk.Widget, pack_kwargs: dict) -> None:
+        if id(parent) in self._created:
+            self._inner.append((widget, pack_kwargs))
+        else:
+            self._roots.append((widget, pack_kwargs))
+            self._batch(parent)
+
+        self._created.add(id(widget))
+        if hasattr(widget, "layout_strategy"):
+            try:
+                widget.pack_propagate(False)
+                self._held.append(widget)
+            except Exception:
+                pass
+            self._batch(widget)
+
+    def _batch(self, container: tk.Widget) -> None:
+        begin = getattr(container, "begin_batch", None)
+        if begin is not None and id(container) not in self._batched:
+            begin()
+            self._batched[id(container)] = container
+
+    def commit(self) -> None:
+        for widget, pack_kwargs in self._inner:
+            _pack(widget, pack_kwargs)
+
+        for widget in self._held:
+            try:
+                widget.pack_propagate(True)
+            except Exception:
+                pass
+
+        for widget, pack_kwargs in self._roots:
+            _pack(widget, pack_kwargs)
+
+        for container in self._batched.values():
+            container.end_batch()
+
 
 class Renderer:
     """Turns WidgetSpec trees into concrete Tkinter widgets."""
 
-    __slots__ = ("root", "_tree")
-
-    def __init__(self, root: tk.Widget):
+    __slots__ = (
+        "root",
+        "_tree",
+        "_context",
+        "_skip_identical",
+        "_scheduler",
+        "_txn",
+        "_snapshot",
+        "_hydrate_next",
+        "_reorders",
+    )
+
+    def __init__(self, root: tk.Widget, scheduler: Optional[UpdateScheduler] = None):
         self.root = root
+        # Shared across renderers so one signal change flushes every window once.
+        self._scheduler = scheduler or update_scheduler
+        self._txn: Optional[_MountTransaction] = None
+        # Snapshot tree shown before the first real render (see mount_snapshot).
+        self._snapshot: Optional[WidgetSpec] = None
+        self._hydrate_next: Optional[WidgetSpec] = None
+        self._reorders: list[tuple[tk.Widget, list[tk.Widget]]] = []
         self._tree: Optional[WidgetSpec] = None
+        self._context: Optional[BuildContext] = None
+        # Identical subtrees may only be skipped while the context is
+        # unchanged; a new context (e.g. theme switch) must reach every node.
+        self._skip_identical = False
 
     def render(self, spec: WidgetSpec, context: BuildContext) -> None:
         logger.debug("Renderer: render cycle start")
 
-        if self._tree is None:
+        self._skip_identical = context is self._context
+        self._context = context
+
+        if self._tree is None and self._snapshot is not None:
+            self._hydrate(spec, context)
+        elif self._tree is None:
             self._mount_node(spec, self.root, context)
         else:
             self._update_node(self._tree, spec, self.root, context)
 
         self._tree = spec
+        self._skip_identical = True
         logger.debug("Renderer: render cycle complete")
 
+    def mount_snapshot(self, spec: WidgetSpec, context: BuildContext) -> None:
+        """
+        Show a native-only snapshot tree before the first real render.
+
+        The next `render` hydrates it: widgets whose position and class
+        still match are kept and reconfigured, the rest are replaced.
+        """
+        self._mount_node(spec, self.root, context)
+        self._snapshot = spec
+
+    def _hydrate(self, spec: WidgetSpec, context: BuildContext) -> None:
+        self._hydrate_next, self._snapshot = self._snapshot, None
+        self._reorders = []
+        try:
+            self._mount_node(spec, self.root, context)
+        finally:
+            if self._hydrate_next is not None:
+                self._unmount_node(self._hydrate_next)
+                self._hydrate_next = None
+
+        # Replaced widgets were packed after their kept siblings.
+        for _parent, widgets in self._reorders:
+            for previous, widget in zip(widgets, widgets[1:]):
+                try:
+                    widget.pack_configure(after=previous)
+                except Exception as exc:
+                    logger.warning("Could not reorder widget %s: %s", widget, exc)
+        self._reorders = []
+
     def _mount_node(
         self,
         spec: WidgetSpec,
         parent: tk.Widget,
         context: BuildContext,
     ) -> None:
-        logger.debug("Mounting %s", spec.widget_class.__name__)
+        if self._txn is not None:
+            self._mount_spec(spec, parent, context)
+        else:
+            self._mount_many((spec,), parent, context)
 
-        if issubclass(spec.widget_class, Component):
+    def _mount_many(
+        self,
+        specs: Iterable[WidgetSpec],
+        parent: tk.Widget,
+        context: BuildContext,
+    ) -> None:
+        """Mount `specs` under `parent` in one transaction."""
+        txn = self._txn = _MountTransaction()
+        try:
+            for spec in specs:
+                self._mount_spec(spec, parent, context)
+        finally:
+            self._txn = None
+            txn.commit()
+
+    def _mount_spec(
+        self,
+        spec: WidgetSpec,
+        parent: tk.Widget,
+        context: BuildContext,
+    ) -> None:
+        if spec.is_component:
             self._mount_component(spec, parent, context)
         else:
             self._mount_native(spec, parent, context)
@@ -58,13 +214,13 @@ class Renderer:
             spec, parent
         )
 
-        child_spec = component.build(context)
+        child_spec = build_component(component, context)
         if child_spec is None:
             return
 
-        self._inherit_layout_props(spec, child_spec)
+        child_spec = self._inherit_layout_props(spec, child_spec)
         component._rendered_child = child_spec
-        self._mount_node(child_spec, parent, context)
+        self._mount_node(child_spec, parent, component._child_context(context))
 
     def _mount_native(
         self,
@@ -72,13 +228,20 @@ class Renderer:
         parent: tk.Widget,
         context: BuildContext,
     ) -> None:
+        snapshot, self._hydrate_next = self._hydrate_next, None
+        if snapshot is not None:
+            if snapshot.widget_class is spec.widget_class:
+                self._hydrate_native(snapshot, spec, parent, context)
+                return
+            self._unmount_node(snapshot)
+
         props = spec.props
         expand = props.get("expand", False)
         side_override = props.get("side")
 
-        native_props = {k: v for k, v in props.items() if k not in ("expand", "side")}
-
-        widget = spec.widget_class(parent, **native_props)
+        widget = spec.widget_class(
+            parent, **{k: v for k, v in props.items() if k not in _RENDERER_PROPS}
+        )
         spec._instance = widget
 
         pack_kwargs = self._compute_pack_kwargs(
@@ -87,14 +250,59 @@ class Renderer:
             side_override=side_override,
         )
 
-        try:
-            widget.pack(**pack_kwargs)
-        except Exception as exc:
-            logger.warning("Could not pack widget %s: %s", widget, exc)
+        if self._txn is not None:
+            self._txn.add(widget, parent, pack_kwargs)
+        else:
+            _pack(widget, pack_kwargs)
 
         for child in spec.children:
             self._mount_node(child, widget, context)
 
+    def _hydrate_native(
+        self,
+        snapshot: WidgetSpec,
+        spec: WidgetSpec,
+        parent: tk.Widget,
+        context: BuildContext,
+    ) -> None:
+        """Adopt the snapshot widget for `spec` instead of creating one."""
+        widget = snapshot._instance
+        spec._instance = widget
+        self._configure_changes(widget, snapshot.props, spec.props)
+
+        old_layout = (snapshot.props.get("expand"), snapshot.props.get("side"))
+        new_layout = (spec.props.get("expand"), spec.props.get("side"))
+        if old_layout != new_layout:
+            widget.pack_configure(
+                **self._compute_pack_kwargs(
+                    parent, expand=bool(new_layout[0]), side_override=new_layout[1]
+                )
+            )
+
+        old_children = snapshot.children
+        widgets = []
+        replaced = False
+        for i, child in enumerate(spec.children):
+            old = old_children[i] if i < len(old_children) else None
+            self._hydrate_next = old
+            self._mount_node(child, widget, context)
+            if self._hydrate_next is not None:
+                # The child rendered nothing; drop its snapshot widget.
+                self._unmount_node(self._hydrate_next)
+                self._hydrate_next = None
+
+            native = _native_spec(child)
+            if native is not None:
+                widgets.append(native._instance)
+                if old is None or native._instance is not old._instance:
+                    replaced = True
+
+        for old in old_children[len(spec.children) :]:
+            self._unmount_node(old)
+
+        if replaced:
+            self._reorders.append((widget, widgets))
+
     def _update_node(
         self,
         old: WidgetSpec,
@@ -107,9 +315,13 @@ class Renderer:
             self._mount_node(new, parent, context)
             return
 
+        if self._skip_identical and old.same_as(new):
+            self._adopt(old, new)
+            return
+
         new._instance = old._instance
 
-        if issubclass(new.widget_class, Component):
+        if new.is_component:
             self._update_component(old, new, parent, context)
         else:
             self._update_native(old, new, context)
@@ -127,8 +339,20 @@ class Renderer:
         component.props = new.props
         component.context = context
 
-        new_child = component.build(context)
+        self._rebuild_component(new, component, parent, context)
+
+    def _rebuild_component(
+        self,
+        spec: WidgetSpec,
+        component,
+        parent: tk.Widget,
+        context: BuildContext,
+    ) -> None:
+        new_child = build_component(component, context)
+        if new_child is not None:
+            new_child = self._inherit_layout_props(spec, new_child)
         old_child = getattr(component, "_rendered_child", None)
+        context = component._child_context(context)
 
         if old_child and new_child:
             self._update_node(old_child, new_child, parent, context)
@@ -139,6 +363,19 @@ class Renderer:
 
         component._rendered_child = new_child
 
+    def _adopt(self, old: WidgetSpec, new: WidgetSpec) -> None:
+        """Carry live instances from `old` over to the identical `new` tree."""
+        instance = old._instance
+        new._instance = instance
+
+        if new.is_component:
+            # Equal props; keep the newest objects for the next rebuild.
+            instance.props = new.props
+            return
+
+        for old_child, new_child in zip(old.children, new.children):
+            self._adopt(old_child, new_child)
+
     def _update_native(
         self,
         old: WidgetSpec,
@@ -146,10 +383,16 @@ class Renderer:
         context: BuildContext,
     ) -> None:
         widget = new._instance
-        old_props = old.props
-        new_props = new.props
+        self._configure_changes(widget, old.props, new.props)
+        self._diff_children(old.children, new.children, widget, context)
 
-        changes = {k: v for k, v in new_props.items() if old_props.get(k) != v}
+    @staticmethod
+    def _configure_changes(widget: tk.Widget, old_props, new_props) -> None:
+        changes = {
+            k: v
+            for k, v in new_props.items()
+            if k not in _RENDERER_PROPS and old_props.get(k) != v
+        }
 
         if changes:
             try:
@@ -157,8 +400,6 @@ class Renderer:
             except Exception as exc:
                 logger.error("Failed to update widget %s: %s", widget, exc)
 
-        self._diff_children(old.children, new.children, widget, context)
-
     def _diff_children(
         self,
         old_children: Iterable[WidgetSpec],
@@ -173,14 +414,18 @@ class Renderer:
             self._update_node(old, new, parent, context)
 
         if len(new_list) > len(old_list):
-            for child in new_list[len(old_list) :]:
-                self._mount_node(child, parent, context)
+            added = new_list[len(old_list) :]
+            if self._txn is not None:
+                for child in added:
+                    self._mount_spec(child, parent, context)
+            else:
+                self._mount_many(added, parent, context)
         elif len(old_list) > len(new_list):
             for child in old_list[len(new_list) :]:
                 self._unmount_node(child)
 
     def _unmount_node(self, spec: WidgetSpec) -> None:
-        if issubclass(spec.widget_class, Component):
+        if spec.is_component:
             component = spec._instance
             component.unmount()
             child = getattr(component, "_rendered_child", None)
@@ -195,10 +440,19 @@ class Renderer:
             self._unmount_node(child)
 
     @staticmethod
-    def _inherit_layout_props(parent: WidgetSpec, child: WidgetSpec) -> None:
+    def _inherit_layout_props(parent: WidgetSpec, child: WidgetSpec) -> WidgetSpec:
+        """Return `child`, copied with the parent's layout props it lacks."""
+        parent_props = parent.props
+        child_props = child.props
+        inherited = None
+
         for prop in _LAYOUT_PROPS:
-            if prop in parent.props and prop not in child.props:
-                child.props[prop] = parent.props[prop]
+            if prop in parent_props and prop not in child_props:
+                if inherited is None:
+                    inherited = {}
+                inherited[prop] = parent_props[prop]
+
+        return child if inherited is None else child.with_props(inherited)
 
     @staticmethod
     def _compute_pack_kwargs(
@@ -234,18 +488,13 @@ class Renderer:
         parent: tk.Widget,
     ) -> None:
         logger.debug("Scheduled update for %s", spec)
+        self._scheduler.request(self, spec, parent)
 
+    def _update_component_now(
+        self,
+        spec: WidgetSpec,
+        parent: tk.Widget,
+    ) -> None:
+        """Rebuild a dirty component; called by the UpdateScheduler flush."""
         component = spec._instance
-        context = component.context
-
-        new_child = component.build(context)
-        old_child = getattr(component, "_rendered_child", None)
-
-        if old_child and new_child:
-            self._update_node(old_child, new_child, parent, context)
-        elif old_child:
-            self._unmount_node(old_child)
-        elif new_child:
-            self._mount_node(new_child, parent, context)
-
-        component._rendered_child = new_child
+        self._rebuild_component(spec, component, parent, component.context)
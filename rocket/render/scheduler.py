@@ -0,0 +1,83 @@
+import tkinter as tk
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from rocket.core.widget import WidgetSpec
+from rocket.log import get_logger
+
+if TYPE_CHECKING:
+    from rocket.render.renderer import Renderer
+
+logger = get_logger("renderer")
+
+# Guards against components that keep dirtying each other during a flush.
+_MAX_PASSES = 32
+
+
+class UpdateScheduler:
+    """
+    Batches component updates from every Renderer into one flush.
+
+    Signal changes only mark components dirty; the actual rebuilds run
+    together on the next Tk idle callback. A signal shared by several
+    windows therefore updates all of them in a single pass, and a
+    component dirtied several times before the flush rebuilds once.
+    """
+
+    __slots__ = ("_root", "_pending", "_scheduled", "flushes")
+
+    def __init__(self, root: Optional[tk.Misc] = None):
+        self._root = root
+        self._pending: Dict[int, Tuple["Renderer", WidgetSpec, Any]] = {}
+        self._scheduled = False
+        self.flushes = 0
+
+    def bind(self, root: tk.Misc) -> None:
+        """Use `root` for idle callbacks instead of Tk's default root."""
+        self._root = root
+
+    def request(self, renderer: "Renderer", spec: WidgetSpec, parent: Any) -> None:
+        key = id(spec._instance)
+        if key in self._pending:
+            return
+        self._pending[key] = (renderer, spec, parent)
+
+        if self._scheduled:
+            return
+
+        root = self._root or tk._default_root
+        if root is None:
+            # No event loop (scripts, tests): update synchronously.
+            self.flush()
+            return
+
+        try:
+            root.after_idle(self.flush)
+            self._scheduled = True
+        except tk.TclError:
+            self.flush()
+
+    def flush(self) -> None:
+        self._scheduled = False
+        self.flushes += 1
+
+        for _ in range(_MAX_PASSES):
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, {}
+
+            for renderer, spec, parent in batch.values():
+                component = spec._instance
+                # Parents flushed earlier in the batch may have unmounted it.
+                if component is None or not component._mounted:
+                    continue
+                renderer._update_component_now(spec, parent)
+
+        logger.warning(
+            "UpdateScheduler: %d updates still pending after %d passes",
+            len(self._pending),
+            _MAX_PASSES,
+        )
+
+
+# Shared by every Renderer unless one is passed explicitly.
+update_scheduler = UpdateScheduler()
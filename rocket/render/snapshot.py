@@ -0,0 +1,170 @@
+"""
+On-disk snapshots of a rendered page, for instant cold starts.
+
+When a page with `snapshot = True` closes, the native part of its last
+committed tree (widget classes and their plain-value props, which
+already hold the resolved signal values) is written as compact JSON.
+On the next launch the page mounts that tree straight away and builds
+for real after the first frame; the renderer then hydrates the
+snapshot widgets in place instead of recreating them.
+
+Callbacks, variables and images are not stored: the snapshot UI is
+inert until the real build has run. Pages whose native widgets come
+from outside rocket, customtkinter and tkinter are not snapshotted.
+"""
+
+import importlib
+import json
+import tkinter as tk
+from pathlib import Path
+from typing import Any, Optional
+
+from rocket.core.widget import WidgetSpec
+from rocket.log import log
+from rocket.render.renderer import _native_spec
+from rocket.utils.paths import cache_dir
+
+SNAPSHOT_VERSION = 1
+
+_PLAIN = (str, int, float, bool, type(None))
+_FONT_KEY = "__font__"
+_DROP = object()
+
+# Widget classes are only restored from these packages: a snapshot is a
+# user-writable file and must not be able to import arbitrary modules.
+_TRUSTED_PACKAGES = ("rocket", "customtkinter", "tkinter")
+
+
+def snapshot_path(name: str) -> Path:
+    return cache_dir() / f"snapshot-{name}.json"
+
+
+def _trusted(module_name: str) -> bool:
+    return any(
+        module_name == package or module_name.startswith(package + ".")
+        for package in _TRUSTED_PACKAGES
+    )
+
+
+# ============================================================
+# Capture
+# ============================================================
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, _PLAIN):
+        return value
+    if isinstance(value, (tuple, list)):
+        items = [_encode(item) for item in value]
+        return _DROP if any(item is _DROP for item in items) else items
+
+    import customtkinter as ctk
+
+    if isinstance(value, ctk.CTkFont):
+        return {
+            _FONT_KEY: {
+                "family": value.cget("family"),
+                "size": value.cget("size"),
+                "weight": value.cget("weight"),
+                "slant": value.cget("slant"),
+                "underline": bool(value.cget("underline")),
+                "overstrike": bool(value.cget("overstrike")),
+            }
+        }
+    return _DROP
+
+
+def capture(tree: Optional[WidgetSpec]) -> Optional[dict]:
+    spec = _native_spec(tree)
+    if spec is None:
+        return None
+
+    cls = spec.widget_class
+    if not _trusted(cls.__module__):
+        raise ValueError(f"{cls.__module__}:{cls.__qualname__} cannot be snapshotted")
+
+    props = {}
+    for key, value in spec.props.items():
+        encoded = _encode(value)
+        if encoded is not _DROP:
+            props[key] = encoded
+
+    children = [capture(child) for child in spec.children]
+    node = {"c": f"{cls.__module__}:{cls.__qualname__}", "p": props}
+    children = [child for child in children if child is not None]
+    if children:
+        node["k"] = children
+    return node
+
+
+def save(path: Path, tree: Optional[WidgetSpec]) -> None:
+    from rocket import config
+
+    try:
+        node = capture(tree)
+    except ValueError as exc:
+        log(f"snapshot not saved: {exc}")
+        return
+    if node is None:
+        return
+
+    data = {"v": SNAPSHOT_VERSION, "app": config.VERSION, "tree": node}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as exc:
+        log(f"snapshot not saved: {exc}")
+
+
+# ============================================================
+# Restore
+# ============================================================
+
+
+def _resolve_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if not _trusted(module_name):
+        raise ValueError(f"{path} is outside the trusted widget packages")
+    obj: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    if not (isinstance(obj, type) and issubclass(obj, tk.Misc)):
+        raise TypeError(f"{path} is not a widget class")
+    return obj
+
+
+def _decode(value: Any, theme) -> Any:
+    if isinstance(value, list):
+        return tuple(_decode(item, theme) for item in value)
+    if isinstance(value, dict) and _FONT_KEY in value:
+        return theme.get_font(value[_FONT_KEY])
+    return value
+
+
+def _build(node: dict, theme) -> WidgetSpec:
+    return WidgetSpec(
+        _resolve_class(node["c"]),
+        {key: _decode(value, theme) for key, value in node["p"].items()},
+        tuple(_build(child, theme) for child in node.get("k", ())),
+    )
+
+
+def load(path: Path, theme) -> Optional[WidgetSpec]:
+    """The snapshot at `path` as a native spec tree, or None if unusable."""
+    from rocket import config
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if data.get("v") != SNAPSHOT_VERSION or data.get("app") != config.VERSION:
+        return None
+
+    try:
+        return _build(data["tree"], theme)
+    except Exception as exc:
+        log(f"snapshot ignored: {exc}")
+        return None
@@ -0,0 +1,363 @@
+import bisect
+import math
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from customtkinter import CTkFrame, CTkScrollbar, ScalingTracker
+
+from rocket.utils.columnar import TableData
+
+_OWN_OPTIONS = (
+    "data",
+    "column_widths",
+    "row_height",
+    "font",
+    "header_font",
+    "text_color",
+    "header_color",
+    "stripe_color",
+    "grid_color",
+    "on_select",
+    "on_sort",
+)
+
+_DEFAULT_WIDTH = 120
+_CELL_PAD = 6
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+class NativeTable(CTkFrame):
+    """
+    Virtualized table drawn on one canvas.
+
+    Only the cells inside the viewport exist as canvas text items, and
+    they are reused as the table scrolls in either direction; a cell is
+    reconfigured only when the value it shows changes. Sorting and
+    filtering happen in `TableData` by reordering an index, after which
+    the visible cells are simply redrawn.
+    """
+
+    def __init__(self, master, **kwargs):
+        own = {key: kwargs.pop(key) for key in _OWN_OPTIONS if key in kwargs}
+        kwargs.pop("children", None)
+        super().__init__(master, **kwargs)
+
+        self._data: Optional[TableData] = None
+        self._widths: List[int] = []
+        self._edges: List[int] = [0]
+        self._column_widths: Sequence[int] | Dict[str, int] = ()
+        self._row_height = 28
+        self._font: Any = None
+        self._header_font: Any = None
+        self._colors: Dict[str, str] = {
+            "text_color": "#000000",
+            "header_color": "#F0F0F0",
+            "stripe_color": "#F7F7F7",
+            "grid_color": "#D0D0D0",
+        }
+        self._on_select: Optional[Callable[[int], None]] = None
+        self._on_sort: Optional[Callable[[Optional[str], bool], None]] = None
+
+        self._x = 0
+        self._y = 0
+        # (view row slot, column) -> canvas text item
+        self._cells: Dict[Tuple[int, int], int] = {}
+        self._cell_text: Dict[int, str] = {}
+        self._header_items: List[Tuple[int, int]] = []
+        self._stripes: List[int] = []
+        self._style = 0
+        self._drawn_style = -1
+
+        self._canvas = tk.Canvas(
+            self, highlightthickness=0, borderwidth=0, bg=self._canvas_bg()
+        )
+        self._vbar = CTkScrollbar(self, command=self._yview)
+        self._hbar = CTkScrollbar(self, orientation="horizontal", command=self._xview)
+        self._vbar.pack(side="right", fill="y")
+        self._hbar.pack(side="bottom", fill="x")
+        self._canvas.pack(side="left", fill="both", expand=True)
+
+        self._canvas.bind("<Configure>", lambda _e: self._redraw())
+        self._canvas.bind("<Button-1>", self._on_click)
+        self._canvas.bind("<MouseWheel>", self._on_wheel)
+        self._canvas.bind("<Shift-MouseWheel>", self._on_shift_wheel)
+        self._canvas.bind("<Button-4>", lambda _e: self._scroll(0, -3 * self._row_px))
+        self._canvas.bind("<Button-5>", lambda _e: self._scroll(0, 3 * self._row_px))
+
+        self._apply(own)
+
+    # ---- options ----
+
+    def configure(self, require_redraw=False, **kwargs):
+        own = {key: kwargs.pop(key) for key in _OWN_OPTIONS if key in kwargs}
+        if kwargs:
+            super().configure(require_redraw=require_redraw, **kwargs)
+            if "fg_color" in kwargs:
+                self._canvas.configure(bg=self._canvas_bg())
+        if own:
+            self._apply(own)
+
+    def _apply(self, options: Dict[str, Any]) -> None:
+        for key, value in options.items():
+            if key == "data":
+                if self._data is not None:
+                    self._data.changed.unsubscribe(self._on_data_changed)
+                self._data = value
+                if value is not None:
+                    value.changed.subscribe(self._on_data_changed)
+            elif key == "column_widths":
+                self._column_widths = value or ()
+            elif key == "row_height":
+                self._row_height = value
+            elif key == "font":
+                self._font = value
+            elif key == "header_font":
+                self._header_font = value
+            elif key == "on_select":
+                self._on_select = value
+            elif key == "on_sort":
+                self._on_sort = value
+            else:
+                self._colors[key] = value
+
+        self._layout_columns()
+        self._style += 1
+        self._redraw()
+
+    def destroy(self):
+        # The table and its canvas form a cycle, so it would otherwise stay
+        # subscribed (and redraw a dead canvas) until cyclic GC runs.
+        if self._data is not None:
+            self._data.changed.unsubscribe(self._on_data_changed)
+            self._data = None
+        super().destroy()
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._canvas.configure(bg=self._canvas_bg())
+
+    def _canvas_bg(self) -> str:
+        return self._apply_appearance_mode(
+            self._fg_color if self._fg_color != "transparent" else self._bg_color
+        )
+
+    def _on_data_changed(self, _version: int) -> None:
+        self._y = min(self._y, self._max_y())
+        self._redraw()
+
+    # ---- geometry ----
+
+    @property
+    def _scale(self) -> float:
+        return ScalingTracker.get_widget_scaling(self)
+
+    @property
+    def _row_px(self) -> int:
+        return max(1, round(self._row_height * self._scale))
+
+    def _layout_columns(self) -> None:
+        names = self._data.names if self._data is not None else []
+        spec = self._column_widths
+        widths = []
+        for i, name in enumerate(names):
+            if isinstance(spec, dict):
+                width = spec.get(name, _DEFAULT_WIDTH)
+            else:
+                width = spec[i] if i < len(spec) else _DEFAULT_WIDTH
+            widths.append(max(1, round(width * self._scale)))
+
+        self._widths = widths
+        edges = [0]
+        for width in widths:
+            edges.append(edges[-1] + width)
+        self._edges = edges
+
+    def _rows(self) -> int:
+        return self._data.row_count if self._data is not None else 0
+
+    def _max_y(self) -> int:
+        body = max(1, self._canvas.winfo_height() - self._row_px)
+        return max(0, self._rows() * self._row_px - body)
+
+    def _max_x(self) -> int:
+        return max(0, self._edges[-1] - max(1, self._canvas.winfo_width()))
+
+    # ---- scrolling ----
+
+    def _scroll(self, dx: int, dy: int) -> None:
+        self._x = max(0, min(self._x + dx, self._max_x()))
+        self._y = max(0, min(self._y + dy, self._max_y()))
+        self._redraw()
+
+    def _on_wheel(self, event) -> None:
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll(0, -step * 3 * self._row_px)
+
+    def _on_shift_wheel(self, event) -> None:
+        step = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll(-step * 40, 0)
+
+    def _yview(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        total = self._rows() * self._row_px
+        if action == "moveto":
+            self._scroll(0, round(float(value) * total) - self._y)
+        elif unit == "pages":
+            self._scroll(0, int(value) * self._canvas.winfo_height())
+        else:
+            self._scroll(0, int(value) * self._row_px)
+
+    def _xview(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self._scroll(round(float(value) * self._edges[-1]) - self._x, 0)
+        elif unit == "pages":
+            self._scroll(int(value) * self._canvas.winfo_width(), 0)
+        else:
+            self._scroll(int(value) * 40, 0)
+
+    # ---- drawing ----
+
+    def _redraw(self) -> None:
+        canvas = self._canvas
+        data = self._data
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        row_px = self._row_px
+        restyle = self._drawn_style != self._style
+
+        if data is None or not self._widths:
+            canvas.delete("all")
+            self._cells.clear()
+            self._cell_text.clear()
+            self._header_items.clear()
+            self._stripes.clear()
+            return
+
+        rows = data.row_count
+        first_col = max(0, bisect.bisect_right(self._edges, self._x) - 1)
+        last_col = min(
+            len(self._widths), bisect.bisect_left(self._edges, self._x + width)
+        )
+        first_row = self._y // row_px
+        shift = -(self._y % row_px)
+        slots = math.ceil(max(0, height - row_px) / row_px) + 1
+
+        # Row stripes, one rectangle per visible slot
+        while len(self._stripes) < slots:
+            self._stripes.append(canvas.create_rectangle(0, 0, 0, 0, width=0))
+        for slot, item in enumerate(self._stripes):
+            index = first_row + slot
+            top = row_px + shift + slot * row_px
+            if slot < slots and index < rows and index % 2:
+                canvas.coords(item, 0, top, width, top + row_px)
+                canvas.itemconfigure(
+                    item, state="normal", fill=self._colors["stripe_color"]
+                )
+            else:
+                canvas.itemconfigure(item, state="hidden")
+
+        # Cells
+        wanted = set()
+        for slot in range(slots):
+            index = first_row + slot
+            if index >= rows:
+                break
+            top = row_px + shift + slot * row_px
+            for col in range(first_col, last_col):
+                key = (slot, col)
+                wanted.add(key)
+                text = _format(data.cell(index, col))
+                item = self._cells.get(key)
+                if item is None:
+                    item = canvas.create_text(0, 0, anchor="w")
+                    self._cells[key] = item
+                    self._cell_text[item] = None
+                canvas.coords(
+                    item, self._edges[col] - self._x + _CELL_PAD, top + row_px / 2
+                )
+                if restyle or self._cell_text[item] != text:
+                    canvas.itemconfigure(
+                        item, text=text, font=self._font, fill=self._colors["text_color"]
+                    )
+                    self._cell_text[item] = text
+
+        for key in [k for k in self._cells if k not in wanted]:
+            item = self._cells.pop(key)
+            del self._cell_text[item]
+            canvas.delete(item)
+
+        self._draw_header(first_col, last_col, width)
+        self._drawn_style = self._style
+
+        total_y = rows * row_px
+        body = max(1, height - row_px)
+        self._vbar.set(*self._fractions(self._y, body, total_y))
+        self._hbar.set(*self._fractions(self._x, width, self._edges[-1]))
+
+    @staticmethod
+    def _fractions(offset: int, view: int, total: int) -> Tuple[float, float]:
+        if total <= 0:
+            return 0.0, 1.0
+        return offset / total, min(1.0, (offset + view) / total)
+
+    def _draw_header(self, first_col: int, last_col: int, width: int) -> None:
+        canvas = self._canvas
+        data = self._data
+        row_px = self._row_px
+        sorted_name, descending = data.sort_state
+
+        for rect, text in self._header_items:
+            canvas.delete(rect)
+            canvas.delete(text)
+        self._header_items.clear()
+
+        # The header is drawn last so it stays above scrolled cells.
+        for col in range(first_col, last_col):
+            x1 = self._edges[col] - self._x
+            name = data.names[col]
+            label = name
+            if name == sorted_name:
+                label += " ▼" if descending else " ▲"
+            rect = canvas.create_rectangle(
+                x1,
+                0,
+                x1 + self._widths[col],
+                row_px,
+                fill=self._colors["header_color"],
+                outline=self._colors["grid_color"],
+            )
+            text = canvas.create_text(
+                x1 + _CELL_PAD,
+                row_px / 2,
+                anchor="w",
+                text=label,
+                font=self._header_font or self._font,
+                fill=self._colors["text_color"],
+            )
+            self._header_items.append((rect, text))
+
+    # ---- hit testing ----
+
+    def _on_click(self, event) -> None:
+        data = self._data
+        if data is None:
+            return
+
+        if event.y < self._row_px:
+            col = bisect.bisect_right(self._edges, self._x + event.x) - 1
+            if 0 <= col < len(data.names):
+                name = data.names[col]
+                sorted_name, descending = data.sort_state
+                descending = not descending if name == sorted_name else False
+                data.sort(name, descending)
+                if self._on_sort:
+                    self._on_sort(name, descending)
+            return
+
+        row = (self._y + event.y - self._row_px) // self._row_px
+        if 0 <= row < data.row_count and self._on_select:
+            self._on_select(data.source_index(row))
@@ -0,0 +1,332 @@
+"""
+Frame clock and animation primitives.
+
+All animations share one `FrameClock`: a single Tk `after` timer that
+ticks at the target FPS while at least one animation is active and stops
+otherwise. Each tick steps every animation first, then commits all the
+resulting `Signal` writes back to back, so a frame costs one timer and
+one Tk redraw no matter how many properties move.
+
+    progress = Signal(0.0)
+    tween(progress, 1.0, duration_ms=400)
+    spring(offset, 120)
+"""
+
+import math
+import time
+from abc import ABC, abstractmethod
+import tkinter as tk
+from typing import Any, Callable, Dict, Optional
+
+from rocket.core.state import Signal
+from rocket.log import log
+
+Easing = Callable[[float], float]
+
+
+# ============================================================
+# Easing
+# ============================================================
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_quad(t: float) -> float:
+    return t * t
+
+
+def ease_out_cubic(t: float) -> float:
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_cubic(t: float) -> float:
+    return 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+
+
+def _lerp(start: Any, end: Any, t: float) -> Any:
+    """Interpolate numbers or equal-length tuples of numbers."""
+    if isinstance(start, tuple):
+        return tuple(_lerp(a, b, t) for a, b in zip(start, end))
+    value = start + (end - start) * t
+    if isinstance(start, int) and isinstance(end, int):
+        return round(value)
+    return value
+
+
+# ============================================================
+# Animations
+# ============================================================
+
+
+class Animation(ABC):
+    """Drives one `Signal` towards a target, one frame at a time."""
+
+    def __init__(self, signal: Signal, on_done: Optional[Callable[[], None]] = None):
+        self.signal = signal
+        self.on_done = on_done
+        self.done = False
+        self._clock: Optional["FrameClock"] = None
+
+    @abstractmethod
+    def step(self, now: float, dt: float) -> Any:
+        """Advance to `now` and return the signal's new value."""
+        pass
+
+    @abstractmethod
+    def finish(self) -> Any:
+        """Value to commit when the animation is cut short (no Tk root)."""
+        pass
+
+    def cancel(self) -> None:
+        if self._clock is not None:
+            self._clock.stop(self)
+
+
+class Tween(Animation):
+    """Fixed-duration interpolation with an easing curve."""
+
+    def __init__(
+        self,
+        signal: Signal,
+        to: Any,
+        duration_ms: float = 250,
+        easing: Easing = ease_out_cubic,
+        from_: Any = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(signal, on_done)
+        self.start = signal.get() if from_ is None else from_
+        self.to = to
+        self.duration = max(duration_ms, 1) / 1000
+        self.easing = easing
+        self._began: Optional[float] = None
+
+    def step(self, now: float, dt: float) -> Any:
+        if self._began is None:
+            self._began = now - dt
+        t = min((now - self._began) / self.duration, 1.0)
+        if t >= 1.0:
+            self.done = True
+            return self.to
+        return _lerp(self.start, self.to, self.easing(t))
+
+    def finish(self) -> Any:
+        self.done = True
+        return self.to
+
+
+class Spring(Animation):
+    """
+    Damped spring on a numeric signal.
+
+    Unlike a tween it keeps its velocity when retargeted, so interrupted
+    motion stays smooth.
+    """
+
+    _SUBSTEP = 1 / 240
+    _REST = 1e-3
+
+    def __init__(
+        self,
+        signal: Signal,
+        to: float,
+        stiffness: float = 170.0,
+        damping: float = 26.0,
+        mass: float = 1.0,
+        velocity: float = 0.0,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(signal, on_done)
+        self.position = float(signal.get() or 0.0)
+        self.velocity = velocity
+        self.to = to
+        self.stiffness = stiffness
+        self.damping = damping
+        self.mass = mass
+
+    def retarget(self, to: float) -> None:
+        self.to = to
+        self.done = False
+
+    def step(self, now: float, dt: float) -> Any:
+        # Fixed substeps keep the integration stable across dropped frames.
+        steps = max(1, math.ceil(dt / self._SUBSTEP))
+        h = dt / steps
+        for _ in range(steps):
+            force = -self.stiffness * (self.position - self.to)
+            force -= self.damping * self.velocity
+            self.velocity += force / self.mass * h
+            self.position += self.velocity * h
+
+        if abs(self.velocity) < self._REST and abs(self.position - self.to) < self._REST:
+            return self.finish()
+        return self.position
+
+    def finish(self) -> Any:
+        self.done = True
+        self.position = self.to
+        self.velocity = 0.0
+        return self.to
+
+
+# ============================================================
+# Clock
+# ============================================================
+
+
+class FrameClock:
+    """
+    One timer for every running animation.
+
+    Runs only while animations are active. A tick later than one and a
+    half frame intervals counts the missed frames in `dropped_frames`
+    and logs them.
+    """
+
+    def __init__(self, fps: int = 60, root: Optional[tk.Misc] = None):
+        self.fps = fps
+        self._root = root
+        self._animations: Dict[Signal, Animation] = {}
+        self._timer: Optional[str] = None
+        self._last: float = 0.0
+        self._next_due: float = 0.0
+
+        self.frames = 0
+        self.dropped_frames = 0
+
+    @property
+    def interval(self) -> float:
+        return 1 / self.fps
+
+    @property
+    def running(self) -> bool:
+        return self._timer is not None
+
+    def start(self, animation: Animation) -> Animation:
+        """Run `animation`, replacing any animation already driving its signal."""
+        previous = self._animations.get(animation.signal)
+        if previous is not None and previous is not animation:
+            previous._clock = None
+
+        animation._clock = self
+        self._animations[animation.signal] = animation
+
+        root = self._root or tk._default_root
+        if root is None:
+            # No event loop to animate on: jump straight to the end state.
+            self._animations.pop(animation.signal)
+            animation.signal.set(animation.finish())
+            if animation.on_done:
+                animation.on_done()
+        elif self._timer is None:
+            self._last = time.perf_counter()
+            self._next_due = self._last + self.interval
+            self._schedule(root)
+
+        return animation
+
+    def stop(self, animation: Animation) -> None:
+        if self._animations.get(animation.signal) is animation:
+            del self._animations[animation.signal]
+        animation._clock = None
+
+    def _schedule(self, root: tk.Misc) -> None:
+        delay = max(1, round((self._next_due - time.perf_counter()) * 1000))
+        try:
+            self._timer = root.after(delay, self._tick)
+        except tk.TclError:
+            self._timer = None
+            self._animations.clear()
+
+    def _tick(self) -> None:
+        self._timer = None
+        now = time.perf_counter()
+        dt = now - self._last
+        self._last = now
+        self.frames += 1
+
+        interval = self.interval
+        if dt > interval * 1.5:
+            missed = int(dt / interval) - 1
+            if missed > 0:
+                self.dropped_frames += missed
+                log("FrameClock: dropped %d frame(s) (%.1f ms tick)", missed, dt * 1000)
+
+        # Step everything first, then commit, so observers never see a
+        # half-updated frame.
+        updates = []
+        finished = []
+        for animation in list(self._animations.values()):
+            updates.append((animation.signal, animation.step(now, dt)))
+            if animation.done:
+                finished.append(animation)
+
+        for animation in finished:
+            self.stop(animation)
+
+        for signal, value in updates:
+            signal.set(value)
+
+        for animation in finished:
+            if animation.on_done:
+                animation.on_done()
+
+        if self._animations:
+            # Stay on the frame grid; skip ahead if we fell behind.
+            self._next_due += interval
+            if self._next_due < now:
+                self._next_due = now + interval
+            root = self._root or tk._default_root
+            if root is not None:
+                self._schedule(root)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "frames": self.frames,
+            "dropped": self.dropped_frames,
+            "active": len(self._animations),
+        }
+
+
+# Shared clock used by `tween` and `spring`.
+frame_clock = FrameClock()
+
+
+def tween(
+    signal: Signal,
+    to: Any,
+    duration_ms: float = 250,
+    easing: Easing = ease_out_cubic,
+    on_done: Optional[Callable[[], None]] = None,
+) -> Tween:
+    """Animate `signal` to `to` over `duration_ms` on the shared clock."""
+    return frame_clock.start(
+        Tween(signal, to, duration_ms, easing, on_done=on_done)
+    )
+
+
+def spring(
+    signal: Signal,
+    to: float,
+    *,
+    stiffness: float = 170.0,
+    damping: float = 26.0,
+    mass: float = 1.0,
+    on_done: Optional[Callable[[], None]] = None,
+) -> Spring:
+    """
+    Animate `signal` to `to` with spring physics on the shared clock.
+
+    If a spring is already driving `signal` it is retargeted and keeps
+    its velocity.
+    """
+    current = frame_clock._animations.get(signal)
+    if isinstance(current, Spring):
+        current.retarget(to)
+        current.on_done = on_done
+        return current
+    return frame_clock.start(
+        Spring(signal, to, stiffness, damping, mass, on_done=on_done)
+    )
@@ -1,10 +1,11 @@
 import os
 import sys
+import time
 from tkinter import PhotoImage
 
 import customtkinter as ctk
 
-from rocket.log import log
+from rocket.log import install_crash_dump, log
 from rocket.runtime.scaling import apply_platform_scaling
 
 
@@ -35,32 +36,97 @@ class BaseWindow(ctk.CTk):
         if icon_name:
             self._set_icon(icon_name)
 
+        # ---- startup latency (set by `rocket run` / `rocket dev`) ----
+        self._first_frame_callbacks = []
+        self._first_frame_done = False
+        launched = os.environ.pop("ROCKET_LAUNCH_TIME", None)
+        if launched:
+            try:
+                self.after_first_frame(self._report_startup, float(launched))
+            except ValueError:
+                pass
+
+        # ---- cold-start probe (set by `rocket build --matrix`) ----
+        if os.environ.pop("ROCKET_EXIT_AFTER_FIRST_FRAME", None):
+            self.after_first_frame(self.destroy)
+
+        # ---- crash dumps with recent log events ----
+        install_crash_dump(self)
+
+        # ---- memory diagnostics (opt-in, see rocket.runtime.diagnostics) ----
+        if os.environ.get("ROCKET_DIAGNOSTICS"):
+            from rocket.runtime.diagnostics import start_from_env
+
+            start_from_env(self)
+
+    def after_first_frame(self, callback, *args) -> None:
+        """
+        Run `callback(*args)` once the window has been mapped and painted.
+
+        `after_idle` alone fires before the first paint: the window is
+        not mapped until the event loop has processed its map request.
+        """
+        if self._first_frame_done:
+            self.after(0, callback, *args)
+            return
+        if not self._first_frame_callbacks:
+            self.bind("<Map>", self._on_first_map, add="+")
+        self._first_frame_callbacks.append((callback, args))
+
+    def _on_first_map(self, event) -> None:
+        # Children's <Map> events also reach the toplevel's bind tag. The
+        # binding stays: unbinding one funcid drops the whole sequence on
+        # older Tk wrappers.
+        if event.widget is not self or self._first_frame_done:
+            return
+        self._first_frame_done = True
+        callbacks, self._first_frame_callbacks = self._first_frame_callbacks, []
+        # Flush pending geometry and redraws, then let the paint land.
+        self.update_idletasks()
+        for callback, args in callbacks:
+            self.after(0, callback, *args)
+
+    def _report_startup(self, launched: float) -> None:
+        elapsed = (time.time() - launched) * 1000
+        print(f"[rocket] First frame {elapsed:.0f} ms after launch", file=sys.stderr)
+
     def _set_icon(self, icon_name: str) -> None:
-        icon_path = os.path.abspath(
-            os.path.join(
-                os.path.dirname(__file__),
-                "..",
-                "..",
-                "resources",
-                "images",
-                icon_name,
-            )
+        self._icon = apply_icon(self, icon_name)
+
+
+def apply_icon(window, icon_name: str, default: bool = True):
+    """
+    Set a window icon from `resources/images`; returns the image to keep alive.
+
+    With `default` the icon also applies to windows created later.
+    """
+    icon_path = os.path.abspath(
+        os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "..",
+            "resources",
+            "images",
+            icon_name,
         )
+    )
 
-        if not os.path.exists(icon_path):
-            log(f"icon not found: {icon_path}")
-            return
+    if not os.path.exists(icon_path):
+        log(f"icon not found: {icon_path}")
+        return None
 
-        # Keep reference to avoid GC
-        self._icon = PhotoImage(file=icon_path)
+    # Keep reference to avoid GC
+    icon = PhotoImage(master=window, file=icon_path)
 
-        # ✅ Works on Linux & macOS (window + taskbar)
-        self.iconphoto(True, self._icon)
+    # ✅ Works on Linux & macOS (window + taskbar)
+    window.iconphoto(default, icon)
 
-        # ✅ Windows taskbar icon (required)
-        if sys.platform.startswith("win"):
-            try:
-                self.iconbitmap(icon_path)
-            except Exception:
-                # iconbitmap may fail for non-ICO files
-                pass
+    # ✅ Windows taskbar icon (required)
+    if sys.platform.startswith("win"):
+        try:
+            window.iconbitmap(icon_path)
+        except Exception:
+            # iconbitmap may fail for non-ICO files
+            pass
+
+    return icon
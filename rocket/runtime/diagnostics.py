@@ -0,0 +1,293 @@
+"""
+Memory diagnostics for long-running apps.
+
+Enabled by setting `ROCKET_DIAGNOSTICS` before the window is created:
+
+- ``ROCKET_DIAGNOSTICS=1``: reports on demand only (Ctrl+Shift+M in the
+  window, or ``kill -USR1 <pid>`` on POSIX).
+- ``ROCKET_DIAGNOSTICS=600``: additionally every 600 seconds.
+
+A report counts live components, native widgets and signal subscribers
+per class, lists unmounted components that signals still keep alive,
+and attributes `tracemalloc` allocations to component classes. Counts
+are collected by scanning the garbage collector when a report is made,
+so diagnostics add no cost to rendering.
+"""
+
+import gc
+import inspect
+import os
+import signal as _signal
+import sys
+import time
+import tkinter as tk
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from rocket.core.component import Component, hook_stats
+from rocket.core.state import Signal, dropped_subscriptions
+
+ENV_VAR = "ROCKET_DIAGNOSTICS"
+
+_TRACE_FRAMES = 16
+_TOP_ALLOCATIONS = 15
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _all_subclasses(cls: type) -> List[type]:
+    found = []
+    stack = [cls]
+    while stack:
+        for sub in stack.pop().__subclasses__():
+            found.append(sub)
+            stack.append(sub)
+    return found
+
+
+@dataclass
+class MemoryReport:
+    uptime: float
+    # class name -> (mounted, total)
+    components: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # class name -> (alive, destroyed)
+    widgets: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    subscribers: Counter = field(default_factory=Counter)
+    # (component class, signal repr) -> count
+    leaks: Counter = field(default_factory=Counter)
+    dropped: Dict[str, int] = field(default_factory=dict)
+    # class name -> (bytes, blocks)
+    allocations: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # class name -> change in total instances since the previous report
+    growth: Dict[str, int] = field(default_factory=dict)
+    # class name -> (hits, misses) of memo/callback hooks
+    hooks: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        lines = [f"[rocket] Memory report (uptime {self.uptime:.0f} s)"]
+
+        lines.append("Live components (mounted/total, change):")
+        for name, (mounted, total) in sorted(
+            self.components.items(), key=lambda item: -item[1][1]
+        ):
+            lines.append(
+                f"  {name:<28} {mounted:>6}/{total:<6} ({self.growth.get(name, 0):+d})"
+            )
+
+        lines.append("Native widgets (alive/destroyed):")
+        for name, (alive, destroyed) in sorted(
+            self.widgets.items(), key=lambda item: -sum(item[1])
+        ):
+            lines.append(f"  {name:<28} {alive:>6}/{destroyed:<6}")
+
+        lines.append("Signal subscribers by class:")
+        for name, count in self.subscribers.most_common():
+            lines.append(f"  {name:<28} {count:>6}")
+
+        if self.leaks:
+            lines.append("Possible leaks (unmounted, still subscribed):")
+            for (name, signal), count in self.leaks.most_common():
+                lines.append(f"  {name} <- {signal} x{count}")
+
+        if self.dropped:
+            lines.append("Dropped subscriptions (not weak-referenceable):")
+            for name, count in sorted(self.dropped.items()):
+                lines.append(f"  {name} x{count}")
+
+        if self.hooks:
+            lines.append("Memo hooks (hits/misses):")
+            for name, (hits, misses) in sorted(
+                self.hooks.items(), key=lambda item: -sum(item[1])
+            ):
+                lines.append(f"  {name:<28} {hits:>6}/{misses:<6}")
+
+        if self.allocations:
+            lines.append("Allocations by component (tracemalloc):")
+            for name, (size, blocks) in sorted(
+                self.allocations.items(), key=lambda item: -item[1][0]
+            )[:_TOP_ALLOCATIONS]:
+                lines.append(f"  {name:<28} {_format_bytes(size):>10} in {blocks} blocks")
+
+        return "\n".join(lines)
+
+
+class MemoryDiagnostics:
+    """Collects `MemoryReport`s; see the module docstring for enabling it."""
+
+    def __init__(self):
+        self._root: Optional[tk.Misc] = None
+        self._interval = 0.0
+        self._timer: Optional[str] = None
+        self._started = time.monotonic()
+        self._previous: Dict[str, int] = {}
+        self._ranges: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._ranges_for = -1
+
+    # ---- lifecycle ----
+
+    def start(
+        self,
+        root: tk.Misc,
+        interval: float = 0.0,
+        trace_frames: int = _TRACE_FRAMES,
+    ) -> None:
+        """Enable tracing and on-demand reports; also periodic ones if `interval`."""
+        self._root = root
+        self._interval = interval
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(trace_frames)
+
+        root.bind_all("<Control-Shift-M>", lambda _event: self.dump(), add="+")
+        if hasattr(_signal, "SIGUSR1"):
+            # Python handlers run on the main thread; hop onto the Tk loop.
+            _signal.signal(
+                _signal.SIGUSR1, lambda *_: root.after_idle(self.dump)
+            )
+
+        if interval > 0:
+            self._schedule()
+
+    def stop(self) -> None:
+        if self._timer is not None and self._root is not None:
+            self._root.after_cancel(self._timer)
+        self._timer = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _schedule(self) -> None:
+        self._timer = self._root.after(int(self._interval * 1000), self._on_timer)
+
+    def _on_timer(self) -> None:
+        self.dump()
+        self._schedule()
+
+    # ---- collection ----
+
+    def collect(self) -> MemoryReport:
+        gc.collect()
+        report = MemoryReport(uptime=time.monotonic() - self._started)
+
+        components: Dict[str, List[int]] = {}
+        widgets: Dict[str, List[int]] = {}
+        signals: List[Signal] = []
+
+        for obj in gc.get_objects():
+            if isinstance(obj, Component):
+                counts = components.setdefault(type(obj).__name__, [0, 0])
+                counts[0] += bool(getattr(obj, "_mounted", False))
+                counts[1] += 1
+            elif isinstance(obj, tk.Misc):
+                counts = widgets.setdefault(type(obj).__name__, [0, 0])
+                counts[0 if self._exists(obj) else 1] += 1
+            elif isinstance(obj, Signal):
+                signals.append(obj)
+
+        for sig in signals:
+            for ref in sig._subscribers:
+                callback = ref()
+                owner = getattr(callback, "__self__", None)
+                if owner is None:
+                    continue
+                name = type(owner).__name__
+                report.subscribers[name] += 1
+                if isinstance(owner, Component) and not getattr(owner, "_mounted", True):
+                    report.leaks[(name, repr(sig))] += 1
+
+        report.components = {k: tuple(v) for k, v in components.items()}
+        report.widgets = {k: tuple(v) for k, v in widgets.items()}
+        report.dropped = dict(dropped_subscriptions)
+        report.hooks = {k: tuple(v) for k, v in hook_stats.items()}
+        report.growth = {
+            name: total - self._previous.get(name, 0)
+            for name, (_, total) in report.components.items()
+        }
+        self._previous = {name: total for name, (_, total) in report.components.items()}
+
+        if tracemalloc.is_tracing():
+            report.allocations = self._attribute_allocations()
+
+        return report
+
+    @staticmethod
+    def _exists(widget: tk.Misc) -> bool:
+        try:
+            return bool(widget.winfo_exists())
+        except (tk.TclError, RuntimeError):
+            return False
+
+    def _component_ranges(self) -> Dict[str, List[Tuple[int, int, str]]]:
+        """filename -> [(first line, last line, class name)] for each component class."""
+        ranges: Dict[str, List[Tuple[int, int, str]]] = {}
+        for cls in _all_subclasses(Component):
+            if cls.__module__ == Component.__module__:
+                # Base-class frames fall through to the concrete caller.
+                continue
+            try:
+                filename = inspect.getsourcefile(cls)
+                lines, first = inspect.getsourcelines(cls)
+            except (OSError, TypeError):
+                continue
+            if filename:
+                ranges.setdefault(filename, []).append(
+                    (first, first + len(lines) - 1, cls.__name__)
+                )
+        return ranges
+
+    def _attribute_allocations(self) -> Dict[str, Tuple[int, int]]:
+        # Component classes can be defined late (lazy routes); refresh if so.
+        known = len(_all_subclasses(Component))
+        if known != self._ranges_for:
+            self._ranges = self._component_ranges()
+            self._ranges_for = known
+        ranges = self._ranges
+
+        totals: Dict[str, List[int]] = {}
+        snapshot = tracemalloc.take_snapshot()
+        for stat in snapshot.statistics("traceback"):
+            owner = "<other>"
+            # Innermost frame inside a component class wins.
+            for frame in reversed(stat.traceback):
+                for first, last, name in ranges.get(frame.filename, ()):
+                    if first <= frame.lineno <= last:
+                        owner = name
+                        break
+                else:
+                    continue
+                break
+            bucket = totals.setdefault(owner, [0, 0])
+            bucket[0] += stat.size
+            bucket[1] += stat.count
+
+        return {name: (size, count) for name, (size, count) in totals.items()}
+
+    # ---- output ----
+
+    def dump(self, file: Optional[TextIO] = None) -> MemoryReport:
+        report = self.collect()
+        print(report, file=file or sys.stderr, flush=True)
+        return report
+
+
+# Shared instance started by `BaseWindow` when `ROCKET_DIAGNOSTICS` is set.
+diagnostics = MemoryDiagnostics()
+
+
+def start_from_env(root: tk.Misc) -> None:
+    value = os.environ.get(ENV_VAR)
+    if not value:
+        return
+    try:
+        interval = float(value)
+    except ValueError:
+        interval = 0.0
+    # "1" means on demand only.
+    diagnostics.start(root, interval if interval > 1 else 0.0)
@@ -0,0 +1,19 @@
+import customtkinter as ctk
+
+from rocket.config import WindowConfig
+from rocket.runtime.base_window import apply_icon
+
+
+class SecondaryWindow(ctk.CTkToplevel):
+    """Extra window sharing the main window's Tk interpreter."""
+
+    def __init__(self, master, config: WindowConfig):
+        super().__init__(master)
+        self.window_config = config
+
+        self.title(config.title)
+        self.geometry(config.geometry)
+        self.resizable(config.resizable, config.resizable)
+
+        if config.icon:
+            self._icon = apply_icon(self, config.icon, default=False)
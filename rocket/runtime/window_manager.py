@@ -1,9 +1,121 @@
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from rocket.config import WindowConfig
+from rocket.render.scheduler import update_scheduler
 from rocket.runtime.main_window import MainWindow
 
+# Builds the page shown in a window, e.g. a BasePage subclass.
+PageFactory = Callable[[tk.Misc], Any]
+
+
+@dataclass(slots=True)
+class _Route:
+    factory: PageFactory
+    config: WindowConfig
+
+
+@dataclass(slots=True)
+class _OpenWindow:
+    window: Any
+    page: Any
+
+
+def _alive(widget) -> bool:
+    # winfo_exists raises instead of returning False once the Tk app is gone.
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
 
 class WindowManager:
+    """
+    Owns the single Tk root and the application's secondary windows.
+
+    Secondary windows are `CTkToplevel`s on the same interpreter, each with
+    its own page and Renderer; all renderers share one update scheduler.
+    Windows are created on first `open`. `close` only hides them, so
+    opening them again is instant and keeps their state.
+    """
+
+    MAIN = "main_window"
+
     def __init__(self):
-        self._windows = {}
+        self._root: Optional[MainWindow] = None
+        self._routes: Dict[str, _Route] = {}
+        self._windows: Dict[str, _OpenWindow] = {}
+
+    def get_runtime(self) -> MainWindow:
+        """The main window, created on first call and reused afterwards."""
+        if self._root is None or not _alive(self._root):
+            root = tk._default_root
+            # Another manager may already own a root; never start a second
+            # Tcl interpreter.
+            self._root = root if isinstance(root, MainWindow) else MainWindow()
+            update_scheduler.bind(self._root)
+        return self._root
+
+    def register(
+        self,
+        name: str,
+        page_factory: PageFactory,
+        config: Optional[WindowConfig] = None,
+    ) -> None:
+        """Declare a window; nothing is created until it is opened."""
+        self._routes[name] = _Route(page_factory, config or WindowConfig(title=name))
+
+    def open(self, name: str):
+        """Show window `name`, creating it on first use."""
+        entry = self._windows.get(name)
+        if entry is not None and _alive(entry.window):
+            entry.window.deiconify()
+            entry.window.lift()
+            entry.window.focus_set()
+            return entry.window
+
+        route = self._routes.get(name)
+        if route is None:
+            raise ValueError(f"Unknown window '{name}'")
+
+        from rocket.runtime.secondary_window import SecondaryWindow
+
+        window = SecondaryWindow(self.get_runtime(), route.config)
+        window.protocol("WM_DELETE_WINDOW", lambda: self.close(name))
+
+        page = route.factory(window)
+        self._windows[name] = _OpenWindow(window, page)
+        if hasattr(page, "render"):
+            page.render()
+        return window
+
+    def close(self, name: str) -> None:
+        """Hide window `name`, keeping it pooled for the next `open`."""
+        entry = self._windows.get(name)
+        if entry is not None:
+            entry.window.withdraw()
+
+    def destroy(self, name: str) -> None:
+        """Destroy window `name` and drop it from the pool."""
+        entry = self._windows.pop(name, None)
+        if entry is not None:
+            entry.window.destroy()
+
+    def get(self, name: str = MAIN):
+        """The main window, or an already created secondary window."""
+        if name == self.MAIN:
+            return self.get_runtime()
+        entry = self._windows.get(name)
+        if entry is None:
+            raise ValueError(f"Unknown window '{name}'")
+        return entry.window
+
+    def page(self, name: str):
+        """The page object rendered in secondary window `name`."""
+        entry = self._windows.get(name)
+        return entry.page if entry is not None else None
+
 
-    def get_runtime(self):
-        return MainWindow()
+# Shared instance; `WindowManager()` instances also reuse the same root.
+window_manager = WindowManager()
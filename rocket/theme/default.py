@@ -20,3 +20,11 @@ LIGHT_COLORS = {
     "input_bg": "#FFFFFF",  # White background for input fields
     "input_text": "#000000",  # Black text for input fields
 }
+
+# Font tokens shared by all elements; sizes are in pixels (see `FontRegistry`).
+DEFAULT_FONTS = {
+    "body": ("Helvetica", 14),
+    "title": ("Helvetica", 16, "bold"),
+    "caption": ("Helvetica", 12, "italic"),
+    "button": ("Helvetica", 11),
+}
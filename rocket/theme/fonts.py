@@ -0,0 +1,174 @@
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+import customtkinter as ctk
+
+from rocket.theme.default import DEFAULT_FONTS
+
+FontKey = Tuple[str, int, str, str, bool, bool]
+FontSpec = Union[str, tuple, list, dict, ctk.CTkFont]
+
+_FIELDS = ("family", "size", "weight", "slant", "underline", "overstrike")
+_STYLES = frozenset(("normal", "bold", "roman", "italic", "underline", "overstrike"))
+
+# Measured strings kept per registry; oldest are dropped first.
+_MEASURE_CACHE_SIZE = 4096
+
+
+def _parse(spec: str, default_size: int) -> tuple:
+    """
+    Turn a Tk-style font string into a tuple spec.
+
+    Accepts "Helvetica 12 bold", "{Times New Roman} 12 italic" and, more
+    leniently, "Times New Roman 12" or "Helvetica bold".
+    """
+    if spec.startswith("{"):
+        family, _, rest = spec[1:].partition("}")
+        words = rest.split()
+    else:
+        words = spec.split()
+        family_words = []
+        while words and not _is_size(words[0]) and words[0] not in _STYLES:
+            family_words.append(words.pop(0))
+        family = " ".join(family_words)
+
+    size = int(words.pop(0)) if words and _is_size(words[0]) else default_size
+    return (family or "Helvetica", size, *words)
+
+
+def _is_size(word: str) -> bool:
+    # Negative sizes are pixels in Tk.
+    return word.lstrip("-").isdigit()
+
+
+def _normalize(spec: Union[tuple, list, dict], default_size: int) -> FontKey:
+    """Turn a tuple/dict font description into a hashable canonical key."""
+    if isinstance(spec, dict):
+        return (
+            spec.get("family", "Helvetica"),
+            int(spec.get("size", default_size)),
+            spec.get("weight", "normal"),
+            spec.get("slant", "roman"),
+            bool(spec.get("underline", False)),
+            bool(spec.get("overstrike", False)),
+        )
+
+    family = spec[0]
+    size = int(spec[1]) if len(spec) > 1 else default_size
+    styles = " ".join(str(part) for part in spec[2:]).split()
+
+    return (
+        family,
+        size,
+        "bold" if "bold" in styles else "normal",
+        "italic" if "italic" in styles else "roman",
+        "underline" in styles,
+        "overstrike" in styles,
+    )
+
+
+class FontRegistry:
+    """
+    Interns font specs into shared `CTkFont` objects.
+
+    Equal specs (e.g. `("Helvetica", 14)` built fresh on every render)
+    resolve to the same font object, so the renderer's prop diff sees no
+    change and widgets are not reconfigured. Named tokens ("body",
+    "title", ...) are mutable: `set_token` reconfigures the shared font
+    and every widget using it follows via CustomTkinter's size callbacks.
+
+    Fonts are created lazily because Tk fonts need a root window.
+    """
+
+    def __init__(self, tokens: Optional[Dict[str, tuple]] = None):
+        self._token_specs: Dict[str, tuple] = dict(tokens or DEFAULT_FONTS)
+        self._tokens: Dict[str, ctk.CTkFont] = {}
+        self._interned: Dict[FontKey, ctk.CTkFont] = {}
+        self._measure_cache: "OrderedDict[Tuple[int, str], int]" = OrderedDict()
+        self._metrics_cache: Dict[int, Dict[str, int]] = {}
+
+    @property
+    def default_size(self) -> int:
+        return _normalize(self._token_specs.get("body", ("Helvetica", 14)), 14)[1]
+
+    def _create(self, key: FontKey) -> ctk.CTkFont:
+        family, size, weight, slant, underline, overstrike = key
+        return ctk.CTkFont(
+            family=family,
+            size=size,
+            weight=weight,
+            slant=slant,
+            underline=underline,
+            overstrike=overstrike,
+        )
+
+    def token(self, name: str) -> ctk.CTkFont:
+        font = self._tokens.get(name)
+        if font is None:
+            spec = self._token_specs[name]
+            font = self._create(_normalize(spec, self.default_size))
+            self._tokens[name] = font
+        return font
+
+    def resolve(self, spec: Optional[FontSpec]) -> Optional[ctk.CTkFont]:
+        """Return the shared font for a token, font string, tuple, dict or font."""
+        if spec is None or isinstance(spec, ctk.CTkFont):
+            return spec
+
+        if isinstance(spec, str):
+            if spec in self._token_specs:
+                return self.token(spec)
+            spec = _parse(spec, self.default_size)
+
+        key = _normalize(spec, self.default_size)
+        font = self._interned.get(key)
+        if font is None:
+            font = self._create(key)
+            self._interned[key] = font
+        return font
+
+    def set_token(self, name: str, **options: Any) -> None:
+        """
+        Change a font token, e.g. `set_token("body", size=16)`.
+
+        The shared font is reconfigured in place, so widgets update at
+        once without a re-render.
+        """
+        current = self._token_specs.get(name, ("Helvetica",))
+        spec = dict(zip(_FIELDS, _normalize(current, self.default_size)))
+        spec.update(options)
+        self._token_specs[name] = spec
+
+        font = self._tokens.get(name)
+        if font is not None:
+            font.configure(**options)
+            self._invalidate(font)
+
+    def measure(self, font: FontSpec, text: str) -> int:
+        """Cached `Font.measure`; width in pixels at unit scaling."""
+        resolved = self.resolve(font)
+        key = (id(resolved), text)
+        cache = self._measure_cache
+        width = cache.get(key)
+        if width is None:
+            width = resolved.measure(text)
+            cache[key] = width
+            if len(cache) > _MEASURE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return width
+
+    def metrics(self, font: FontSpec) -> Dict[str, int]:
+        resolved = self.resolve(font)
+        cached = self._metrics_cache.get(id(resolved))
+        if cached is None:
+            cached = resolved.metrics()
+            self._metrics_cache[id(resolved)] = cached
+        return cached
+
+    def _invalidate(self, font: ctk.CTkFont) -> None:
+        font_id = id(font)
+        self._metrics_cache.pop(font_id, None)
+        for key in [k for k in self._measure_cache if k[0] == font_id]:
+            del self._measure_cache[key]
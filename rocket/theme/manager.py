@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from rocket.core.state import Signal
 from rocket.theme.default import DARK_COLORS, LIGHT_COLORS
+from rocket.theme.fonts import FontRegistry, FontSpec
 
 
 class ThemeManager(Signal[str]):
@@ -13,6 +14,7 @@ class ThemeManager(Signal[str]):
         super().__init__(theme)
         self.LIGHT_COLORS = LIGHT_COLORS
         self.DARK_COLORS = DARK_COLORS
+        self.fonts = FontRegistry()
         self._update_colors(theme)
 
     def _update_colors(self, theme):
@@ -36,3 +38,7 @@ class ThemeManager(Signal[str]):
 
     def get_color(self, key) -> str:
         return self.COLORS.get(key, "Key not found")
+
+    def get_font(self, spec: FontSpec) -> ctk.CTkFont:
+        """Shared font for a token name ("body", "title", ...) or font tuple."""
+        return self.fonts.resolve(spec)
@@ -0,0 +1,223 @@
+"""
+Pre-scaled image archive.
+
+`rocket build` renders every image in `resources/images` at the standard
+scale factors and packs the raw RGBA pixels into one indexed file. At
+runtime the archive is memory-mapped once and images are sliced out of
+the mapping with `Image.frombuffer`, so loading an asset neither touches
+the filesystem nor copies or resamples pixels when the requested size
+matches a pre-rendered variant.
+
+Layout::
+
+    b"RKTA" | u16 version | u16 reserved | u32 index length | index (JSON)
+    | padding | RGBA blobs, each aligned to `_ALIGN` bytes
+
+The index maps ``name -> [[scale, offset, width, height], ...]`` and
+records the digest of the source directory it was built from.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Optional
+
+from rocket.log import log
+
+ARCHIVE_NAME = "images.rka"
+
+# 1.3 matches the Linux fallback in `rocket.runtime.scaling`.
+SCALE_FACTORS: tuple[float, ...] = (1.0, 1.25, 1.3, 1.5, 2.0)
+
+_MAGIC = b"RKTA"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+_ALIGN = 64
+_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def source_digest(resource_dir: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(resource_dir.rglob("*")):
+        if path.is_file() and path.suffix.lower() in _IMAGE_SUFFIXES:
+            digest.update(path.relative_to(resource_dir).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+# ============================================================
+# Build time
+# ============================================================
+
+
+def pack_assets(
+    resource_dir: Path,
+    out_path: Path,
+    scales: tuple[float, ...] = SCALE_FACTORS,
+) -> int:
+    """
+    Render every image at each scale factor and write the archive.
+
+    Skips the work when `out_path` was already built from identical
+    sources. Returns the number of images in the archive.
+    """
+    from PIL import Image
+
+    digest = source_digest(resource_dir)
+    existing = AssetArchive.open(out_path)
+    if existing is not None:
+        try:
+            if existing.source == digest:
+                return len(existing.names())
+        finally:
+            existing.close()
+
+    index: dict[str, list[list]] = {}
+    blobs: list[bytes] = []
+    offset = 0
+
+    for path in sorted(resource_dir.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in _IMAGE_SUFFIXES:
+            continue
+
+        name = path.relative_to(resource_dir).as_posix()
+        with Image.open(path) as source:
+            base = source.convert("RGBA")
+
+        variants = []
+        for scale in scales:
+            size = (
+                max(1, round(base.width * scale)),
+                max(1, round(base.height * scale)),
+            )
+            image = base if size == base.size else base.resize(size, Image.LANCZOS)
+            data = image.tobytes()
+            variants.append([scale, offset, size[0], size[1]])
+            blobs.append(data)
+            offset = _align(offset + len(data))
+
+        index[name] = variants
+
+    index_bytes = json.dumps({"source": digest, "images": index}).encode()
+    data_start = _align(_HEADER.size + len(index_bytes))
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, 0, len(index_bytes)))
+        fh.write(index_bytes)
+        fh.write(b"\0" * (data_start - fh.tell()))
+        for blob in blobs:
+            fh.write(blob)
+            fh.write(b"\0" * (_align(len(blob)) - len(blob)))
+    tmp_path.replace(out_path)
+
+    return len(index)
+
+
+# ============================================================
+# Runtime
+# ============================================================
+
+
+class AssetArchive:
+    """Read-only, memory-mapped view of an image archive."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = path.open("rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        magic, version, _, index_len = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Not a Rocket asset archive: {path}")
+
+        start = _HEADER.size
+        index = json.loads(bytes(self._view[start : start + index_len]))
+        self._data_start = _align(start + index_len)
+        self.source: str = index["source"]
+        self._images: dict[str, list[list]] = index["images"]
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["AssetArchive"]:
+        if not path.is_file():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as exc:
+            log(f"asset archive unusable: {path} ({exc})")
+            return None
+
+    def names(self) -> list[str]:
+        return list(self._images)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._images
+
+    def image(self, name: str, pixel_size: tuple[int, int]):
+        """
+        Return the pre-rendered variant closest to `pixel_size`.
+
+        An exact match is a zero-copy view into the mapping. Otherwise the
+        smallest variant at least as large (or the largest one) is resized.
+        Returns None if `name` is not archived.
+        """
+        from PIL import Image
+
+        variants = self._images.get(name)
+        if not variants:
+            return None
+
+        width, height = pixel_size
+        larger = [v for v in variants if v[2] >= width and v[3] >= height]
+        _, offset, w, h = (
+            min(larger, key=lambda v: v[2] * v[3])
+            if larger
+            else max(variants, key=lambda v: v[2] * v[3])
+        )
+
+        start = self._data_start + offset
+        buffer = self._view[start : start + w * h * 4]
+        image = Image.frombuffer("RGBA", (w, h), buffer, "raw", "RGBA", 0, 1)
+
+        if (w, h) != (width, height):
+            image = image.resize((width, height), Image.LANCZOS)
+        return image
+
+    def close(self) -> None:
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+_archive: Optional[AssetArchive] = None
+_archive_checked = False
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> Optional[AssetArchive]:
+    """The bundled archive next to `resources/images`, opened once per process."""
+    global _archive, _archive_checked
+
+    if _archive_checked:
+        return _archive
+
+    with _archive_lock:
+        if not _archive_checked:
+            from rocket.utils.resources import _BASE_IMAGE_DIR
+
+            path = Path(os.path.dirname(_BASE_IMAGE_DIR)) / ARCHIVE_NAME
+            _archive = AssetArchive.open(path)
+            _archive_checked = True
+
+    return _archive
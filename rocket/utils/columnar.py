@@ -0,0 +1,181 @@
+"""
+Columnar table data with sort and filter index permutations.
+
+Each column is stored as one contiguous array: a NumPy array when NumPy
+is installed, otherwise `array.array` for numbers and a list for
+everything else. Sorting and filtering never move the data; they only
+compute index permutations, which are cached per column, and the
+visible row order is the sort permutation restricted to the rows that
+pass the filter.
+"""
+
+import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from rocket.core.state import Signal
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+def _to_column(values: Sequence[Any]):
+    if np is not None:
+        return np.asarray(values)
+    if values and all(type(v) is int for v in values):
+        return array.array("q", values)
+    if values and all(type(v) in (int, float) for v in values):
+        return array.array("d", values)
+    return list(values)
+
+
+def _argsort(values: Sequence[Any]) -> List[int]:
+    """Stable sort order for any column; None sorts last."""
+    indices = range(len(values))
+    try:
+        return sorted(indices, key=lambda i: (values[i] is None, values[i]))
+    except TypeError:
+        # Mixed types (e.g. numbers and text) are ordered by their text.
+        text = ["" if v is None else str(v) for v in values]
+        return sorted(indices, key=lambda i: (values[i] is None, text[i]))
+
+
+class TableData:
+    """
+    Column-oriented data source for `Table`.
+
+    `changed` is a Signal bumped whenever sorting, filtering or the data
+    itself changes, so bound tables redraw without being rebuilt.
+    """
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]):
+        self.names: List[str] = list(columns)
+        self._columns = [_to_column(values) for values in columns.values()]
+        lengths = {len(col) for col in self._columns}
+        if len(lengths) > 1:
+            raise ValueError("All table columns must have the same length")
+        self._rows = lengths.pop() if lengths else 0
+
+        self._sort_cache: Dict[int, Sequence[int]] = {}
+        self._sort_column: Optional[int] = None
+        self._descending = False
+        self._mask: Optional[Sequence[bool]] = None
+        self._view: Optional[Sequence[int]] = None
+
+        self.changed: Signal[int] = Signal(0, name="TableData")
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]], names: Sequence[str]) -> "TableData":
+        """Build from row tuples, e.g. a database cursor."""
+        columns: List[List[Any]] = [[] for _ in names]
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+        return cls(dict(zip(names, columns)))
+
+    # ---- shape ----
+
+    @property
+    def row_count(self) -> int:
+        """Rows in the current (filtered) view."""
+        return len(self._order())
+
+    @property
+    def total_rows(self) -> int:
+        return self._rows
+
+    @property
+    def sort_state(self) -> tuple[Optional[str], bool]:
+        name = None if self._sort_column is None else self.names[self._sort_column]
+        return name, self._descending
+
+    # ---- access ----
+
+    def source_index(self, row: int) -> int:
+        """Index in the original data of view row `row`."""
+        return int(self._order()[row])
+
+    def cell(self, row: int, column: int) -> Any:
+        return self._columns[column][self._order()[row]]
+
+    def column(self, name: str):
+        return self._columns[self.names.index(name)]
+
+    # ---- sort / filter ----
+
+    def sort(self, name: Optional[str], descending: bool = False) -> None:
+        """Order the view by column `name` (None restores source order)."""
+        self._sort_column = None if name is None else self.names.index(name)
+        self._descending = descending
+        self._invalidate()
+
+    def presort(self, names: Optional[Iterable[str]] = None) -> None:
+        """Compute sort permutations ahead of time (all columns by default)."""
+        for name in self.names if names is None else names:
+            self._permutation(self.names.index(name))
+
+    def filter(self, name: str, predicate: Callable[[Any], bool]) -> None:
+        """Show only rows whose value in column `name` satisfies `predicate`."""
+        values = self._columns[self.names.index(name)]
+        self.filter_mask([bool(predicate(v)) for v in values])
+
+    def filter_mask(self, mask: Optional[Sequence[bool]]) -> None:
+        """Show rows where `mask` is true; None clears the filter."""
+        if mask is not None and len(mask) != self._rows:
+            raise ValueError("Filter mask length does not match the table")
+        if mask is not None and np is not None:
+            mask = np.asarray(mask, dtype=bool)
+        self._mask = mask
+        self._invalidate()
+
+    def set_column(self, name: str, values: Sequence[Any]) -> None:
+        """Replace one column's data; drops cached permutations."""
+        if len(values) != self._rows:
+            raise ValueError("Column length does not match the table")
+        index = self.names.index(name)
+        self._columns[index] = _to_column(values)
+        self._sort_cache.pop(index, None)
+        self._invalidate()
+
+    # ---- internals ----
+
+    def _permutation(self, column: int) -> Sequence[int]:
+        perm = self._sort_cache.get(column)
+        if perm is None:
+            values = self._columns[column]
+            if np is None:
+                perm = _argsort(values)
+            elif values.dtype == object:
+                # NumPy cannot order None or mixed types.
+                perm = np.asarray(_argsort(values), dtype=np.intp)
+            else:
+                perm = np.argsort(values, kind="stable")
+            self._sort_cache[column] = perm
+        return perm
+
+    def _order(self) -> Sequence[int]:
+        view = self._view
+        if view is not None:
+            return view
+
+        if self._sort_column is None:
+            order = np.arange(self._rows) if np is not None else range(self._rows)
+        else:
+            order = self._permutation(self._sort_column)
+            if self._descending:
+                order = order[::-1]
+
+        mask = self._mask
+        if mask is not None:
+            if np is not None:
+                order = order[mask[order]]
+            else:
+                order = [i for i in order if mask[i]]
+
+        self._view = order
+        return order
+
+    def _invalidate(self) -> None:
+        self._view = None
+        self.changed.set(self.changed.get() + 1)
@@ -0,0 +1,198 @@
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from rocket.log import log
+from rocket.utils.assets import get_archive
+from rocket.utils.resources import get_resource_image
+
+# (resource name, display size, scale factor, theme)
+ImageKey = tuple[str, tuple[int, int], float, str]
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_POLL_MS = 16
+
+
+def _decode(name: str, path: Optional[str], pixel_size: tuple[int, int]):
+    """Worker-thread decode: open, convert and resize to the final pixel size."""
+    from PIL import Image
+
+    if path is None:
+        # Pre-scaled variant sliced out of the memory-mapped asset archive.
+        return get_archive().image(name, pixel_size)
+
+    with Image.open(path) as source:
+        # JPEG can decode at a reduced size directly; no-op for other formats.
+        source.draft("RGB", pixel_size)
+        image = source.convert("RGBA")
+
+    if image.size != pixel_size:
+        image = image.resize(pixel_size, Image.LANCZOS)
+    return image
+
+
+class ImageService:
+    """
+    Decodes images off the Tk thread and caches the resulting `CTkImage`s.
+
+    Entries are keyed by (name, size, scale, theme) and kept in an LRU
+    bounded by the decoded pixel bytes. Identical requests made while a
+    decode is in flight share it, so each file is decoded once per key.
+    Completion callbacks always run on the Tk thread.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = _DEFAULT_MAX_BYTES,
+        workers: int = 2,
+    ):
+        self.max_bytes = max_bytes
+        self._cache: "OrderedDict[ImageKey, tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[ImageKey, list[Callable[[Any], None]]] = {}
+        # Keys whose decode failed; not retried until `clear()`.
+        self._failed: set[ImageKey] = set()
+        self._results: "queue.Queue[tuple[ImageKey, Future]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="rocket-image"
+        )
+        self._root = None
+        self._polling = False
+
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.evictions = 0
+
+    # ---- cache ----
+
+    def get(self, key: ImageKey):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            return entry[0]
+
+    def _store(self, key: ImageKey, image: Any, size: int) -> None:
+        with self._lock:
+            if key in self._cache:
+                self._bytes -= self._cache.pop(key)[1]
+            self._cache[key] = (image, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes and len(self._cache) > 1:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+        self._failed.clear()
+
+    @property
+    def cached_bytes(self) -> int:
+        return self._bytes
+
+    # ---- loading ----
+
+    def request(
+        self,
+        root,
+        name: str,
+        size: tuple[int, int],
+        *,
+        scale: float = 1.0,
+        theme: str = "light",
+        callback: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Return the cached image for the key, or start decoding it.
+
+        On a miss this returns None and `callback(image)` is invoked on
+        the Tk thread once the image is ready (`image` is None if the
+        decode failed).
+        """
+        key: ImageKey = (name, tuple(size), scale, theme)
+
+        image = self.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        if key in self._failed:
+            return None
+
+        self.misses += 1
+        waiters = self._inflight.get(key)
+        if waiters is not None:
+            # Rebuilds while decoding re-request; notify each widget once.
+            if callback is not None and callback not in waiters:
+                waiters.append(callback)
+            return None
+
+        # Archived assets are served from the mapping without touching disk.
+        archive = get_archive()
+        path = None
+        if archive is None or name not in archive:
+            try:
+                path = get_resource_image(name)
+            except (FileNotFoundError, ValueError) as exc:
+                # Logged once: later requests hit `_failed` above.
+                log(f"image unavailable: {exc}")
+                self._failed.add(key)
+                return None
+        pixel_size = (max(1, round(size[0] * scale)), max(1, round(size[1] * scale)))
+
+        self._inflight[key] = [callback] if callback is not None else []
+        self.decodes += 1
+
+        future = self._pool.submit(_decode, name, path, pixel_size)
+        future.add_done_callback(lambda f, key=key: self._results.put((key, f)))
+
+        self._root = root
+        if not self._polling:
+            self._polling = True
+            root.after(_POLL_MS, self._drain)
+
+        return None
+
+    def _drain(self) -> None:
+        import customtkinter as ctk
+
+        while True:
+            try:
+                key, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            callbacks = self._inflight.pop(key, [])
+            image = None
+            try:
+                decoded = future.result()
+            except Exception as exc:
+                log(f"image decode failed for {key[0]}: {exc}")
+                self._failed.add(key)
+            else:
+                image = ctk.CTkImage(
+                    light_image=decoded, dark_image=decoded, size=key[1]
+                )
+                width, height = decoded.size
+                self._store(key, image, width * height * len(decoded.getbands()))
+
+            for callback in callbacks:
+                callback(image)
+
+        if self._inflight and self._root is not None:
+            self._root.after(_POLL_MS, self._drain)
+        else:
+            self._polling = False
+
+
+# Shared instance used by `RImage`.
+image_service = ImageService()
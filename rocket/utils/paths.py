@@ -0,0 +1,20 @@
+import os
+import sys
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """Per-user cache directory for this project (override: ROCKET_SNAPSHOT_DIR)."""
+    override = os.environ.get("ROCKET_SNAPSHOT_DIR")
+    if override:
+        return Path(override)
+
+    from rocket import config
+
+    if sys.platform.startswith("win"):
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / config.PROJECT_NAME
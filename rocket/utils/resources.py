@@ -1,6 +1,6 @@
 import os
 
-from vendor.Rocket.Log import log
+from rocket.log import log
 
 _BASE_IMAGE_DIR = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..", "resources", "images")
@@ -26,6 +26,6 @@ def get_resource_image(image_name: str) -> str:
     if not os.path.isfile(image_path):
         raise FileNotFoundError(f"Image not found: {image_name}")
 
-    log(f"resource loaded: {image_name}")
+    log("resource loaded: %s", image_name)
 
     return image_path
@@ -0,0 +1,28 @@
+import pytest
+
+from rocket.utils import columnar
+from rocket.utils.columnar import TableData
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    if request.param == "pure":
+        monkeypatch.setattr(columnar, "np", None)
+    elif columnar.np is None:
+        pytest.skip("numpy not installed")
+
+
+def view(table, column):
+    return [table.cell(row, column) for row in range(table.row_count)]
+
+
+def test_sort_puts_none_last(backend):
+    table = TableData({"n": [3, None, 1, 2]})
+    table.sort("n")
+    assert view(table, 0) == [1, 2, 3, None]
+
+
+def test_sort_mixed_types_falls_back_to_text(backend):
+    table = TableData({"v": ["b", 2, None, "a", 10]})
+    table.sort("v")
+    assert view(table, 0) == [10, 2, "a", "b", None]
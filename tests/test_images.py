@@ -0,0 +1,31 @@
+from rocket.utils.images import ImageService
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+
+def test_missing_file_is_marked_failed_without_raising():
+    service = ImageService()
+    root = FakeRoot()
+    calls = []
+
+    name = "does-not-exist.png"
+    assert service.request(root, name, (16, 16), callback=calls.append) is None
+    assert (name, (16, 16), 1.0, "light") in service._failed
+
+    # Not retried, nothing queued on the Tk thread.
+    assert service.request(root, name, (16, 16), callback=calls.append) is None
+    assert service.decodes == 0
+    assert root.scheduled == []
+    assert calls == []
+
+
+def test_invalid_extension_is_marked_failed():
+    service = ImageService()
+    assert service.request(FakeRoot(), "notes.txt", (16, 16)) is None
+    assert ("notes.txt", (16, 16), 1.0, "light") in service._failed